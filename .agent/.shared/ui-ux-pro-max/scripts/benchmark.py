@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Benchmark - search latency and memory across corpus sizes
+
+Generates synthetic CSV corpora (vocabulary sampled from the bundled data,
+stack-guideline schema) of increasing size, replays a fixed query set
+through the public search_stack() and search_many() entry points and
+reports index-build time, cold-start time, per-query p50/p95/p99 latency
+and peak RSS. Each corpus size runs in its own process so RSS peaks and
+caches do not leak between sizes. Results are written as JSON so runs from
+different commits can be compared.
+
+Usage:
+    python benchmark.py                                  # 100, 1k, 10k, 100k rows
+    python benchmark.py --sizes 100,5000 -o bench.json
+    python benchmark.py --compare before.json after.json
+"""
+
+import argparse
+import csv
+import json
+import math
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent
+
+# ============ CONFIGURATION ============
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+DEFAULT_REPEAT = 5
+SEED = 42
+SYNTHETIC = "synthetic"
+
+QUERIES = [
+    "saas dashboard",
+    "glassmorphism dark mode",
+    "healthcare clinic appointment booking",
+    "form validation accessibility",
+    "responsive layout grid",
+    "animation performance reduced motion",
+    "button hover focus state",
+    "image lazy loading optimization",
+    "state management hooks",
+    "navigation keyboard aria",
+    "font typography heading",
+    "xyzzy nonexistent term",
+]
+
+DESIGN_SYSTEM_QUERIES = [
+    "saas dashboard",
+    "healthcare clinic",
+    "beauty spa wellness",
+    "fintech crypto",
+    "ecommerce luxury",
+]
+
+
+# ============ HELPERS ============
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def latency_summary(seconds: list) -> dict:
+    """p50/p95/p99/mean in milliseconds."""
+    ms = [s * 1000 for s in seconds]
+    return {
+        "count": len(ms),
+        "p50_ms": round(percentile(ms, 50), 4),
+        "p95_ms": round(percentile(ms, 95), 4),
+        "p99_ms": round(percentile(ms, 99), 4),
+        "mean_ms": round(sum(ms) / len(ms), 4),
+    }
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 2)
+
+
+def _vocabulary() -> list:
+    """Words from the bundled CSVs, so synthetic rows look like real guidelines."""
+    from core import DATA_DIR
+    words = []
+    for path in sorted(DATA_DIR.rglob("*.csv")):
+        with open(path, 'r', encoding='utf-8') as f:
+            for row in csv.reader(f):
+                for cell in row:
+                    words.extend(w for w in cell.split() if w.isalpha())
+    return words or ["design", "layout", "color"]
+
+
+def generate_corpus(path: Path, rows: int, seed: int = SEED):
+    """Write a synthetic stack-guideline CSV with the given number of rows."""
+    from core import _STACK_COLS
+    rng = random.Random(seed)
+    words = _vocabulary()
+    lengths = {"Category": (1, 2), "Guideline": (3, 6), "Description": (8, 20), "Do": (4, 10), "Don't": (4, 10)}
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=["No"] + _STACK_COLS["output_cols"])
+        writer.writeheader()
+        for i in range(rows):
+            row = {"No": i + 1}
+            for col in _STACK_COLS["output_cols"]:
+                lo, hi = lengths.get(col, (2, 5))
+                row[col] = " ".join(rng.choices(words, k=rng.randint(lo, hi)))
+            writer.writerow(row)
+
+
+def register_corpus(core, csv_path: Path):
+    """Expose a synthetic corpus to the public search API as the "synthetic" stack and domain."""
+    core.STACK_CONFIG[SYNTHETIC] = {"file": str(csv_path)}
+    core.CSV_CONFIG[SYNTHETIC] = dict(core._STACK_COLS, file=str(csv_path))
+
+
+def _cold_search(csv_path: Path, index_dir: Path, query: str) -> float:
+    """Wall time of a fresh interpreter importing core and running one search_stack()."""
+    code = (
+        "import sys; from pathlib import Path; sys.path.insert(0, sys.argv[1]);"
+        "import core, benchmark; core.INDEX_DIR = Path(sys.argv[3]); core.configure_result_cache(0, disk=False);"
+        "benchmark.register_corpus(core, Path(sys.argv[2]));"
+        "assert 'error' not in core.search_stack(sys.argv[4], benchmark.SYNTHETIC, 3)"
+    )
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code, str(SCRIPTS_DIR), str(csv_path), str(index_dir), query],
+                   check=True)
+    return time.perf_counter() - start
+
+
+# ============ MEASUREMENTS ============
+def run_size(rows: int, workdir: Path, repeat: int) -> dict:
+    """Benchmark one corpus size inside the current (dedicated) process."""
+    import core
+    from core import CompiledIndex, _STACK_COLS, load_index, search_many, search_stack
+
+    csv_path = workdir / f"synthetic-{rows}.csv"
+    index_dir = workdir / f"index-{rows}"
+    core.INDEX_DIR = index_dir
+    core.configure_result_cache(0, disk=False)
+
+    start = time.perf_counter()
+    generate_corpus(csv_path, rows)
+    generate_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    CompiledIndex.build(csv_path, _STACK_COLS["search_cols"], _STACK_COLS["field_weights"])
+    build_s = time.perf_counter() - start
+
+    # Cold start before any index is persisted, then with the persisted index
+    cold_no_index = _cold_search(csv_path, index_dir, QUERIES[0])
+    cold_persisted = _cold_search(csv_path, index_dir, QUERIES[0])
+    index_bytes = sum(p.stat().st_size for p in index_dir.glob("*.json"))
+    register_corpus(core, csv_path)
+
+    # Loading the persisted index (and any lazily built scorer or fuzzy term
+    # index) is paid once per process; keep it out of the steady-state percentiles
+    start = time.perf_counter()
+    index = load_index(csv_path, _STACK_COLS["search_cols"], _STACK_COLS["field_weights"])
+    index.sparse_scorer()
+    index.term_index()
+    load_s = time.perf_counter() - start
+
+    # So is the lexicon: the first query with an unknown term ("xyzzy") loads
+    # every bundled corpus to learn which terms are real words
+    start = time.perf_counter()
+    core.warm_indexes()
+    "" in core.LEXICON
+    lexicon_s = time.perf_counter() - start
+
+    timings = []
+    for _ in range(repeat):
+        for query in QUERIES:
+            start = time.perf_counter()
+            search_stack(query, SYNTHETIC, 3)
+            timings.append(time.perf_counter() - start)
+
+    batch_timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        search_many([(query, SYNTHETIC, 3) for query in QUERIES])
+        batch_timings.append(time.perf_counter() - start)
+
+    return {
+        "rows": rows,
+        "generate_s": round(generate_s, 4),
+        "build_s": round(build_s, 4),
+        "index_bytes": index_bytes,
+        "cold_start_s": {"no_index": round(cold_no_index, 4), "persisted_index": round(cold_persisted, 4)},
+        "load_s": round(load_s, 4),
+        "lexicon_s": round(lexicon_s, 4),
+        "query": latency_summary(timings),
+        "batch_query": latency_summary(batch_timings),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_design_system(repeat: int) -> dict:
+    """Latency of generate_design_system() on the bundled data."""
+    from core import configure_result_cache
+    from design_system import generate_design_system
+
+    configure_result_cache(0, disk=False)
+    start = time.perf_counter()
+    generate_design_system(DESIGN_SYSTEM_QUERIES[0])
+    first_s = time.perf_counter() - start
+
+    timings = []
+    for _ in range(repeat):
+        for query in DESIGN_SYSTEM_QUERIES:
+            start = time.perf_counter()
+            generate_design_system(query)
+            timings.append(time.perf_counter() - start)
+    return {"first_call_ms": round(first_s * 1000, 4), "call": latency_summary(timings),
+            "peak_rss_mb": peak_rss_mb()}
+
+
+def _child(args: list) -> dict:
+    """Run this script in a fresh process and return its JSON output."""
+    out = subprocess.run([sys.executable, str(Path(__file__).resolve())] + args,
+                         check=True, capture_output=True, text=True)
+    return json.loads(out.stdout)
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=SCRIPTS_DIR,
+                             capture_output=True, text=True, timeout=5)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_benchmark(sizes: list, repeat: int) -> dict:
+    """Full benchmark: every corpus size plus design-system generation."""
+    from core import NUMPY_AVAILABLE
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": NUMPY_AVAILABLE,
+            "repeat": repeat,
+            "queries": QUERIES,
+        },
+        "corpora": [],
+    }
+    with tempfile.TemporaryDirectory(prefix="uipro-bench-") as workdir:
+        for rows in sizes:
+            print(f"  {rows} rows...", file=sys.stderr)
+            report["corpora"].append(_child(["--run-size", str(rows), "--workdir", workdir,
+                                             "--repeat", str(repeat)]))
+    print("  design system...", file=sys.stderr)
+    report["design_system"] = _child(["--run-design-system", "--repeat", str(repeat)])
+    return report
+
+
+# ============ REPORTING ============
+def format_report(report: dict) -> str:
+    """Human-readable table of a benchmark report."""
+    lines = [f"UI Pro Max benchmark ({report['meta'].get('commit') or 'unknown commit'}, "
+             f"numpy={report['meta']['numpy']})", ""]
+    lines.append(f"{'rows':>8} {'build s':>9} {'cold s':>8} {'cold+idx s':>10} {'load s':>8} "
+                 f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'RSS MB':>8}")
+    for c in report["corpora"]:
+        lines.append(f"{c['rows']:>8} {c['build_s']:>9.3f} {c['cold_start_s']['no_index']:>8.3f} "
+                     f"{c['cold_start_s']['persisted_index']:>10.3f} {c['load_s']:>8.3f} {c['query']['p50_ms']:>9.3f} "
+                     f"{c['query']['p95_ms']:>9.3f} {c['query']['p99_ms']:>9.3f} {c['peak_rss_mb'] or 0:>8.1f}")
+    ds = report.get("design_system")
+    if ds:
+        lines.append("")
+        lines.append(f"design system: first {ds['first_call_ms']:.1f} ms, p50 {ds['call']['p50_ms']:.2f} ms, "
+                     f"p95 {ds['call']['p95_ms']:.2f} ms")
+    return "\n".join(lines)
+
+
+def compare_reports(before: dict, after: dict) -> str:
+    """Per-size ratios (after / before) of the headline metrics; >1 is slower."""
+    metrics = [("build_s", lambda c: c["build_s"]),
+               ("cold_s", lambda c: c["cold_start_s"]["persisted_index"]),
+               ("p50", lambda c: c["query"]["p50_ms"]),
+               ("p95", lambda c: c["query"]["p95_ms"]),
+               ("p99", lambda c: c["query"]["p99_ms"]),
+               ("rss", lambda c: c["peak_rss_mb"] or 0)]
+    old = {c["rows"]: c for c in before["corpora"]}
+    lines = [f"{before['meta'].get('commit')} -> {after['meta'].get('commit')}",
+             f"{'rows':>8} " + " ".join(f"{name:>8}" for name, _ in metrics)]
+    for c in after["corpora"]:
+        if c["rows"] not in old:
+            continue
+        ratios = []
+        for _, get in metrics:
+            base = get(old[c["rows"]])
+            ratios.append(f"{get(c) / base:>7.2f}x" if base else f"{'n/a':>8}")
+        lines.append(f"{c['rows']:>8} " + " ".join(ratios))
+    return "\n".join(lines)
+
+
+# ============ CLI ============
+if __name__ == "__main__":
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+    parser = argparse.ArgumentParser(description="UI Pro Max search benchmark")
+    parser.add_argument("--sizes", type=str, default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated corpus sizes in rows")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Replays of the query set per size")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write the JSON report to this file")
+    parser.add_argument("--json", action="store_true", help="Print the JSON report instead of a table")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="Compare two JSON reports")
+    # Internal: per-size child processes
+    parser.add_argument("--run-size", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--run-design-system", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", type=str, help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.run_size:
+        print(json.dumps(run_size(args.run_size, Path(args.workdir), args.repeat)))
+    elif args.run_design_system:
+        print(json.dumps(run_design_system(args.repeat)))
+    elif args.compare:
+        with open(args.compare[0], 'r', encoding='utf-8') as f:
+            before = json.load(f)
+        with open(args.compare[1], 'r', encoding='utf-8') as f:
+            after = json.load(f)
+        print(compare_reports(before, after))
+    else:
+        sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+        report = run_benchmark(sizes, args.repeat)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+        print(json.dumps(report, indent=2) if args.json else format_report(report))
@@ -5,69 +5,107 @@ UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 """
 
 import csv
+import hashlib
+import heapq
+import importlib.util
+import json
+import os
 import re
+import sqlite3
+import threading
+import unicodedata
+from array import array
+from functools import lru_cache
 from pathlib import Path
-from math import log
-from collections import defaultdict
+from math import exp, log
+from collections import Counter, OrderedDict, defaultdict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+# NumPy is optional and imported lazily: the import alone costs more than a
+# whole search on the bundled CSVs, so one-shot CLI calls should not pay it.
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
 
 # ============ CONFIGURATION ============
+# field_weights: BM25F weight per search column (unlisted columns weigh 1.0)
 DATA_DIR = Path(__file__).parent.parent / "data"
+INDEX_DIR = Path(__file__).parent.parent / ".index"
+INDEX_VERSION = 4
 MAX_RESULTS = 3
+NUMPY_MIN_DOCS = 2000  # "auto" backend switches to NumPy from this corpus size
+FEDERATED_WORKERS = 8
+RESULT_CACHE_SIZE = 1024  # in-memory LRU entries
+RESULT_CACHE_FILE = INDEX_DIR / "results.sqlite"
+RESULT_CACHE_DISK_ROWS = 20000  # on-disk tier is trimmed to this many entries
+FUZZY_MIN_LENGTH = 4  # shorter unknown query terms are not expanded
+FUZZY_MAX_EXPANSIONS = 3  # vocabulary terms an unknown query term may expand to
+FUZZY_DISCOUNT = 0.7  # expansion weight is FUZZY_DISCOUNT ** (edits + 1)
 
 CSV_CONFIG = {
     "style": {
         "file": "styles.csv",
         "search_cols": ["Style Category", "Keywords", "Best For", "Type"],
+        "field_weights": {"Style Category": 3.0, "Keywords": 2.0, "Best For": 1.5, "Type": 1.0},
         "output_cols": ["Style Category", "Type", "Keywords", "Primary Colors", "Effects & Animation", "Best For", "Performance", "Accessibility", "Framework Compatibility", "Complexity"]
     },
     "prompt": {
         "file": "prompts.csv",
         "search_cols": ["Style Category", "AI Prompt Keywords (Copy-Paste Ready)", "CSS/Technical Keywords"],
+        "field_weights": {"Style Category": 3.0, "AI Prompt Keywords (Copy-Paste Ready)": 1.5, "CSS/Technical Keywords": 1.0},
         "output_cols": ["Style Category", "AI Prompt Keywords (Copy-Paste Ready)", "CSS/Technical Keywords", "Implementation Checklist"]
     },
     "color": {
         "file": "colors.csv",
         "search_cols": ["Product Type", "Keywords", "Notes"],
+        "field_weights": {"Product Type": 3.0, "Keywords": 2.0, "Notes": 0.5},
         "output_cols": ["Product Type", "Keywords", "Primary (Hex)", "Secondary (Hex)", "CTA (Hex)", "Background (Hex)", "Text (Hex)", "Border (Hex)", "Notes"]
     },
     "chart": {
         "file": "charts.csv",
         "search_cols": ["Data Type", "Keywords", "Best Chart Type", "Accessibility Notes"],
+        "field_weights": {"Data Type": 2.5, "Keywords": 2.0, "Best Chart Type": 2.0, "Accessibility Notes": 0.5},
         "output_cols": ["Data Type", "Keywords", "Best Chart Type", "Secondary Options", "Color Guidance", "Accessibility Notes", "Library Recommendation", "Interactive Level"]
     },
     "landing": {
         "file": "landing.csv",
         "search_cols": ["Pattern Name", "Keywords", "Conversion Optimization", "Section Order"],
+        "field_weights": {"Pattern Name": 3.0, "Keywords": 2.0, "Conversion Optimization": 0.75, "Section Order": 0.75},
         "output_cols": ["Pattern Name", "Keywords", "Section Order", "Primary CTA Placement", "Color Strategy", "Conversion Optimization"]
     },
     "product": {
         "file": "products.csv",
         "search_cols": ["Product Type", "Keywords", "Primary Style Recommendation", "Key Considerations"],
+        "field_weights": {"Product Type": 3.0, "Keywords": 2.0, "Primary Style Recommendation": 1.0, "Key Considerations": 0.5},
         "output_cols": ["Product Type", "Keywords", "Primary Style Recommendation", "Secondary Styles", "Landing Page Pattern", "Dashboard Style (if applicable)", "Color Palette Focus"]
     },
     "ux": {
         "file": "ux-guidelines.csv",
         "search_cols": ["Category", "Issue", "Description", "Platform"],
+        "field_weights": {"Category": 1.5, "Issue": 2.5, "Description": 1.0, "Platform": 0.5},
         "output_cols": ["Category", "Issue", "Platform", "Description", "Do", "Don't", "Code Example Good", "Code Example Bad", "Severity"]
     },
     "typography": {
         "file": "typography.csv",
         "search_cols": ["Font Pairing Name", "Category", "Mood/Style Keywords", "Best For", "Heading Font", "Body Font"],
+        "field_weights": {"Font Pairing Name": 2.5, "Category": 1.0, "Mood/Style Keywords": 2.0, "Best For": 1.5, "Heading Font": 1.0, "Body Font": 1.0},
         "output_cols": ["Font Pairing Name", "Category", "Heading Font", "Body Font", "Mood/Style Keywords", "Best For", "Google Fonts URL", "CSS Import", "Tailwind Config", "Notes"]
     },
     "icons": {
         "file": "icons.csv",
         "search_cols": ["Category", "Icon Name", "Keywords", "Best For"],
+        "field_weights": {"Category": 1.5, "Icon Name": 3.0, "Keywords": 2.0, "Best For": 1.0},
         "output_cols": ["Category", "Icon Name", "Keywords", "Library", "Import Code", "Usage", "Best For", "Style"]
     },
     "react": {
         "file": "react-performance.csv",
         "search_cols": ["Category", "Issue", "Keywords", "Description"],
+        "field_weights": {"Category": 1.5, "Issue": 2.5, "Keywords": 2.0, "Description": 1.0},
         "output_cols": ["Category", "Issue", "Platform", "Description", "Do", "Don't", "Code Example Good", "Code Example Bad", "Severity"]
     },
     "web": {
         "file": "web-interface.csv",
         "search_cols": ["Category", "Issue", "Keywords", "Description"],
+        "field_weights": {"Category": 1.5, "Issue": 2.5, "Keywords": 2.0, "Description": 1.0},
         "output_cols": ["Category", "Issue", "Platform", "Description", "Do", "Don't", "Code Example Good", "Code Example Bad", "Severity"]
     }
 }
@@ -90,149 +128,1156 @@ STACK_CONFIG = {
 # Common columns for all stacks
 _STACK_COLS = {
     "search_cols": ["Category", "Guideline", "Description", "Do", "Don't"],
+    "field_weights": {"Category": 1.5, "Guideline": 3.0, "Description": 1.0, "Do": 0.75, "Don't": 0.75},
     "output_cols": ["Category", "Guideline", "Description", "Do", "Don't", "Code Good", "Code Bad", "Severity", "Docs URL"]
 }
 
 AVAILABLE_STACKS = list(STACK_CONFIG.keys())
 
+# Vocabulary that names a domain without necessarily appearing in its CSV
+# (e.g. "palette" for colors). The router counts each hint as if it occurred
+# in ROUTER_HINT_RATE of that domain's rows.
+DOMAIN_HINTS = {
+    "color": ["color", "palette", "hex", "rgb"],
+    "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
+    "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
+    "product": ["saas", "ecommerce", "e-commerce", "fintech", "healthcare", "gaming", "portfolio", "crypto", "dashboard"],
+    "prompt": ["prompt", "css", "implementation", "variable", "checklist", "tailwind"],
+    "style": ["style", "design", "ui", "minimalism", "glassmorphism", "neumorphism", "brutalism", "dark mode", "flat", "aurora"],
+    "ux": ["ux", "usability", "accessibility", "wcag", "touch", "scroll", "animation", "keyboard", "navigation", "mobile"],
+    "typography": ["font", "typography", "heading", "serif", "sans"],
+    "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"],
+    "react": ["react", "next.js", "nextjs", "suspense", "memo", "usecallback", "useeffect", "rerender", "bundle", "waterfall", "barrel", "dynamic import", "rsc", "server component"],
+    "web": ["aria", "focus", "outline", "semantic", "virtualize", "autocomplete", "form", "input type", "preconnect"]
+}
+DEFAULT_DOMAIN = "style"
+ROUTER_HINT_RATE = 0.5
+ROUTER_HINT_BOOST = 4.0  # a query term that is one of a domain's hints multiplies its odds by this
+HEX_COLOR = re.compile(r'(?<![\w#])#(?:[0-9a-fA-F]{3,4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})\b')
+ROUTER_SMOOTHING = 0.5  # additive smoothing of per-domain term rates
+ROUTER_MIN_CONFIDENCE = 0.1  # search_routed() skips candidates below this
+
+
+# ============ TEXT ANALYSIS ============
+STOPWORDS = frozenset("""
+    the and for with that this from are was were you your yours its into onto over than then them they
+    their there these those what when where which who whom why how all any can not but has have had
+    use using via per also just more most very such only each other both our out off too own same
+    para com que uma uns umas dos das nos nas por pelo pela pelos pelas mais como sem sua suas seu seus
+    ser sao nao ele ela eles elas isso isto este esta estes estas esse essa esses essas aos ate tem
+    muito muita quando onde qual quais entre sobre ou
+""".split())
+
+# Portuguese plural endings that only exist with diacritics; handled before folding
+_PT_PLURALS = (("ões", "ão"), ("ães", "ão"), ("ais", "al"), ("éis", "el"), ("óis", "ol"))
+
+
+class Analyzer:
+    """Text analysis pipeline shared by indexing and querying.
+
+    Stages: lowercase, tokenize (precompiled pattern), Portuguese accented
+    plurals, accent folding, short-word and stopword filtering, and a light
+    English/Portuguese plural stemmer, so "dashboards" finds "dashboard" and
+    "botões"/"botão" meet. Each distinct word is analyzed once and memoized,
+    and recent query strings are cached whole.
+    """
+
+    _WORD_RE = re.compile(r"\w+")
+
+    def __init__(self, stopwords=STOPWORDS, stem=True, fold_accents=True, min_length=3):
+        self.stopwords = frozenset(stopwords)
+        self.stem = stem
+        self.fold_accents = fold_accents
+        self.min_length = min_length
+        self.signature = hashlib.sha1(
+            f"{sorted(self.stopwords)}|{stem}|{fold_accents}|{min_length}".encode("utf-8")).hexdigest()[:12]
+        self._terms = {}
+        self.analyze_query = lru_cache(maxsize=4096)(self._analyze_tuple)
+
+    def __call__(self, text):
+        """Analyzed terms of text, in order (duplicates kept for term frequency)"""
+        terms = self._terms
+        result = []
+        for word in self._WORD_RE.findall(str(text).lower()):
+            term = terms.get(word, "")
+            if term == "":
+                if len(terms) >= 200000:  # bound the memo for long-running daemons
+                    terms.clear()
+                term = terms[word] = self._term(word)
+            if term is not None:
+                result.append(term)
+        return result
+
+    def _analyze_tuple(self, text):
+        return tuple(self(text))
+
+    def _term(self, word):
+        """Normalize one lowercase word; None drops it"""
+        if len(word) < self.min_length:
+            return None
+        if self.stem:
+            for suffix, replacement in _PT_PLURALS:
+                if word.endswith(suffix) and len(word) > len(suffix) + 1:
+                    word = word[:-len(suffix)] + replacement
+                    break
+        if self.fold_accents and not word.isascii():
+            word = "".join(ch for ch in unicodedata.normalize("NFKD", word) if not unicodedata.combining(ch))
+        if word in self.stopwords:
+            return None
+        if self.stem:
+            word = self._stem_plural(word)
+        return word
+
+    @staticmethod
+    def _stem_plural(word):
+        """Harman-style S-stemmer (also covers regular Portuguese plurals)"""
+        if len(word) <= 3 or not word.endswith("s"):
+            return word
+        if word.endswith("ies") and not word.endswith(("eies", "aies")):
+            return word[:-3] + "y"
+        if word.endswith("es") and not word.endswith(("aes", "ees", "oes")):
+            return word[:-1]
+        if not word.endswith(("us", "ss", "is")):
+            return word[:-1]
+        return word
+
+
+DEFAULT_ANALYZER = Analyzer()
+
+
+# ============ FUZZY MATCHING ============
+class TermIndex:
+    """Trigram index over a vocabulary for typo-tolerant prefix lookups.
+
+    Every term is indexed by the trigrams of "$" + term. A query term only
+    ever looks at terms sharing enough of its trigrams (each edit can destroy
+    at most three), so lookups cost the size of a few trigram posting lists,
+    not a scan of the vocabulary. Survivors are checked with a bounded
+    prefix edit distance, which lets "tailw" reach "tailwind" and
+    "glasmorph" reach "glassmorphism".
+    """
+
+    def __init__(self, terms):
+        self.terms = sorted(terms)
+        grams = defaultdict(lambda: array('l'))
+        for term_id, term in enumerate(self.terms):
+            for gram in set(self._grams(term)):
+                grams[gram].append(term_id)
+        self.grams = dict(grams)
+
+    @staticmethod
+    def _grams(term):
+        padded = "$" + term
+        return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+    @staticmethod
+    def max_edits(term):
+        """Edit budget for a query term: none below FUZZY_MIN_LENGTH, then 1, then 2"""
+        if len(term) < FUZZY_MIN_LENGTH:
+            return -1
+        return 1 if len(term) <= 6 else 2
+
+    @staticmethod
+    def prefix_distance(query, term, max_edits):
+        """Edit distance from query to the closest prefix of term, or None beyond max_edits"""
+        term = term[:len(query) + max_edits]
+        prev = list(range(len(term) + 1))
+        for i, qc in enumerate(query, 1):
+            cur = [i]
+            for j, tc in enumerate(term, 1):
+                cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (qc != tc)))
+            if min(cur) > max_edits:
+                return None
+            prev = cur
+        distance = min(prev)
+        return distance if distance <= max_edits else None
+
+    def lookup(self, query, limit=FUZZY_MAX_EXPANSIONS):
+        """Up to limit (term, edits) pairs, closest and shortest first"""
+        max_edits = self.max_edits(query)
+        if max_edits < 0:
+            return []
+        grams = self._grams(query)
+        shared = Counter()
+        for gram in set(grams):
+            shared.update(self.grams.get(gram, ()))
+        needed = max(1, len(grams) - 3 * max_edits)
+
+        matches = []
+        for term_id, count in shared.items():
+            if count < needed:
+                continue
+            term = self.terms[term_id]
+            distance = self.prefix_distance(query, term, max_edits)
+            if distance is not None:
+                matches.append((distance, len(term), term))
+        return [(term, distance) for distance, _, term in heapq.nsmallest(limit, matches)]
+
+
+class Lexicon:
+    """Every term known to any corpus, built on first use.
+
+    Fuzzy matching only expands terms missing from the lexicon: "lucide" is
+    a real word of the icons corpus, not a typo, even in a search of the
+    colors corpus. Rebuilt whenever one of the source indexes is reloaded.
+    """
+
+    def __init__(self, sources):
+        self._sources = sources
+        self._key = None
+        self._terms = frozenset()
+        self._lock = threading.Lock()
+
+    def __contains__(self, term):
+        indexes = self._sources()
+        key = tuple(map(id, indexes))
+        with self._lock:
+            if key != self._key:
+                self._terms = frozenset(term for index in indexes for term in index.idf)
+                self._key = key
+            return term in self._terms
+
 
 # ============ BM25 IMPLEMENTATION ============
 class BM25:
-    """BM25 ranking algorithm for text search"""
+    """BM25F ranking algorithm for text search
+
+    Documents are either strings or sequences of field texts. Each field keeps
+    its own length normalization and weight, so a hit in a heavily weighted
+    field (e.g. "Style Category") outranks the same hit in "Notes"; a plain
+    string is a single field of weight 1, which is classic BM25.
+
+    Term frequencies are computed once at fit() time and kept as a postings
+    list per token, so scoring only visits documents that contain a query term.
+    Per-document statistics are stored column-wise (one typed array per field),
+    and each posting list is a single flat array of [idx, tf_0 .. tf_n-1]
+    records, so large corpora cost a few bytes per entry instead of a tuple.
 
-    def __init__(self, k1=1.5, b=0.75):
+    With fuzzy=True, a query that finds too few documents on its exact terms
+    is retried with its unknown terms expanded to close vocabulary terms (see
+    TermIndex) at a discounted weight. Terms in `lexicon` (when set, e.g. the
+    vocabulary of every configured corpus) are real words and never expanded.
+    """
+
+    def __init__(self, k1=1.5, b=0.75, backend="auto", analyzer=None, fuzzy=True):
         self.k1 = k1
         self.b = b
-        self.corpus = []
-        self.doc_lengths = []
+        self.backend = backend
+        self.fuzzy = fuzzy
+        self.lexicon = None
+        self._term_index = None
+        self.analyzer = analyzer or DEFAULT_ANALYZER
+        self.field_weights = [1.0]
+        self.field_lengths = []
+        self.avg_field_lengths = []
+        self.doc_lengths = array('l')
+        self.doc_norms = []
         self.avgdl = 0
         self.idf = {}
-        self.doc_freqs = defaultdict(int)
+        self.postings = {}
         self.N = 0
+        self._weights = {}
+        self._sparse = None
 
     def tokenize(self, text):
-        """Lowercase, split, remove punctuation, filter short words"""
-        text = re.sub(r'[^\w\s]', ' ', str(text).lower())
-        return [w for w in text.split() if len(w) > 2]
-
-    def fit(self, documents):
-        """Build BM25 index from documents"""
-        self.corpus = [self.tokenize(doc) for doc in documents]
-        self.N = len(self.corpus)
+        """Analyzed terms of a document or query (see Analyzer)"""
+        return list(self.analyzer.analyze_query(text))
+
+    def fit(self, documents, field_weights=None):
+        """Build BM25F index from documents (strings or per-field sequences)"""
+        documents = [(doc,) if isinstance(doc, str) else tuple(doc) for doc in documents]
+        n_fields = len(documents[0]) if documents else 1
+        self.field_weights = [float(w) for w in field_weights] if field_weights else [1.0] * n_fields
+
+        postings = defaultdict(dict)
+        self.field_lengths = [array('l') for _ in range(n_fields)]
+        for idx, fields in enumerate(documents):
+            for f, text in enumerate(fields):
+                tokens = self.analyzer(text)
+                self.field_lengths[f].append(len(tokens))
+                for word, tf in Counter(tokens).items():
+                    postings[word].setdefault(idx, [0] * n_fields)[f] = tf
+
+        self.postings = {word: array('l', [v for idx, tfs in docs.items() for v in (idx, *tfs)])
+                         for word, docs in postings.items()}
+        self.idf = {}
+        self._weights = {}
+        self._sparse = None
+        self._term_index = None
+        self._compute_doc_lengths()
+        self.N = len(self.doc_lengths)
         if self.N == 0:
             return
-        self.doc_lengths = [len(doc) for doc in self.corpus]
         self.avgdl = sum(self.doc_lengths) / self.N
+        self.avg_field_lengths = [sum(lengths) / self.N for lengths in self.field_lengths]
 
-        for doc in self.corpus:
-            seen = set()
-            for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
-
-        for word, freq in self.doc_freqs.items():
+        step = n_fields + 1
+        for word, flat in self.postings.items():
+            freq = len(flat) // step
             self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
+        self._compute_norms()
+        if self.fuzzy:
+            self.term_index()
 
-    def score(self, query):
-        """Score all documents against query"""
-        query_tokens = self.tokenize(query)
-        scores = []
+    def _compute_doc_lengths(self):
+        """Total length of every document across fields"""
+        self.doc_lengths = array('l', map(sum, zip(*self.field_lengths))) if self.field_lengths else array('l')
 
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
-                term_freqs[word] += 1
+    def _compute_norms(self):
+        """Precompute each field's length normalization for every document"""
+        self.doc_norms = [
+            array('d', (1 - self.b + self.b * length / avg if avg else 1.0 for length in lengths))
+            for lengths, avg in zip(self.field_lengths, self.avg_field_lengths)
+        ]
 
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
+    def _flat_postings(self, token):
+        """Posting list of token as a flat array of [idx, tf_0 .. tf_n-1] records"""
+        return self.postings.get(token, ())
 
-            scores.append((idx, score))
+    def doc_freqs(self):
+        """Number of documents containing each vocabulary term"""
+        step = len(self.field_weights) + 1
+        return {token: len(flat) // step for token, flat in list(self.postings.items())}
 
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+    def get_postings(self, token):
+        """(doc_idx, per-field term freqs) pairs for every document containing token"""
+        flat = self._flat_postings(token)
+        step = len(self.field_weights) + 1
+        return [(flat[i], tuple(flat[i + 1:i + step])) for i in range(0, len(flat), step)]
 
+    def _compute_weights(self, token):
+        """Doc indices and BM25F weights for token, as two parallel arrays"""
+        idxs, weights = array('l'), array('d')
+        idf = self.idf.get(token)
+        if idf is None:
+            return idxs, weights
+        k1 = self.k1
+        k1_plus_1 = k1 + 1
+        fields = list(zip(self.field_weights, self.doc_norms))
+        flat = self._flat_postings(token)
+        step = len(fields) + 1
+        for i in range(0, len(flat), step):
+            idx = flat[i]
+            tf = sum(w * tf / norms[idx] for (w, norms), tf in zip(fields, flat[i + 1:i + step]) if tf)
+            idxs.append(idx)
+            weights.append(idf * (tf * k1_plus_1) / (tf + k1))
+        return idxs, weights
 
-# ============ SEARCH FUNCTIONS ============
-def _load_csv(filepath):
-    """Load CSV and return list of dicts"""
+    def term_weights(self, token):
+        """(doc_idx, BM25 weight) pairs for token; weights are computed once and memoized"""
+        weights = self._weights.get(token)
+        if weights is None:
+            if token not in self.idf:
+                return ()
+            weights = self._weights[token] = self._compute_weights(token)
+        return zip(*weights)
+
+    def term_index(self):
+        """Trigram index over the vocabulary (built on first use for loaded indexes)"""
+        if self._term_index is None:
+            self._term_index = TermIndex(self.idf)
+        return self._term_index
+
+    def expand_tokens(self, tokens):
+        """(term, weight factor) pairs to score for tokenized query terms.
+
+        Known terms keep factor 1.0; with fuzzy matching, unknown terms are
+        replaced by their closest vocabulary terms at FUZZY_DISCOUNT ** (edits + 1).
+        """
+        expanded = []
+        for token in tokens:
+            if token in self.idf or not self.fuzzy:
+                expanded.append((token, 1.0))
+                continue
+            expanded.extend((term, FUZZY_DISCOUNT ** (edits + 1))
+                            for term, edits in self.term_index().lookup(token))
+        return expanded
+
+    def max_score(self, tokens):
+        """Upper bound of score_tokens(tokens) for this corpus.
+
+        Each term contributes idf * (k1 + 1), its limit as tf grows; terms
+        missing from the vocabulary count at the highest idf the corpus could
+        assign. Dividing by this makes scores comparable across corpora.
+        """
+        unseen_idf = log((self.N + 0.5) / 0.5 + 1)
+        return sum(self.idf.get(token, unseen_idf) for token in tokens) * (self.k1 + 1)
+
+    def sparse_scorer(self):
+        """The NumPy CSR scorer when the backend selects it, else None.
+
+        "auto" uses it once NumPy is importable and the corpus has at least
+        NUMPY_MIN_DOCS documents; "numpy" forces it; "python" never uses it.
+        """
+        if self._sparse is None:
+            use = self.backend == "numpy" or (
+                self.backend == "auto" and NUMPY_AVAILABLE and self.N >= NUMPY_MIN_DOCS)
+            self._sparse = SparseScorer(self) if use and self.N else False
+        return self._sparse or None
+
+    def score_tokens(self, tokens, top_k=None):
+        """Score already-tokenized query terms; see score()"""
+        return self.score_many_tokens([tokens], [top_k])[0]
+
+    def score_many_tokens(self, token_lists, top_ks):
+        """Score several tokenized queries.
+
+        Queries are scored on exact terms first. When a query comes back with
+        fewer than top_k hits (or none, without top_k) and has unknown terms
+        (not in this vocabulary nor the lexicon), their fuzzy expansions fill
+        the remaining slots after every exact hit, so exact matches always
+        rank as without fuzzy matching.
+        """
+        exact = [[(token, 1.0) for token in tokens] for tokens in token_lists]
+        rankings = self._score_terms(exact, top_ks)
+        if not self.fuzzy:
+            return rankings
+
+        unknown = {}
+        for pos, (tokens, top_k, ranked) in enumerate(zip(token_lists, top_ks, rankings)):
+            short = len(ranked) < top_k if top_k is not None else not ranked
+            if short:
+                typos = [token for token in tokens if token not in self.idf]
+                if typos and self.lexicon is not None:
+                    typos = [token for token in typos if token not in self.lexicon]
+                if typos:
+                    unknown[pos] = typos
+        if not unknown:
+            return rankings
+
+        retry = list(unknown)
+        expansions = [self.expand_tokens(unknown[pos]) for pos in retry]
+        limits = [None if top_ks[pos] is None else top_ks[pos] + len(rankings[pos]) for pos in retry]
+        for pos, fuzzy in zip(retry, self._score_terms(expansions, limits)):
+            seen = {idx for idx, _ in rankings[pos]}
+            extra = [hit for hit in fuzzy if hit[0] not in seen]
+            if top_ks[pos] is not None:
+                extra = extra[:top_ks[pos] - len(rankings[pos])]
+            rankings[pos] = rankings[pos] + extra
+        return rankings
+
+    def _score_terms(self, term_lists, top_ks):
+        """Rank (term, factor) lists, on the NumPy backend when it is selected"""
+        sparse = self.sparse_scorer()
+        if sparse is not None:
+            return sparse.score_many(term_lists, top_ks)
+        return [self._score_terms_python(terms, top_k) for terms, top_k in zip(term_lists, top_ks)]
+
+    def _score_terms_python(self, terms, top_k):
+        scores = defaultdict(float)
+        for token, factor in terms:
+            for idx, weight in self.term_weights(token):
+                scores[idx] += weight * factor
+
+        rank_key = lambda x: (-x[1], x[0])
+        if top_k is None:
+            return sorted(scores.items(), key=rank_key)
+        return heapq.nsmallest(top_k, scores.items(), key=rank_key)
+
+    def score(self, query, top_k=None):
+        """Score documents matching the query, best first.
+
+        Only documents containing at least one query token are visited, so
+        zero-score documents never appear. With top_k, a bounded heap keeps
+        the k best instead of sorting every score. Ties keep document order.
+        """
+        return self.score_tokens(self.tokenize(query), top_k)
+
+    def score_many(self, queries, top_ks):
+        """Score several queries against this index in one pass.
+
+        Each query is tokenized once, and term weights come from the shared
+        memo, so every distinct term is weighted once for the whole batch.
+        """
+        return self.score_many_tokens([self.tokenize(query) for query in queries], top_ks)
+
+
+class SparseScorer:
+    """NumPy backend: the corpus as a CSR term-document matrix of BM25 weights.
+
+    Row i holds the precomputed weight of vocabulary term i in every document
+    that contains it, so scoring a batch of queries is one sparse
+    query x term by term x doc product (done with np.bincount). Weights come
+    from the same expression as BM25.term_weights and are summed in query
+    token order, so rankings are identical to the pure-Python path.
+    """
+
+    def __init__(self, bm25):
+        import numpy as np
+        self.np = np
+        self.N = bm25.N
+        self.vocab = {}
+        indptr, indices, data = [0], [], []
+        for token in bm25.idf:
+            idxs, weights = bm25._compute_weights(token)
+            self.vocab[token] = len(self.vocab)
+            indices.extend(idxs)
+            data.extend(weights)
+            indptr.append(len(indices))
+        self.indptr = np.array(indptr, dtype=np.int64)
+        self.indices = np.array(indices, dtype=np.int64)
+        self.data = np.array(data, dtype=np.float64)
+
+    def score_many(self, term_lists, top_ks):
+        """Rank several queries given as (term, factor) lists (see BM25.expand_tokens)."""
+        np = self.np
+        cols, weights = [], []
+        for q, terms in enumerate(term_lists):
+            for token, factor in terms:
+                row = self.vocab.get(token)
+                if row is None:
+                    continue
+                start, end = self.indptr[row], self.indptr[row + 1]
+                cols.append(self.indices[start:end] + q * self.N)
+                weights.append(self.data[start:end] * factor)
+
+        if not cols:
+            return [[] for _ in term_lists]
+        scores = np.bincount(np.concatenate(cols), weights=np.concatenate(weights),
+                             minlength=len(term_lists) * self.N).reshape(len(term_lists), self.N)
+        return [self._rank(row, top_k) for row, top_k in zip(scores, top_ks)]
+
+    def _rank(self, scores, top_k):
+        """Best-first (idx, score) pairs; ties keep document order."""
+        np = self.np
+        hits = np.flatnonzero(scores)  # weights are positive, so hit == score > 0
+        if top_k is not None:
+            if top_k <= 0:
+                return []
+            if top_k < len(hits):
+                # Keep everything tied with the k-th score so tie order stays exact
+                kth = np.partition(scores[hits], len(hits) - top_k)[len(hits) - top_k]
+                hits = hits[scores[hits] >= kth]
+        order = np.lexsort((hits, -scores[hits]))
+        if top_k is not None:
+            order = order[:top_k]
+        return [(int(hits[i]), float(scores[hits[i]])) for i in order]
+
+
+# ============ COMPILED INDEX ============
+class CompiledIndex(BM25):
+    """BM25 index persisted to disk: postings, doc lengths, IDF and CSV row offsets.
+
+    Postings are stored as compact strings and decoded on first use, so a query
+    only pays for the terms it actually contains. Rows are read back from the
+    CSV by offset, so only the returned top results are ever parsed, and only
+    their requested columns are turned into dicts.
+    """
+
+    def __init__(self, filepath, k1=1.5, b=0.75, backend="auto"):
+        super().__init__(k1, b, backend)
+        self.filepath = filepath
+        self.mtime_ns = None
+        self.size = None
+        self.sha1 = None
+        self.header = []
+        self.row_offsets = array('q')
+        self._raw_postings = {}
+
+    @classmethod
+    def build(cls, filepath, search_cols, field_weights=None, sha1=None):
+        """Read the CSV once, fit BM25F over search_cols and compile the result."""
+        header, columns, offsets = _scan_csv(filepath, search_cols)
+        documents = zip(*columns) if columns else ()
+
+        index = cls(filepath)
+        index.fit(documents, _column_weights(search_cols, field_weights))
+        stat = filepath.stat()
+        index.mtime_ns = stat.st_mtime_ns
+        index.size = stat.st_size
+        index.sha1 = sha1 or _file_sha1(filepath)
+        index.header = header
+        index.row_offsets = offsets
+        return index
+
+    @classmethod
+    def from_dict(cls, data, filepath):
+        """Restore an index written by to_dict(); postings stay encoded."""
+        index = cls(filepath, data["k1"], data["b"])
+        index.mtime_ns = data["mtime_ns"]
+        index.size = data["size"]
+        index.sha1 = data["sha1"]
+        index.header = data["header"]
+        index.row_offsets = array('q', data["row_offsets"])
+        index.N = data["N"]
+        index.avgdl = data["avgdl"]
+        index.field_weights = data["field_weights"]
+        index.field_lengths = [array('l', lengths) for lengths in data["field_lengths"]]
+        index.avg_field_lengths = data["avg_field_lengths"]
+        index._compute_doc_lengths()
+        index.idf = data["idf"]
+        index._raw_postings = dict(data["postings"])
+        if index.N:
+            index._compute_norms()
+        return index
+
+    def to_dict(self, search_cols):
+        """Serializable form; postings that were never decoded are written back untouched."""
+        postings = dict(self._raw_postings)
+        for word in list(self.postings):
+            postings[word] = " ".join(f"{idx}:{','.join(map(str, tfs))}" for idx, tfs in self.get_postings(word))
+        return {
+            "version": INDEX_VERSION,
+            "analyzer": self.analyzer.signature,
+            "search_cols": list(search_cols),
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+            "sha1": self.sha1,
+            "header": self.header,
+            "row_offsets": self.row_offsets.tolist(),
+            "k1": self.k1,
+            "b": self.b,
+            "N": self.N,
+            "avgdl": self.avgdl,
+            "field_weights": self.field_weights,
+            "field_lengths": [lengths.tolist() for lengths in self.field_lengths],
+            "avg_field_lengths": self.avg_field_lengths,
+            "idf": self.idf,
+            "postings": postings,
+        }
+
+    def doc_freqs(self):
+        """Number of documents containing each term, without decoding any postings."""
+        freqs = super().doc_freqs()
+        freqs.update((token, raw.count(":")) for token, raw in self._raw_postings.items())
+        return freqs
+
+    def _flat_postings(self, token):
+        """Decode (and memoize) the posting list for one token.
+
+        The encoded form is kept, so threads racing on the same token decode
+        the same list and whichever stores last stores an identical copy.
+        """
+        flat = self.postings.get(token)
+        if flat is None:
+            raw = self._raw_postings.get(token)
+            if raw is None:
+                return ()
+            flat = array('l')
+            for item in raw.split():
+                idx, tfs = item.split(":")
+                flat.append(int(idx))
+                flat.extend(int(tf) for tf in tfs.split(","))
+            self.postings[token] = flat
+        return flat
+
+    def column_positions(self, columns=None):
+        """(column, position) pairs for `columns` (default: the whole header) present in the CSV."""
+        positions = {col: i for i, col in enumerate(self.header)}
+        return [(col, positions[col]) for col in (columns or self.header) if col in positions]
+
+    def _read_fields(self, f, idx):
+        f.seek(self.row_offsets[idx])
+        return next(csv.reader(iter(f.readline, '')))
+
+    def read_fields(self, idx):
+        """Raw cell values of one row, parsed straight from the CSV."""
+        with open(self.filepath, 'r', encoding='utf-8') as f:
+            return self._read_fields(f, idx)
+
+    def rows(self, indices, columns=None):
+        """Read only the requested rows back from the CSV, in the given order.
+
+        Each row becomes a dict of just `columns` (default: the whole header);
+        columns missing from the CSV are left out.
+        """
+        wanted = self.column_positions(columns)
+        result = []
+        with open(self.filepath, 'r', encoding='utf-8') as f:
+            for idx in indices:
+                fields = self._read_fields(f, idx)
+                result.append({col: fields[i] if i < len(fields) else "" for col, i in wanted})
+        return result
+
+
+class RowView(Mapping):
+    """Read-only view of one ranked row; nothing is read until a field is accessed.
+
+    The CSV line is parsed on first access and each value is built (and
+    truncated to max_chars) only when asked for, so a consumer that reads
+    two fields never pays for the rest. `extra` fields (e.g. "Stack") come
+    first and are never truncated.
+    """
+
+    __slots__ = ("_index", "_idx", "_positions", "_extra", "_max_chars", "_fields")
+
+    def __init__(self, index, idx, positions, extra=None, max_chars=None):
+        self._index = index
+        self._idx = idx
+        self._positions = dict(positions)
+        self._extra = extra or {}
+        self._max_chars = max_chars
+        self._fields = None
+
+    def __getitem__(self, key):
+        if key in self._extra:
+            return self._extra[key]
+        pos = self._positions[key]
+        if self._fields is None:
+            self._fields = self._index.read_fields(self._idx)
+        value = self._fields[pos] if pos < len(self._fields) else ""
+        if self._max_chars is not None and len(value) > self._max_chars:
+            value = value[:self._max_chars] + "..."
+        return value
+
+    def __iter__(self):
+        yield from self._extra
+        yield from self._positions
+
+    def __len__(self):
+        return len(self._extra) + len(self._positions)
+
+    def __repr__(self):
+        return f"RowView({self._index.filepath.name}, row={self._idx})"
+
+
+def _file_sha1(filepath):
+    """Content hash used to validate an index when only the mtime changed."""
+    digest = hashlib.sha1()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _scan_csv(filepath, columns):
+    """Parse a CSV column-wise: its header, a list per requested column and row offsets.
+
+    Only `columns` are kept (missing ones read as ""), so no per-row dicts are
+    built. Blank lines are skipped, as csv.DictReader does.
+    """
     with open(filepath, 'r', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
+        reader = csv.reader(iter(f.readline, ''))
+        header = next(reader, [])
+        positions = [header.index(col) if col in header else None for col in columns]
+        values = [[] for _ in columns]
+        offsets = array('q')
+        while True:
+            offset = f.tell()
+            fields = next(reader, None)
+            if fields is None:
+                break
+            if not fields:
+                continue
+            for column, pos in zip(values, positions):
+                column.append(fields[pos] if pos is not None and pos < len(fields) else "")
+            offsets.append(offset)
+    return header, values, offsets
 
 
-def _search_csv(filepath, search_cols, output_cols, query, max_results):
-    """Core search function using BM25"""
-    if not filepath.exists():
-        return []
+def _column_weights(search_cols, field_weights):
+    """Per-column weights aligned with search_cols (unlisted columns weigh 1)."""
+    field_weights = field_weights or {}
+    return [float(field_weights.get(col, 1.0)) for col in search_cols]
+
+
+def _index_path(filepath, search_cols, column_weights):
+    """On-disk location of the compiled index for a CSV/search_cols/weights combination."""
+    cols_key = hashlib.sha1(("\x1f".join(search_cols) + repr(column_weights)).encode("utf-8")).hexdigest()[:8]
+    rel = filepath.relative_to(DATA_DIR) if filepath.is_relative_to(DATA_DIR) else Path(filepath.name)
+    return INDEX_DIR / f"{str(rel.with_suffix('')).replace(os.sep, '__')}.{cols_key}.json"
+
+
+def _write_index(index, search_cols):
+    """Persist an index atomically; a read-only checkout just skips the cache."""
+    path = _index_path(index.filepath, search_cols, index.field_weights)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(index.to_dict(search_cols), f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _read_index(filepath, search_cols, field_weights=None):
+    """Load a persisted index if it still matches the CSV and config on disk."""
+    path = _index_path(filepath, search_cols, _column_weights(search_cols, field_weights))
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (data.get("version") != INDEX_VERSION or data.get("analyzer") != DEFAULT_ANALYZER.signature
+            or data.get("search_cols") != list(search_cols)
+            or data.get("field_weights") != _column_weights(search_cols, field_weights)):
+        return None
+
+    stat = filepath.stat()
+    if data["mtime_ns"] == stat.st_mtime_ns and data["size"] == stat.st_size:
+        return CompiledIndex.from_dict(data, filepath)
+
+    # Touched but possibly unchanged (checkout, copy): fall back to the content hash
+    if data["sha1"] != _file_sha1(filepath):
+        return None
+    data["mtime_ns"], data["size"] = stat.st_mtime_ns, stat.st_size
+    index = CompiledIndex.from_dict(data, filepath)
+    _write_index(index, search_cols)
+    return index
+
+
+_INDEX_CACHE = {}
+
+
+def load_index(filepath, search_cols, field_weights=None):
+    """Return the compiled index for a CSV, building and persisting it on first use.
+
+    Indexes are memoized per process and revalidated with a stat() call, so
+    repeated searches neither re-read the CSV nor refit BM25.
+    """
+    key = (str(filepath), tuple(search_cols), tuple(_column_weights(search_cols, field_weights)))
+    index = _INDEX_CACHE.get(key)
+    if index is not None:
+        stat = filepath.stat()
+        if index.mtime_ns == stat.st_mtime_ns and index.size == stat.st_size:
+            return index
+
+    index = _read_index(filepath, search_cols, field_weights)
+    if index is None:
+        index = CompiledIndex.build(filepath, search_cols, field_weights)
+        _write_index(index, search_cols)
+    index.lexicon = LEXICON
+    _INDEX_CACHE[key] = index
+    return index
+
+
+def configured_indexes():
+    """Every CSV_CONFIG and STACK_CONFIG index whose CSV exists, loading them as needed."""
+    indexes = []
+    for config in CSV_CONFIG.values():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            indexes.append(load_index(filepath, config["search_cols"], config.get("field_weights")))
+    for config in STACK_CONFIG.values():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            indexes.append(load_index(filepath, _STACK_COLS["search_cols"], _STACK_COLS["field_weights"]))
+    return indexes
+
 
-    data = _load_csv(filepath)
+def warm_indexes():
+    """Load every CSV_CONFIG and STACK_CONFIG index into memory; returns the count loaded."""
+    return len(configured_indexes())
 
-    # Build documents from search columns
-    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
 
-    # BM25 search
-    bm25 = BM25()
-    bm25.fit(documents)
-    ranked = bm25.score(query)
+LEXICON = Lexicon(configured_indexes)
+
+
+# ============ RESULT CACHE ============
+class ResultCache:
+    """LRU cache of search results with an optional SQLite tier.
+
+    Keys combine the CSV content hash, the searched/output columns, the
+    result limit and the normalized (tokenized) query, so equivalent queries
+    share an entry and a changed CSV can never serve stale results. The disk
+    tier lets hits survive process restarts; entries for superseded CSV
+    versions are dropped the first time a new version is cached.
+    """
+
+    def __init__(self, maxsize=RESULT_CACHE_SIZE, path=RESULT_CACHE_FILE):
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self._db_pid = None
+        self._pruned = set()
+
+    @staticmethod
+    def key(index, search_cols, output_cols, query, max_results):
+        """Cache key for one query against one compiled index."""
+        cols = hashlib.sha1(("\x1f".join(list(search_cols) + ["\x1e"] + list(output_cols))
+                             + repr(index.field_weights)).encode("utf-8"))
+        fuzzy = f"f{FUZZY_MIN_LENGTH},{FUZZY_MAX_EXPANSIONS},{FUZZY_DISCOUNT}" if index.fuzzy else "exact"
+        return (f"{INDEX_VERSION}|{index.analyzer.signature}|{fuzzy}|{index.sha1}|{cols.hexdigest()[:12]}|"
+                f"{max_results}|{' '.join(index.tokenize(query))}")
+
+    def _connection(self):
+        """SQLite connection for this process (reopened after fork), or None."""
+        if self.path is None:
+            return None
+        if self._db_pid != os.getpid():
+            self._db, self._db_pid = None, os.getpid()
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(str(self.path), timeout=1, check_same_thread=False)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=OFF")
+                db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, file TEXT, sha1 TEXT, "
+                           "value TEXT, used_at INTEGER)")
+                self._db = db
+            except (sqlite3.Error, OSError):
+                self._db = None
+        return self._db
+
+    def get(self, key):
+        """Cached results for key, or None; counts a hit or a miss."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return [dict(row) for row in value]
+
+            db = self._connection()
+            if db is not None:
+                try:
+                    found = db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+                except sqlite3.Error:
+                    found = None
+                if found is not None:
+                    value = json.loads(found[0])
+                    self._remember(key, value)
+                    self.disk_hits += 1
+                    return [dict(row) for row in value]
+
+            self.misses += 1
+            return None
+
+    def put(self, key, file, sha1, value):
+        """Store results in memory and, if enabled, on disk."""
+        with self._lock:
+            self._remember(key, [dict(row) for row in value])
+            db = self._connection()
+            if db is None:
+                return
+            try:
+                with db:
+                    if (file, sha1) not in self._pruned:
+                        self._pruned.add((file, sha1))
+                        db.execute("DELETE FROM results WHERE file = ? AND sha1 != ?", (file, sha1))
+                        db.execute("DELETE FROM results WHERE key IN (SELECT key FROM results "
+                                   "ORDER BY used_at DESC LIMIT -1 OFFSET ?)", (RESULT_CACHE_DISK_ROWS,))
+                    db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, strftime('%s','now'))",
+                               (key, file, sha1, json.dumps(value, ensure_ascii=False)))
+            except sqlite3.Error:
+                pass
+
+    def _remember(self, key, value):
+        """Insert into the in-memory LRU, evicting the least recently used."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop the in-memory tier and reset counters (the disk tier is kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+
+    def stats(self):
+        """Hit/miss counters; disk_hits are hits served by the SQLite tier."""
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+            "maxsize": self.maxsize,
+            "disk": str(self.path) if self._connection() is not None else None
+        }
+
+
+RESULT_CACHE = ResultCache()
+
+
+def configure_result_cache(maxsize=RESULT_CACHE_SIZE, disk=True):
+    """Replace the process-wide result cache (maxsize=0 disables caching)."""
+    global RESULT_CACHE
+    RESULT_CACHE = ResultCache(maxsize, RESULT_CACHE_FILE if disk else None)
+    return RESULT_CACHE
+
+
+def cache_stats():
+    """Hit/miss counters of the process-wide result cache."""
+    return RESULT_CACHE.stats()
+
+
+# ============ DOMAIN ROUTING ============
+class DomainRouter:
+    """Naive Bayes router from query terms to CSV_CONFIG domains.
+
+    Each domain is summarized by how many of its rows contain each term
+    (plus DOMAIN_HINTS). A term's smoothed row rate per domain is turned into
+    one log-rate vector over all domains, so routing a query is a single sum
+    of vectors followed by a softmax; terms no domain knows are ignored.
+    A hint term also multiplies its domain's odds by hint_boost, so a domain's
+    own keywords outweigh a neighbour that merely mentions them often (CSS
+    prompts mention "color" in most rows). Hex colour literals are read as
+    "hex color" before analysis, which would otherwise drop the "#".
+    """
+
+    def __init__(self, stats, hints=None, smoothing=ROUTER_SMOOTHING, analyzer=None,
+                 hint_boost=ROUTER_HINT_BOOST):
+        """stats: {domain: (row count, {term: rows containing it})}"""
+        self.analyzer = analyzer or DEFAULT_ANALYZER
+        self.domains = list(stats)
+        totals = [stats[d][0] + 2 * smoothing for d in self.domains]
+        self.baseline = [log(smoothing / total) for total in totals]
+
+        counts = defaultdict(lambda: [0.0] * len(self.domains))
+        hinted = defaultdict(set)
+        for pos, domain in enumerate(self.domains):
+            rows, freqs = stats[domain]
+            for term, freq in freqs.items():
+                counts[term][pos] += freq
+            for hint in (hints or {}).get(domain, ()):
+                for term in set(self.analyzer(hint)):
+                    counts[term][pos] += ROUTER_HINT_RATE * rows
+                    hinted[term].add(pos)
+        boost = log(hint_boost)
+        self.log_rates = {
+            term: tuple(log((min(freq, stats[d][0]) + smoothing) / total) + (boost if pos in hinted[term] else 0.0)
+                        for pos, (freq, d, total) in enumerate(zip(freqs, self.domains, totals)))
+            for term, freqs in counts.items()
+        }
+
+    def route(self, query, k=3):
+        """Up to k (domain, confidence) pairs, best first; confidences sum to 1 over all domains."""
+        query = HEX_COLOR.sub(" hex color ", query)
+        vectors = [self.log_rates[t] for t in self.analyzer.analyze_query(query) if t in self.log_rates]
+        if not vectors:
+            return [(DEFAULT_DOMAIN, 1.0)]
+        scores = [sum(column) for column in zip(*vectors)]
+        top = max(scores)
+        weights = [exp(score - top) for score in scores]
+        total = sum(weights)
+        ranked = sorted(zip(self.domains, weights), key=lambda x: -x[1])
+        return [(domain, weight / total) for domain, weight in ranked[:k]]
+
+
+_ROUTER = None
+_ROUTER_KEY = None
+_ROUTER_LOCK = threading.Lock()
+
+
+def load_router():
+    """Router over the current CSV_CONFIG corpora, rebuilt when any index changes."""
+    global _ROUTER, _ROUTER_KEY
+    indexes = {}
+    for domain, config in CSV_CONFIG.items():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            indexes[domain] = load_index(filepath, config["search_cols"], config.get("field_weights"))
+    key = tuple((domain, id(index)) for domain, index in indexes.items())
+    with _ROUTER_LOCK:
+        if key != _ROUTER_KEY:
+            stats = {domain: (index.N, index.doc_freqs()) for domain, index in indexes.items()}
+            _ROUTER = DomainRouter(stats, DOMAIN_HINTS)
+            _ROUTER_KEY = key
+        return _ROUTER
+
+
+def route_domains(query, k=3):
+    """Candidate domains for query with confidences, e.g. [("color", 0.91), ("product", 0.07)]."""
+    return load_router().route(query, k)
+
+
+# ============ SEARCH FUNCTIONS ============
+def _search_csv_many(filepath, search_cols, output_cols, queries, field_weights=None):
+    """Run several (query, max_results) searches against one CSV.
+
+    The index is loaded once, cached results are reused, the remaining
+    queries are scored in one batch and every row needed by any of them is
+    read from the CSV only once.
+    """
+    if not filepath.exists():
+        return [[] for _ in queries]
+
+    index = load_index(filepath, search_cols, field_weights)
+    cache = RESULT_CACHE if RESULT_CACHE.maxsize > 0 else None
+    keys = [cache.key(index, search_cols, output_cols, q, k) if cache else None for q, k in queries]
+    results = [cache.get(key) if cache else None for key in keys]
+    pending = [pos for pos, cached in enumerate(results) if cached is None]
+    if not pending:
+        return results
+
+    rankings = index.score_many([queries[pos][0] for pos in pending], [queries[pos][1] for pos in pending])
 
     # Get top results with score > 0
-    results = []
-    for idx, score in ranked[:max_results]:
-        if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
+    tops = [[idx for idx, score in ranked if score > 0] for ranked in rankings]
+    needed = sorted({idx for top in tops for idx in top})
+    rows = dict(zip(needed, index.rows(needed, output_cols)))
 
+    for pos, top in zip(pending, tops):
+        results[pos] = [dict(rows[idx]) for idx in top]
+        if cache:
+            cache.put(keys[pos], str(filepath), index.sha1, results[pos])
     return results
 
 
+def _search_csv(filepath, search_cols, output_cols, query, max_results, field_weights=None):
+    """Core search function using the compiled BM25F index"""
+    return _search_csv_many(filepath, search_cols, output_cols, [(query, max_results)], field_weights)[0]
+
+
 def detect_domain(query):
     """Auto-detect the most relevant domain from query"""
-    query_lower = query.lower()
-
-    domain_keywords = {
-        "color": ["color", "palette", "hex", "#", "rgb"],
-        "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
-        "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
-        "product": ["saas", "ecommerce", "e-commerce", "fintech", "healthcare", "gaming", "portfolio", "crypto", "dashboard"],
-        "prompt": ["prompt", "css", "implementation", "variable", "checklist", "tailwind"],
-        "style": ["style", "design", "ui", "minimalism", "glassmorphism", "neumorphism", "brutalism", "dark mode", "flat", "aurora"],
-        "ux": ["ux", "usability", "accessibility", "wcag", "touch", "scroll", "animation", "keyboard", "navigation", "mobile"],
-        "typography": ["font", "typography", "heading", "serif", "sans"],
-        "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"],
-        "react": ["react", "next.js", "nextjs", "suspense", "memo", "usecallback", "useeffect", "rerender", "bundle", "waterfall", "barrel", "dynamic import", "rsc", "server component"],
-        "web": ["aria", "focus", "outline", "semantic", "virtualize", "autocomplete", "form", "input type", "preconnect"]
-    }
-
-    scores = {domain: sum(1 for kw in keywords if kw in query_lower) for domain, keywords in domain_keywords.items()}
-    best = max(scores, key=scores.get)
-    return best if scores[best] > 0 else "style"
+    return route_domains(query, 1)[0][0]
 
 
 def search(query, domain=None, max_results=MAX_RESULTS):
     """Main search function with auto-domain detection"""
-    if domain is None:
-        domain = detect_domain(query)
+    return search_many([(query, domain, max_results)])[0]
 
-    config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
-    filepath = DATA_DIR / config["file"]
 
-    if not filepath.exists():
-        return {"error": f"File not found: {filepath}", "domain": domain}
+def search_many(requests):
+    """Batched search: run (query, domain, max_results) triples together.
+
+    Requests are grouped by corpus so each CSV index is loaded and scanned
+    once per batch. Returns one search()-shaped result per request, in order.
+    """
+    responses = [None] * len(requests)
+    groups = {}
+
+    for pos, (query, domain, max_results) in enumerate(requests):
+        if domain is None:
+            domain = detect_domain(query)
+        config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
+        filepath = DATA_DIR / config["file"]
+        if not filepath.exists():
+            responses[pos] = {"error": f"File not found: {filepath}", "domain": domain}
+            continue
+        responses[pos] = {"domain": domain, "query": query, "file": config["file"]}
+        groups.setdefault(config["file"], (config, []))[1].append((pos, query, max_results))
+
+    for config, items in groups.values():
+        batch = _search_csv_many(DATA_DIR / config["file"], config["search_cols"], config["output_cols"],
+                                 [(query, max_results) for _, query, max_results in items],
+                                 config.get("field_weights"))
+        for (pos, _, _), results in zip(items, batch):
+            responses[pos]["count"] = len(results)
+            responses[pos]["results"] = results
+
+    return responses
+
+
+def search_routed(query, k=3, max_results=MAX_RESULTS, min_confidence=ROUTER_MIN_CONFIDENCE):
+    """Search the k most likely domains concurrently instead of guessing one.
+
+    The best candidate is always searched; the others only when their router
+    confidence reaches min_confidence. Each per-domain response is search()-
+    shaped with an added "confidence".
+    """
+    routes = route_domains(query, k)
+    routes = routes[:1] + [(domain, conf) for domain, conf in routes[1:] if conf >= min_confidence]
 
-    results = _search_csv(filepath, config["search_cols"], config["output_cols"], query, max_results)
+    with ThreadPoolExecutor(max_workers=min(FEDERATED_WORKERS, len(routes))) as pool:
+        responses = list(pool.map(lambda route: search(query, route[0], max_results), routes))
+    for response, (_, confidence) in zip(responses, routes):
+        response["confidence"] = round(confidence, 4)
 
     return {
-        "domain": domain,
+        "domain": "auto",
         "query": query,
-        "file": config["file"],
-        "count": len(results),
-        "results": results
+        "routes": [{"domain": domain, "confidence": round(conf, 4)} for domain, conf in routes],
+        "results": responses
     }
 
 
@@ -246,7 +1291,8 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
     if not filepath.exists():
         return {"error": f"Stack file not found: {filepath}", "stack": stack}
 
-    results = _search_csv(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results)
+    results = _search_csv(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results,
+                          _STACK_COLS["field_weights"])
 
     return {
         "domain": "stack",
@@ -256,3 +1302,142 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
         "count": len(results),
         "results": results
     }
+
+
+def search_stacks(query, stacks=None, max_results=MAX_RESULTS):
+    """Federated search across several stacks (all of STACK_CONFIG by default).
+
+    Stacks are scored concurrently against the shared in-memory indexes. Raw
+    BM25 scores depend on corpus size, so each hit is divided by its corpus'
+    max_score() before merging; the global top max_results are returned with
+    the originating stack in a "Stack" field.
+    """
+    response = _stacks_response(query, stacks)
+    if "error" in response:
+        return response
+
+    top = _rank_stacks(query, response["stacks"], max_results)
+    wanted = defaultdict(list)
+    for stack, index, idx in top:
+        wanted[stack].append(idx)
+    rows = {}
+    for stack, index, _ in top:
+        if stack not in rows:
+            rows[stack] = dict(zip(wanted[stack], index.rows(wanted[stack], _STACK_COLS["output_cols"])))
+
+    results = []
+    for stack, _, idx in top:
+        result = {"Stack": stack}
+        result.update(rows[stack][idx])
+        results.append(result)
+
+    response["count"] = len(results)
+    response["results"] = results
+    return response
+
+
+def _stacks_response(query, stacks):
+    """Response header for a federated search, or an error for unknown stacks."""
+    stacks = list(stacks) if stacks else AVAILABLE_STACKS
+    unknown = [stack for stack in stacks if stack not in STACK_CONFIG]
+    if unknown:
+        return {"error": f"Unknown stack: {', '.join(unknown)}. Available: {', '.join(AVAILABLE_STACKS)}"}
+    return {
+        "domain": "stack",
+        "stacks": stacks,
+        "query": query,
+        "files": [STACK_CONFIG[stack]["file"] for stack in stacks],
+    }
+
+
+def _rank_stacks(query, stacks, max_results):
+    """Global top max_results as (stack, index, row idx), best first."""
+    def rank(stack):
+        filepath = DATA_DIR / STACK_CONFIG[stack]["file"]
+        if not filepath.exists():
+            return None, []
+        index = load_index(filepath, _STACK_COLS["search_cols"], _STACK_COLS["field_weights"])
+        tokens = index.tokenize(query)
+        ceiling = index.max_score(tokens)
+        return index, [(score / ceiling, idx) for idx, score in index.score_tokens(tokens, max_results)]
+
+    with ThreadPoolExecutor(max_workers=min(FEDERATED_WORKERS, len(stacks))) as pool:
+        per_stack = list(pool.map(rank, stacks))
+
+    # Merge: best normalized score first, ties in stack order then row order
+    hits = [(norm, order, idx) for order, (_, ranked) in enumerate(per_stack) for norm, idx in ranked if norm > 0]
+    top = heapq.nsmallest(max_results, hits, key=lambda h: (-h[0], h[1], h[2]))
+    return [(stacks[order], per_stack[order][0], idx) for _, order, idx in top]
+
+
+# ============ STREAMING SEARCH ============
+def _stream_hits(filepath, search_cols, output_cols, query, max_results, field_weights, fields, max_chars):
+    """Rank one CSV and yield a RowView per hit; nothing runs until iteration starts."""
+    index = load_index(filepath, search_cols, field_weights)
+    positions = index.column_positions(_select_columns(output_cols, fields))
+    for idx, score in index.score(query, max_results):
+        if score > 0:
+            yield RowView(index, idx, positions, max_chars=max_chars)
+
+
+def _select_columns(output_cols, fields):
+    """output_cols restricted to (and ordered like) fields, when given."""
+    if not fields:
+        return output_cols
+    return [col for col in fields if col in output_cols]
+
+
+def search_stream(query, domain=None, max_results=MAX_RESULTS, fields=None, max_chars=None):
+    """Lazy search(): same response, but "results" is a generator of RowView.
+
+    Rows are only read as the generator is consumed, restricted to `fields`
+    (default: all output columns) and truncated to max_chars. Results are
+    not cached and there is no "count", since hits are produced one by one.
+    """
+    if domain is None:
+        domain = detect_domain(query)
+    config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
+    filepath = DATA_DIR / config["file"]
+    if not filepath.exists():
+        return {"error": f"File not found: {filepath}", "domain": domain}
+    return {
+        "domain": domain,
+        "query": query,
+        "file": config["file"],
+        "results": _stream_hits(filepath, config["search_cols"], config["output_cols"], query, max_results,
+                                config.get("field_weights"), fields, max_chars),
+    }
+
+
+def search_stack_stream(query, stack, max_results=MAX_RESULTS, fields=None, max_chars=None):
+    """Lazy search_stack(); see search_stream()."""
+    if stack not in STACK_CONFIG:
+        return {"error": f"Unknown stack: {stack}. Available: {', '.join(AVAILABLE_STACKS)}"}
+    filepath = DATA_DIR / STACK_CONFIG[stack]["file"]
+    if not filepath.exists():
+        return {"error": f"Stack file not found: {filepath}", "stack": stack}
+    return {
+        "domain": "stack",
+        "stack": stack,
+        "query": query,
+        "file": STACK_CONFIG[stack]["file"],
+        "results": _stream_hits(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query,
+                                max_results, _STACK_COLS["field_weights"], fields, max_chars),
+    }
+
+
+def search_stacks_stream(query, stacks=None, max_results=MAX_RESULTS, fields=None, max_chars=None):
+    """Lazy search_stacks(); each RowView carries its "Stack". See search_stream()."""
+    response = _stacks_response(query, stacks)
+    if "error" in response:
+        return response
+
+    def hits():
+        columns = _select_columns(_STACK_COLS["output_cols"], fields)
+        extra_stack = not fields or "Stack" in fields
+        for stack, index, idx in _rank_stacks(query, response["stacks"], max_results):
+            yield RowView(index, idx, index.column_positions(columns),
+                          {"Stack": stack} if extra_stack else None, max_chars)
+
+    response["results"] = hits()
+    return response
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Daemon - keeps every corpus indexed in memory between searches
+
+Protocol: one JSON object per line in, one JSON object per line out.
+    {"op": "search", "query": "...", "domain": null, "max_results": 3}
+    {"op": "search_stack", "query": "...", "stack": "react", "max_results": 3}
+    {"op": "search_many", "requests": [["query", "domain or null", 3], ...]}
+    {"op": "search_stacks", "query": "...", "stacks": ["react", "vue"] or null, "max_results": 3}
+    {"op": "search_routed", "query": "...", "k": 3, "max_results": 3}
+    {"op": "route", "query": "...", "k": 3}
+    {"op": "design_system", "query": "...", "project_name": null, "format": "ascii",
+     "persist": false, "page": null, "output_dir": "/abs/path"}
+    {"op": "cache_stats"}
+    {"op": "ping"}
+Replies are {"ok": true, "result": ...} or {"ok": false, "error": "..."}.
+
+Usage:
+    python search.py --serve                 # Unix socket (default path below)
+    python search.py --serve --stdio         # JSON lines on stdin/stdout
+
+The default socket lives in $XDG_RUNTIME_DIR, or else in a per-user 0700
+directory under the temp dir. Sockets and directories owned by another
+user are never served on or connected to.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+from pathlib import Path
+
+from core import (DATA_DIR, MAX_RESULTS, cache_stats, route_domains, search, search_many, search_routed,
+                  search_stack, search_stacks, warm_indexes)
+from design_system import generate_design_system
+
+# ============ CONFIGURATION ============
+CONNECT_TIMEOUT = 0.2
+REQUEST_TIMEOUT = 60
+
+
+def default_socket_path() -> str:
+    """Per-user, per-checkout socket path (short enough for AF_UNIX limits)."""
+    key = hashlib.sha1(str(DATA_DIR.resolve()).encode("utf-8")).hexdigest()[:8]
+    return str(_default_socket_dir() / f"ui-ux-pro-max-{key}.sock")
+
+
+def _default_socket_dir() -> Path:
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime and os.path.isabs(runtime):
+        return Path(runtime)
+    user = os.getuid() if hasattr(os, "getuid") else "user"
+    return Path(tempfile.gettempdir()) / f"ui-ux-pro-max-{user}"
+
+
+def _check_owner(path: str, private_dir: bool = False) -> None:
+    """Raise OSError unless path belongs to this user (and, for private_dir, is a 0700-style directory)."""
+    if not hasattr(os, "getuid"):
+        return
+    info = os.lstat(path)
+    if info.st_uid != os.getuid():
+        raise OSError(f"{path} is owned by another user")
+    if private_dir and (not stat.S_ISDIR(info.st_mode) or info.st_mode & 0o077):
+        raise OSError(f"{path} is not a private directory (expected mode 0700)")
+
+
+def _check_socket_path(socket_path: str, create_dir: bool = False) -> None:
+    """Raise OSError if the socket, or the default socket directory, is not this user's."""
+    directory = os.path.dirname(os.path.abspath(socket_path))
+    if directory == str(_default_socket_dir()):
+        if create_dir:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        _check_owner(directory, private_dir=True)
+    if os.path.lexists(socket_path):
+        _check_owner(socket_path)
+
+
+# ============ REQUEST HANDLING ============
+QUERY_OPS = {"search", "search_stack", "search_stacks", "search_routed", "route", "design_system"}
+
+
+def _request_error(request) -> str:
+    """Why a decoded request cannot be executed, or "" if it is well-formed."""
+    if not isinstance(request, dict):
+        return f"Request must be a JSON object, got {type(request).__name__}"
+    if request.get("op", "search") in QUERY_OPS:
+        query = request.get("query")
+        if not isinstance(query, str) or not query.strip():
+            return "'query' must be a non-empty string"
+    return ""
+
+
+def handle_request(request: dict) -> dict:
+    """Execute one protocol request in-process."""
+    error = _request_error(request)
+    if error:
+        return {"ok": False, "error": error}
+    op = request.get("op", "search")
+    if op == "ping":
+        return {"ok": True, "result": "pong"}
+    if op == "cache_stats":
+        return {"ok": True, "result": cache_stats()}
+    if op == "search":
+        result = search(request["query"], request.get("domain"), request.get("max_results", MAX_RESULTS))
+    elif op == "search_many":
+        result = search_many([tuple(item) for item in request["requests"]])
+    elif op == "search_stacks":
+        result = search_stacks(request["query"], request.get("stacks"), request.get("max_results", MAX_RESULTS))
+    elif op == "search_stack":
+        result = search_stack(request["query"], request["stack"], request.get("max_results", MAX_RESULTS))
+    elif op == "search_routed":
+        result = search_routed(request["query"], request.get("k", 3), request.get("max_results", MAX_RESULTS))
+    elif op == "route":
+        result = route_domains(request["query"], request.get("k", 3))
+    elif op == "design_system":
+        result = generate_design_system(
+            request["query"],
+            request.get("project_name"),
+            request.get("format", "ascii"),
+            persist=request.get("persist", False),
+            page=request.get("page"),
+            output_dir=request.get("output_dir")
+        )
+    else:
+        return {"ok": False, "error": f"Unknown op: {op}"}
+    return {"ok": True, "result": result}
+
+
+def _handle_line(line: str) -> str:
+    """Decode, execute and encode one request line; errors never kill the server."""
+    try:
+        response = handle_request(json.loads(line))
+    except Exception as e:
+        response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+    return json.dumps(response, ensure_ascii=False) + "\n"
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for raw in self.rfile:
+            line = raw.decode("utf-8", errors="replace").strip()
+            if line:
+                self.wfile.write(_handle_line(line).encode("utf-8"))
+                self.wfile.flush()
+
+
+# ============ SERVER ============
+def serve_stdio(stdin=None, stdout=None):
+    """Answer JSON-lines requests from stdin until EOF."""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    warm_indexes()
+    for line in stdin:
+        line = line.strip()
+        if line:
+            stdout.write(_handle_line(line))
+            stdout.flush()
+
+
+def serve_socket(socket_path: str = None):
+    """Answer JSON-lines requests on a Unix socket until interrupted."""
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("Unix sockets are not available on this platform; use --stdio")
+    socket_path = socket_path or default_socket_path()
+    _check_socket_path(socket_path, create_dir=True)
+
+    if os.path.exists(socket_path):
+        if query_daemon({"op": "ping"}, socket_path) is not None:
+            raise OSError(f"A daemon is already listening on {socket_path}")
+        os.unlink(socket_path)  # stale socket from a crashed server
+
+    loaded = warm_indexes()
+    server = socketserver.ThreadingUnixStreamServer(socket_path, _Handler)
+    server.daemon_threads = True
+    os.chmod(socket_path, 0o600)
+    print(f"UI Pro Max daemon: {loaded} corpora indexed, listening on {socket_path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+# ============ CLIENT ============
+def query_daemon(request: dict, socket_path: str = None):
+    """Send one request to a running daemon.
+
+    Returns the decoded reply, or None when no daemon is reachable so the
+    caller can fall back to handle_request() in-process.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    socket_path = socket_path or default_socket_path()
+    if not os.path.exists(socket_path):
+        return None
+
+    try:
+        _check_socket_path(socket_path)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(socket_path)
+            sock.settimeout(REQUEST_TIMEOUT)
+            sock.sendall((json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8"))
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError:
+        return None
+    if not line:
+        return None
+    return json.loads(line.decode("utf-8"))
+
+
+def run_request(request: dict, socket_path: str = None, use_daemon: bool = True) -> dict:
+    """Answer a request through the daemon when one is running, otherwise in-process."""
+    if use_daemon:
+        response = query_daemon(request, socket_path)
+        if response is not None:
+            return response
+    return handle_request(request)
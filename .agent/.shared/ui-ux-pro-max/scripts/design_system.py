@@ -16,13 +16,18 @@ Usage:
 import csv
 import json
 import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from core import search, DATA_DIR
+from core import search, search_many, warm_indexes, DATA_DIR
 
 
 # ============ CONFIGURATION ============
 REASONING_FILE = "ui-reasoning.csv"
+LOOKUP_CACHE_SIZE = 1024  # Category lookups memoized per ReasoningTable
 
 SEARCH_CONFIG = {
     "product": {"max_results": 1},
@@ -33,81 +38,125 @@ SEARCH_CONFIG = {
 }
 
 
-# ============ DESIGN SYSTEM GENERATOR ============
-class DesignSystemGenerator:
-    """Generates design system recommendations from aggregated searches."""
+DEFAULT_REASONING = {
+    "pattern": "Hero + Features + CTA",
+    "style_priority": ["Minimalism", "Flat Design"],
+    "color_mood": "Professional",
+    "typography_mood": "Clean",
+    "key_effects": "Subtle hover transitions",
+    "anti_patterns": "",
+    "decision_rules": {},
+    "severity": "MEDIUM"
+}
 
-    def __init__(self):
-        self.reasoning_data = self._load_reasoning()
 
-    def _load_reasoning(self) -> list:
-        """Load reasoning rules from CSV."""
-        filepath = DATA_DIR / REASONING_FILE
-        if not filepath.exists():
-            return []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return list(csv.DictReader(f))
+# ============ REASONING LOOKUP ============
+class SubstringMatcher:
+    """Aho-Corasick automaton: which registered patterns occur inside a text.
 
-    def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
-        """Execute searches across multiple domains."""
-        results = {}
-        for domain, config in SEARCH_CONFIG.items():
-            if domain == "style" and style_priority:
-                # For style, also search with priority keywords
-                priority_query = " ".join(style_priority[:2]) if style_priority else query
-                combined_query = f"{query} {priority_query}"
-                results[domain] = search(combined_query, domain, config["max_results"])
-            else:
-                results[domain] = search(query, domain, config["max_results"])
-        return results
-
-    def _find_reasoning_rule(self, category: str) -> dict:
-        """Find matching reasoning rule for a category."""
-        category_lower = category.lower()
-
-        # Try exact match first
-        for rule in self.reasoning_data:
-            if rule.get("UI_Category", "").lower() == category_lower:
-                return rule
+    Each pattern carries a rank; min_rank() returns the lowest rank among the
+    patterns found in one scan of the text, or None.
+    """
 
-        # Try partial match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            if ui_cat in category_lower or category_lower in ui_cat:
-                return rule
+    def __init__(self):
+        self._goto = [{}]
+        self._fail = [0]
+        self._rank = [None]
+
+    def add(self, pattern: str, rank: int):
+        """Register a pattern; build() must be called after the last add()."""
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._rank.append(None)
+            state = nxt
+        if self._rank[state] is None or rank < self._rank[state]:
+            self._rank[state] = rank
+
+    def build(self):
+        """Compute failure links; ranks are folded along them so a match at
+        any state reports the best pattern ending there."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                inherited = self._rank[self._fail[nxt]]
+                if inherited is not None and (self._rank[nxt] is None or inherited < self._rank[nxt]):
+                    self._rank[nxt] = inherited
+        return self
+
+    def min_rank(self, text: str):
+        """Lowest rank of any pattern occurring in text, or None."""
+        best = self._rank[0]  # empty pattern matches everything
+        state = 0
+        for ch in text:
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            rank = self._rank[state]
+            if rank is not None and (best is None or rank < best):
+                best = rank
+        return best
+
+
+class ReasoningTable:
+    """ui-reasoning.csv compiled for category lookups.
+
+    Holds an exact-match dict, an automaton over UI categories (partial
+    match), an automaton over category keywords (keyword match) and every
+    rule's reasoning with Decision_Rules already parsed. Lookups follow the
+    same precedence as a linear scan: exact, then partial, then keyword,
+    first rule in file order within each stage.
+    """
 
-        # Try keyword match
-        for rule in self.reasoning_data:
+    def __init__(self, rules: list, mtime_ns: int = None):
+        self.rules = rules
+        self.mtime_ns = mtime_ns
+        self.exact = {}
+        self.categories = SubstringMatcher()
+        self.keywords = SubstringMatcher()
+        self.reasoning = []
+        self._lookup = lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._match)
+
+        cat_parts = []
+        for rank, rule in enumerate(rules):
             ui_cat = rule.get("UI_Category", "").lower()
-            keywords = ui_cat.replace("/", " ").replace("-", " ").split()
-            if any(kw in category_lower for kw in keywords):
-                return rule
-
-        return {}
-
-    def _apply_reasoning(self, category: str, search_results: dict) -> dict:
-        """Apply reasoning rules to search results."""
-        rule = self._find_reasoning_rule(category)
-
-        if not rule:
-            return {
-                "pattern": "Hero + Features + CTA",
-                "style_priority": ["Minimalism", "Flat Design"],
-                "color_mood": "Professional",
-                "typography_mood": "Clean",
-                "key_effects": "Subtle hover transitions",
-                "anti_patterns": "",
-                "decision_rules": {},
-                "severity": "MEDIUM"
-            }
-
-        # Parse decision rules JSON
+            self.exact.setdefault(ui_cat, rank)
+            self.categories.add(ui_cat, rank)
+            cat_parts.append(ui_cat)
+            for kw in ui_cat.replace("/", " ").replace("-", " ").split():
+                self.keywords.add(kw, rank)
+            self.reasoning.append(self._compile(rule))
+
+        self.categories.build()
+        self.keywords.build()
+        # Reverse containment (category inside a UI category): one find() over
+        # all categories joined in file order yields the first matching rule.
+        self._haystack = "\x00".join(cat_parts)
+        self._starts = []
+        offset = 0
+        for part in cat_parts:
+            self._starts.append(offset)
+            offset += len(part) + 1
+
+    @staticmethod
+    def _compile(rule: dict) -> dict:
+        """Reasoning dict for one rule, with Decision_Rules parsed once."""
         decision_rules = {}
         try:
             decision_rules = json.loads(rule.get("Decision_Rules", "{}"))
         except json.JSONDecodeError:
             pass
-
         return {
             "pattern": rule.get("Recommended_Pattern", ""),
             "style_priority": [s.strip() for s in rule.get("Style_Priority", "").split("+")],
@@ -119,42 +168,105 @@ class DesignSystemGenerator:
             "severity": rule.get("Severity", "MEDIUM")
         }
 
+    def _contained_in_category(self, category_lower: str):
+        """Rank of the first UI category that contains category_lower."""
+        pos = self._haystack.find(category_lower)
+        if pos < 0:
+            return None
+        lo, hi = 0, len(self._starts) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self._starts[mid] <= pos:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+    def find(self, category: str):
+        """Index of the matching rule for a category, or None (LRU-memoized)."""
+        return self._lookup(category.lower())
+
+    def _match(self, category_lower: str):
+        rank = self.exact.get(category_lower)
+        if rank is None and self.rules:
+            partial = [r for r in (self.categories.min_rank(category_lower),
+                                   self._contained_in_category(category_lower)) if r is not None]
+            rank = min(partial) if partial else self.keywords.min_rank(category_lower)
+        return rank
+
+    def rule(self, category: str) -> dict:
+        """Matching rule row for a category, or {}."""
+        rank = self.find(category)
+        return self.rules[rank] if rank is not None else {}
+
+    def apply(self, category: str) -> dict:
+        """Reasoning for a category; falls back to DEFAULT_REASONING."""
+        rank = self.find(category)
+        reasoning = self.reasoning[rank] if rank is not None else DEFAULT_REASONING
+        return {**reasoning,
+                "style_priority": list(reasoning["style_priority"]),
+                "decision_rules": dict(reasoning["decision_rules"])}
+
+
+_REASONING_TABLE = None
+
+
+def load_reasoning_table() -> ReasoningTable:
+    """Module-level ReasoningTable shared by every generator, rebuilt if the CSV changes."""
+    global _REASONING_TABLE
+    filepath = DATA_DIR / REASONING_FILE
+    mtime_ns = filepath.stat().st_mtime_ns if filepath.exists() else None
+    if _REASONING_TABLE is None or _REASONING_TABLE.mtime_ns != mtime_ns:
+        rules = []
+        if mtime_ns is not None:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                rules = list(csv.DictReader(f))
+        _REASONING_TABLE = ReasoningTable(rules, mtime_ns)
+    return _REASONING_TABLE
+
+
+# ============ DESIGN SYSTEM GENERATOR ============
+class DesignSystemGenerator:
+    """Generates design system recommendations from aggregated searches."""
+
+    def __init__(self):
+        self.reasoning_table = load_reasoning_table()
+        self.reasoning_data = self.reasoning_table.rules
+
+    def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
+        """Execute searches across multiple domains as one batch."""
+        requests = []
+        for domain, config in SEARCH_CONFIG.items():
+            if domain == "style" and style_priority:
+                # For style, also search with priority keywords
+                priority_query = " ".join(style_priority[:2])
+                combined_query = f"{query} {priority_query}"
+                requests.append((combined_query, domain, config["max_results"]))
+            else:
+                requests.append((query, domain, config["max_results"]))
+        return dict(zip(SEARCH_CONFIG, search_many(requests)))
+
+    def _find_reasoning_rule(self, category: str) -> dict:
+        """Find matching reasoning rule for a category."""
+        return self.reasoning_table.rule(category)
+
+    def _apply_reasoning(self, category: str, search_results: dict) -> dict:
+        """Apply reasoning rules to search results."""
+        return self.reasoning_table.apply(category)
+
     def _select_best_match(self, results: list, priority_keywords: list) -> dict:
-        """Select best matching result based on priority keywords."""
+        """First result whose Style Category matches a priority, in priority order; else the top hit."""
         if not results:
             return {}
-
-        if not priority_keywords:
-            return results[0]
-
-        # First: try exact style name match
         for priority in priority_keywords:
             priority_lower = priority.lower().strip()
+            if not priority_lower:
+                continue
             for result in results:
                 style_name = result.get("Style Category", "").lower()
-                if priority_lower in style_name or style_name in priority_lower:
+                if style_name and (priority_lower in style_name or style_name in priority_lower):
                     return result
-
-        # Second: score by keyword match in all fields
-        scored = []
-        for result in results:
-            result_str = str(result).lower()
-            score = 0
-            for kw in priority_keywords:
-                kw_lower = kw.lower().strip()
-                # Higher score for style name match
-                if kw_lower in result.get("Style Category", "").lower():
-                    score += 10
-                # Lower score for keyword field match
-                elif kw_lower in result.get("Keywords", "").lower():
-                    score += 3
-                # Even lower for other field matches
-                elif kw_lower in result_str:
-                    score += 1
-            scored.append((score, result))
-
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return scored[0][1] if scored and scored[0][0] > 0 else results[0]
+        return results[0]
 
     def _extract_results(self, search_result: dict) -> list:
         """Extract results list from search result dict."""
@@ -177,13 +289,13 @@ class DesignSystemGenerator:
         search_results = self._multi_domain_search(query, style_priority)
         search_results["product"] = product_result  # Reuse product search
 
-        # Step 4: Select best matches from each domain using priority
+        # Step 4: Style follows the reasoning priority; other domains take the top BM25F hit
         style_results = self._extract_results(search_results.get("style", {}))
         color_results = self._extract_results(search_results.get("color", {}))
         typography_results = self._extract_results(search_results.get("typography", {}))
         landing_results = self._extract_results(search_results.get("landing", {}))
 
-        best_style = self._select_best_match(style_results, reasoning.get("style_priority", []))
+        best_style = self._select_best_match(style_results, style_priority)
         best_color = color_results[0] if color_results else {}
         best_typography = typography_results[0] if typography_results else {}
         best_landing = landing_results[0] if landing_results else {}
@@ -487,8 +599,125 @@ def generate_design_system(query: str, project_name: str = None, output_format:
     return format_ascii_box(design_system)
 
 
+# ============ BATCH GENERATION ============
+def load_briefs(path: str) -> list:
+    """
+    Load design briefs from a JSONL or CSV file.
+
+    Each brief has a "query" and optional "project_name" and "pages". In CSV,
+    pages is a ";"-separated cell; in JSONL it may be a list or that string.
+    Raises ValueError naming the brief (1-based) that is malformed.
+    """
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix.lower() == ".csv":
+            raw = list(csv.DictReader(f))
+        else:
+            raw = []
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    raw.append(json.loads(line))
+                except ValueError as e:
+                    raise ValueError(f"brief {len(raw) + 1}: invalid JSON ({e})") from None
+
+    briefs = []
+    for number, item in enumerate(raw, 1):
+        if not isinstance(item, dict):
+            raise ValueError(f"brief {number}: expected an object, got {type(item).__name__}")
+        query = item.get("query")
+        if not isinstance(query, str) or not query.strip():
+            raise ValueError(f"brief {number}: missing 'query'")
+        pages = item.get("pages") or []
+        if isinstance(pages, str):
+            pages = [p.strip() for p in pages.split(";") if p.strip()]
+        briefs.append({
+            "query": query,
+            "project_name": item.get("project_name") or None,
+            "pages": pages
+        })
+    return briefs
+
+
+def _project_slug(project_name: str) -> str:
+    """Folder name of a project under design-system/."""
+    return project_name.lower().replace(' ', '-')
+
+
+def _check_unique_projects(briefs: list) -> None:
+    """Persisted briefs must not share a project folder (workers would race on its files)."""
+    seen = {}
+    for number, brief in enumerate(briefs, 1):
+        slug = _project_slug(brief.get("project_name") or brief["query"].upper())
+        if slug in seen:
+            raise ValueError(f"briefs {seen[slug]} and {number} both write design-system/{slug}/; "
+                             f"give them distinct project_name values")
+        seen[slug] = number
+
+
+def _warm_worker():
+    """Pool initializer: load indexes and reasoning once per worker process."""
+    warm_indexes()
+    load_reasoning_table()
+
+
+def _generate_brief(brief: dict, output_format: str, persist: bool, output_dir: str) -> dict:
+    """Generate (and optionally persist) one brief; errors are returned, not raised."""
+    try:
+        design_system = DesignSystemGenerator().generate(brief["query"], brief.get("project_name"))
+        result = {"query": brief["query"], "project_name": design_system["project_name"], "files": []}
+        if persist:
+            persisted = persist_design_system(design_system, None, output_dir, brief["query"],
+                                              pages=brief.get("pages"))
+            result["files"] = persisted["created_files"]
+            result["written_files"] = persisted["written_files"]
+            result["unchanged_files"] = persisted["unchanged_files"]
+        result["output"] = format_markdown(design_system) if output_format == "markdown" else format_ascii_box(design_system)
+        return result
+    except (OSError, KeyError, ValueError) as e:
+        return {"query": brief.get("query"), "project_name": brief.get("project_name"), "error": str(e)}
+
+
+def generate_batch(briefs: list, output_format: str = "ascii", persist: bool = False,
+                   output_dir: str = None, workers: int = None) -> list:
+    """
+    Generate design systems for many briefs.
+
+    Indexes and reasoning rules are loaded before the pool starts (forked
+    workers inherit them) and again by each worker's initializer otherwise,
+    so every process loads them once instead of once per brief.
+
+    Args:
+        briefs: List of {"query", "project_name", "pages"} dicts (see load_briefs)
+        output_format: "ascii" (default) or "markdown"
+        persist: If True, write MASTER.md and page overrides for every brief
+        output_dir: Optional output directory (defaults to current working directory)
+        workers: Process count; None uses os.cpu_count(), 1 runs in-process
+
+    Returns:
+        One result dict per brief, in input order
+
+    Raises:
+        ValueError: if persist is set and two briefs map to the same project folder
+    """
+    if persist:
+        _check_unique_projects(briefs)
+    output_dir = str(Path(output_dir).resolve()) if output_dir else os.getcwd()
+    _warm_worker()
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(briefs) <= 1:
+        return [_generate_brief(brief, output_format, persist, output_dir) for brief in briefs]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(briefs)), initializer=_warm_worker) as pool:
+        futures = [pool.submit(_generate_brief, brief, output_format, persist, output_dir) for brief in briefs]
+        return [future.result() for future in futures]
+
+
 # ============ PERSISTENCE FUNCTIONS ============
-def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None) -> dict:
+def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None,
+                          pages: list = None) -> dict:
     """
     Persist design system to design-system/<project>/ folder using Master + Overrides pattern.
     
@@ -497,20 +726,26 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
         page_query: Optional query string for intelligent page override generation
+        pages: Optional list of additional page names (one override file each)
     
+    Files whose content is unchanged (ignoring the Generated timestamp) are
+    left untouched; changed files are replaced atomically.
+
     Returns:
-        dict with created file paths and status
+        dict with status, all file paths, and which were written vs unchanged
     """
     base_dir = Path(output_dir) if output_dir else Path.cwd()
     
     # Use project name for project-specific folder
     project_name = design_system.get("project_name", "default")
-    project_slug = project_name.lower().replace(' ', '-')
+    project_slug = _project_slug(project_name)
     
     design_system_dir = base_dir / "design-system" / project_slug
     pages_dir = design_system_dir / "pages"
     
     created_files = []
+    written_files = []
+    unchanged_files = []
     
     # Create directories
     design_system_dir.mkdir(parents=True, exist_ok=True)
@@ -518,27 +753,55 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
     
     master_file = design_system_dir / "MASTER.md"
     
-    # Generate and write MASTER.md
-    master_content = format_master_md(design_system)
-    with open(master_file, 'w', encoding='utf-8') as f:
-        f.write(master_content)
-    created_files.append(str(master_file))
-    
-    # If page is specified, create page override file with intelligent content
-    if page:
-        page_file = pages_dir / f"{page.lower().replace(' ', '-')}.md"
-        page_content = format_page_override_md(design_system, page, page_query)
-        with open(page_file, 'w', encoding='utf-8') as f:
-            f.write(page_content)
-        created_files.append(str(page_file))
+    # Generate MASTER.md and any page override files with intelligent content
+    outputs = [(master_file, format_master_md(design_system))]
+    for page_name in ([page] if page else []) + list(pages or []):
+        page_file = pages_dir / f"{page_name.lower().replace(' ', '-')}.md"
+        outputs.append((page_file, format_page_override_md(design_system, page_name, page_query)))
+
+    for path, content in outputs:
+        created_files.append(str(path))
+        if _write_if_changed(path, content):
+            written_files.append(str(path))
+        else:
+            unchanged_files.append(str(path))
     
     return {
         "status": "success",
         "design_system_dir": str(design_system_dir),
-        "created_files": created_files
+        "created_files": created_files,
+        "written_files": written_files,
+        "unchanged_files": unchanged_files
     }
 
 
+_GENERATED_LINE = re.compile(r'^(> )?\*\*Generated:\*\* .*$', re.MULTILINE)
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """
+    Write content to path unless the file already holds the same rendering.
+
+    The Generated timestamp is ignored when comparing, so regenerating an
+    unchanged design system does not touch the file (no watcher, HMR or git
+    churn). Writes go through a temp file and os.replace, so readers never
+    see a half-written file. Returns True if the file was written.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            existing = f.read()
+    except (OSError, UnicodeDecodeError):
+        existing = None
+    if existing is not None and _GENERATED_LINE.sub("", existing) == _GENERATED_LINE.sub("", content):
+        return False
+
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp, path)
+    return True
+
+
 def format_master_md(design_system: dict) -> str:
     """Format design system as MASTER.md with hierarchical override logic."""
     project = design_system.get("project_name", "PROJECT")
@@ -918,16 +1181,16 @@ def _generate_intelligent_overrides(page_name: str, page_query: str, design_syst
     Uses the existing search infrastructure to find relevant style, UX, and layout
     data instead of hardcoded page types.
     """
-    from core import search
-    
     page_lower = page_name.lower()
     query_lower = (page_query or "").lower()
     combined_context = f"{page_lower} {query_lower}"
     
     # Search across multiple domains for page-specific guidance
-    style_search = search(combined_context, "style", max_results=1)
-    ux_search = search(combined_context, "ux", max_results=3)
-    landing_search = search(combined_context, "landing", max_results=1)
+    style_search, ux_search, landing_search = search_many([
+        (combined_context, "style", 1),
+        (combined_context, "ux", 3),
+        (combined_context, "landing", 1),
+    ])
     
     # Extract results from search response
     style_results = style_search.get("results", [])
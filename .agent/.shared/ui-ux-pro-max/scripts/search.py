@@ -3,8 +3,12 @@
 """
 UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
 Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
+       python search.py "<query>" --stacks react,nextjs,vue   (or --stacks all)
+       python search.py "<query>" --route 3     (search the 3 most likely domains)
        python search.py "<query>" --design-system [-p "Project Name"]
        python search.py "<query>" --design-system --persist [-p "Project Name"] [--page "dashboard"]
+       python search.py --batch briefs.jsonl [--persist] [--workers 4]
+       python search.py "<query>" --jsonl [--fields "Style Category,Keywords"] [--max-chars 200]
 
 Domains: style, prompt, color, chart, landing, product, ux, typography
 Stacks: html-tailwind, react, nextjs
@@ -12,11 +16,44 @@ Stacks: html-tailwind, react, nextjs
 Persistence (Master + Overrides pattern):
   --persist    Save design system to design-system/MASTER.md
   --page       Also create a page-specific override file in design-system/pages/
+
+Daemon (warm in-memory indexes, see daemon.py):
+  python search.py --serve [--socket PATH]   Serve on a Unix socket
+  python search.py --serve --stdio           Serve JSON lines on stdin/stdout
+  Regular invocations use a running daemon automatically (--no-daemon to opt out)
+
+Streaming (--jsonl): one JSON object per line - a header, then each hit as it is
+read from the index, with only the --fields requested. Always runs in-process.
 """
 
 import argparse
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
-from design_system import generate_design_system, persist_design_system
+import json
+import os
+import sys
+from core import (CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS,
+                  search_stream, search_stack_stream, search_stacks_stream)
+from daemon import run_request, serve_socket, serve_stdio
+from design_system import generate_batch, load_briefs
+
+
+def select_fields(result, fields):
+    """Keep only the requested fields of every hit (no-op without fields)"""
+    if fields and "results" in result:
+        result = dict(result, results=[{k: row[k] for k in fields if k in row} for row in result["results"]])
+    return result
+
+
+def stream_jsonl(response):
+    """Write a header line, then one line per hit as soon as it is read"""
+    if "error" in response:
+        print(json.dumps({"error": response["error"]}, ensure_ascii=False))
+        return False
+    print(json.dumps({k: v for k, v in response.items() if k != "results"}, ensure_ascii=False), flush=True)
+    for rank, row in enumerate(response["results"], 1):
+        line = {"rank": rank}
+        line.update(row)
+        print(json.dumps(line, ensure_ascii=False), flush=True)
+    return True
 
 
 def format_output(result):
@@ -25,13 +62,17 @@ def format_output(result):
         return f"Error: {result['error']}"
 
     output = []
-    if result.get("stack"):
+    if result.get("stacks"):
+        output.append(f"## UI Pro Max Stack Guidelines")
+        output.append(f"**Stacks:** {', '.join(result['stacks'])} | **Query:** {result['query']}")
+    elif result.get("stack"):
         output.append(f"## UI Pro Max Stack Guidelines")
         output.append(f"**Stack:** {result['stack']} | **Query:** {result['query']}")
     else:
         output.append(f"## UI Pro Max Search Results")
         output.append(f"**Domain:** {result['domain']} | **Query:** {result['query']}")
-    output.append(f"**Source:** {result['file']} | **Found:** {result['count']} results\n")
+    source = result['file'] if 'file' in result else f"{len(result['files'])} stack files"
+    output.append(f"**Source:** {source} | **Found:** {result['count']} results\n")
 
     for i, row in enumerate(result['results'], 1):
         output.append(f"### Result {i}")
@@ -47,11 +88,16 @@ def format_output(result):
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
+    parser.add_argument("query", nargs="?", help="Search query")
     parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
     parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
+    parser.add_argument("--stacks", type=str, default=None, help="Federated search across stacks: comma-separated list or 'all'")
+    parser.add_argument("--route", type=int, default=None, metavar="K", help="Search the K most likely domains (auto-routing)")
     parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--jsonl", action="store_true", help="Stream hits as JSON lines (header line first)")
+    parser.add_argument("--fields", type=str, default=None, help="Comma-separated result fields to output")
+    parser.add_argument("--max-chars", type=int, default=None, help="With --jsonl: truncate field values to N chars")
     # Design system generation
     parser.add_argument("--design-system", "-ds", action="store_true", help="Generate complete design system recommendation")
     parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name for design system output")
@@ -60,19 +106,71 @@ if __name__ == "__main__":
     parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
     parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
     parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
+    # Batch design system generation
+    parser.add_argument("--batch", type=str, default=None, help="Generate design systems for every brief in a JSONL/CSV file (query, project_name, pages)")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size for --batch (default: CPU count)")
+    # Daemon mode
+    parser.add_argument("--serve", action="store_true", help="Run as a daemon keeping all corpora indexed in memory")
+    parser.add_argument("--stdio", action="store_true", help="With --serve: answer JSON-lines requests on stdin/stdout")
+    parser.add_argument("--socket", type=str, default=None, help="Daemon socket path (default: private per-user runtime dir)")
+    parser.add_argument("--no-daemon", action="store_true", help="Always search in-process, even if a daemon is running")
+    parser.add_argument("--cache-stats", action="store_true", help="Print result-cache hit/miss counters to stderr")
 
     args = parser.parse_args()
 
+    if args.serve:
+        try:
+            if args.stdio:
+                serve_stdio()
+            else:
+                serve_socket(args.socket)
+        except OSError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        sys.exit(0)
+    if args.batch:
+        try:
+            results = generate_batch(load_briefs(args.batch), args.format, args.persist, args.output_dir,
+                                     args.workers)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        if args.json:
+            print(json.dumps(results, indent=2, ensure_ascii=False))
+        else:
+            for result in results:
+                if "error" in result:
+                    print(f"❌ {result['project_name'] or result['query']}: {result['error']}")
+                elif args.persist:
+                    print(f"✅ {result['project_name']}: {len(result['written_files'])} written, "
+                          f"{len(result['unchanged_files'])} unchanged")
+                else:
+                    print(result["output"])
+                    print("")
+        sys.exit(1 if any("error" in r for r in results) else 0)
+    if args.query is None:
+        parser.error("the following arguments are required: query")
+
+    def run(request):
+        response = run_request(request, args.socket, use_daemon=not args.no_daemon)
+        if not response["ok"]:
+            print(f"Error: {response['error']}")
+            sys.exit(1)
+        return response["result"]
+
+    fields = [f.strip() for f in args.fields.split(",") if f.strip()] if args.fields else None
+
     # Design system takes priority
     if args.design_system:
-        result = generate_design_system(
-            args.query, 
-            args.project_name, 
-            args.format,
-            persist=args.persist,
-            page=args.page,
-            output_dir=args.output_dir
-        )
+        result = run({
+            "op": "design_system",
+            "query": args.query,
+            "project_name": args.project_name,
+            "format": args.format,
+            "persist": args.persist,
+            "page": args.page,
+            "output_dir": os.path.abspath(args.output_dir or os.getcwd())
+        })
         print(result)
         
         # Print persistence confirmation
@@ -88,19 +186,58 @@ if __name__ == "__main__":
             print(f"📖 Usage: When building a page, check design-system/{project_slug}/pages/[page].md first.")
             print(f"   If exists, its rules override MASTER.md. Otherwise, use MASTER.md.")
             print("=" * 60)
+    # Streaming JSON lines
+    elif args.jsonl:
+        stacks = None if args.stacks in (None, "all") else [s.strip() for s in args.stacks.split(",") if s.strip()]
+        if args.stacks:
+            response = search_stacks_stream(args.query, stacks, args.max_results, fields, args.max_chars)
+        elif args.stack:
+            response = search_stack_stream(args.query, args.stack, args.max_results, fields, args.max_chars)
+        else:
+            response = search_stream(args.query, args.domain, args.max_results, fields, args.max_chars)
+        try:
+            ok = stream_jsonl(response)
+        except BrokenPipeError:
+            # Consumer stopped reading after the hits it needed
+            sys.stderr.close()
+            sys.exit(0)
+        if not ok:
+            sys.exit(1)
+    # Multi-domain routed search
+    elif args.route:
+        result = run({"op": "search_routed", "query": args.query, "k": args.route, "max_results": args.max_results})
+        result = dict(result, results=[select_fields(r, fields) for r in result["results"]])
+        if args.json:
+            print(json.dumps(result, indent=2, ensure_ascii=False))
+        else:
+            routes = ", ".join(f"{r['domain']} ({r['confidence']:.0%})" for r in result["routes"])
+            print(f"**Routes:** {routes}\n")
+            print("\n".join(format_output(r) for r in result["results"]))
+    # Federated stack search
+    elif args.stacks:
+        stacks = None if args.stacks == "all" else [s.strip() for s in args.stacks.split(",") if s.strip()]
+        result = run({"op": "search_stacks", "query": args.query, "stacks": stacks, "max_results": args.max_results})
+        result = select_fields(result, fields)
+        if args.json:
+            print(json.dumps(result, indent=2, ensure_ascii=False))
+        else:
+            print(format_output(result))
     # Stack search
     elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
+        result = run({"op": "search_stack", "query": args.query, "stack": args.stack, "max_results": args.max_results})
+        result = select_fields(result, fields)
         if args.json:
-            import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
         else:
             print(format_output(result))
     # Domain search
     else:
-        result = search(args.query, args.domain, args.max_results)
+        result = run({"op": "search", "query": args.query, "domain": args.domain, "max_results": args.max_results})
+        result = select_fields(result, fields)
         if args.json:
-            import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
         else:
             print(format_output(result))
+
+    if args.cache_stats:
+        print(json.dumps(run({"op": "cache_stats"})), file=sys.stderr)
@@ -0,0 +1,6 @@
+"""Put scripts/ on sys.path so tests import core / design_system like the CLI does."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
@@ -0,0 +1,102 @@
+"""Search core: compiled index decoding and scoring backends."""
+
+import sys
+import threading
+
+import pytest
+
+import core
+
+QUERIES = [
+    "glassmorphism", "minimal dark dashboard", "fintech crypto", "button hover focus state",
+    "form form form validation", "accessibility keyboard focus", "saas landing page pricing",
+    # fuzzy expansions: misspelled and partial terms
+    "glasmorphism", "dashbord analytcs", "typograpy serif", "responsiv", "animaton",
+    # unknown and empty
+    "xyzzy nonexistent term", "",
+]
+TOP_KS = [None, 1, 3, 10]
+
+
+def _corpora():
+    """(name, filepath, search_cols, field_weights) of every bundled corpus."""
+    corpora = [(name, core.DATA_DIR / config["file"], config["search_cols"], config.get("field_weights"))
+               for name, config in core.CSV_CONFIG.items()]
+    corpora += [(name, core.DATA_DIR / config["file"], core._STACK_COLS["search_cols"],
+                 core._STACK_COLS["field_weights"]) for name, config in core.STACK_CONFIG.items()]
+    return [corpus for corpus in corpora if corpus[1].exists()]
+
+
+def _style_index():
+    config = core.CSV_CONFIG["style"]
+    return core.load_index(core.DATA_DIR / config["file"], config["search_cols"], config.get("field_weights"))
+
+
+def test_lazy_postings_decode_is_thread_safe():
+    source = _style_index()
+    data = source.to_dict(core.CSV_CONFIG["style"]["search_cols"])
+    expected = core.CompiledIndex.from_dict(data, source.filepath)
+    tokens = sorted(data["postings"])
+    wanted = {token: list(expected.get_postings(token)) for token in tokens}
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads often enough to interleave the decodes
+    try:
+        _race_decodes(data, source.filepath, tokens, wanted)
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def _race_decodes(data, filepath, tokens, wanted):
+    for _ in range(5):
+        index = core.CompiledIndex.from_dict(data, filepath)
+        barrier = threading.Barrier(8)
+
+        def decode():
+            barrier.wait()
+            for token in tokens:
+                index.get_postings(token)
+
+        threads = [threading.Thread(target=decode) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert {token: list(index.get_postings(token)) for token in tokens} == wanted
+        assert all(wanted[token] for token in tokens)
+
+
+def _backend_index(filepath, search_cols, field_weights, backend):
+    loaded = core.load_index(filepath, search_cols, field_weights)
+    index = core.CompiledIndex.from_dict(loaded.to_dict(search_cols), filepath)
+    index.backend = backend
+    index.lexicon = core.LEXICON
+    return index
+
+
+@pytest.mark.parametrize("name, filepath, search_cols, field_weights", _corpora(),
+                         ids=[corpus[0] for corpus in _corpora()])
+def test_numpy_backend_ranks_like_python(name, filepath, search_cols, field_weights):
+    pytest.importorskip("numpy")
+    python = _backend_index(filepath, search_cols, field_weights, "python")
+    numpy = _backend_index(filepath, search_cols, field_weights, "numpy")
+    assert numpy.sparse_scorer() is not None and python.sparse_scorer() is None
+
+    # Single frequent terms tie on many documents; include some per corpus
+    freqs = python.doc_freqs()
+    frequent = sorted(freqs, key=lambda token: (-freqs[token], token))[:5]
+    queries = QUERIES + frequent + [" ".join(frequent[:2])]
+    for top_k in TOP_KS:
+        top_ks = [top_k] * len(queries)
+        assert numpy.score_many(queries, top_ks) == python.score_many(queries, top_ks)
+
+
+def test_parity_cases_include_ties_and_fuzzy_hits():
+    config = core.CSV_CONFIG["style"]
+    index = _backend_index(core.DATA_DIR / config["file"], config["search_cols"], config.get("field_weights"),
+                           "python")
+    freqs = index.doc_freqs()
+    token = max(freqs, key=lambda t: (freqs[t], t))
+    scores = [score for _, score in index.score(token)]
+    assert len(scores) != len(set(scores))
+    assert "glasmorphism" not in index.idf and index.score("glasmorphism", 3)
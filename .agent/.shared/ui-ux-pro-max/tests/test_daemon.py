@@ -0,0 +1,71 @@
+"""Daemon: malformed requests never stop the server; sockets stay private to their user."""
+
+import io
+import json
+import os
+import stat
+
+import pytest
+
+import daemon
+
+
+def _serve(*requests):
+    stdin = io.StringIO("".join(line + "\n" for line in requests))
+    stdout = io.StringIO()
+    daemon.serve_stdio(stdin, stdout)
+    return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+
+def test_malformed_requests_are_answered_and_server_keeps_going():
+    replies = _serve('[1,2]', '"x"', '42', 'not json', '{"query": null}', '{"query": ""}',
+                     '{"op": "route", "query": 7}', '{"op": "search_stack", "query": "form"}',
+                     '{"op": "ping"}')
+    assert [reply["ok"] for reply in replies] == [False] * 8 + [True]
+    assert replies[0]["error"] == "Request must be a JSON object, got list"
+    assert replies[4]["error"] == "'query' must be a non-empty string"
+    assert replies[7]["error"].startswith("KeyError")
+    assert replies[-1]["result"] == "pong"
+
+
+def test_search_request():
+    reply, = _serve('{"query": "glassmorphism", "domain": "style", "max_results": 1}')
+    assert reply["ok"]
+    assert reply["result"]["results"][0]["Style Category"] == "Glassmorphism"
+
+
+def test_socket_defaults_to_xdg_runtime_dir(tmp_path, monkeypatch):
+    runtime = tmp_path / "run"
+    runtime.mkdir(mode=0o700)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(runtime))
+    path = daemon.default_socket_path()
+    assert os.path.dirname(path) == str(runtime)
+    daemon._check_socket_path(path, create_dir=True)
+
+
+def test_socket_falls_back_to_private_temp_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(daemon.tempfile, "gettempdir", lambda: str(tmp_path))
+    path = daemon.default_socket_path()
+    assert os.path.dirname(path) == str(tmp_path / f"ui-ux-pro-max-{os.getuid()}")
+
+    daemon._check_socket_path(path, create_dir=True)
+    assert stat.S_IMODE(os.stat(os.path.dirname(path)).st_mode) == 0o700
+
+    os.chmod(os.path.dirname(path), 0o755)
+    with pytest.raises(OSError, match="not a private directory"):
+        daemon._check_socket_path(path)
+
+
+def test_sockets_of_other_users_are_refused(tmp_path, monkeypatch):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    path = tmp_path / "other.sock"
+    path.write_text("", encoding="utf-8")
+    uid = os.getuid()
+    monkeypatch.setattr(daemon.os, "getuid", lambda: uid + 1)
+
+    with pytest.raises(OSError, match="owned by another user"):
+        daemon._check_socket_path(str(path))
+    assert daemon.query_daemon({"op": "ping"}, str(path)) is None
+    with pytest.raises(OSError, match="owned by another user"):
+        daemon.serve_socket(str(path))
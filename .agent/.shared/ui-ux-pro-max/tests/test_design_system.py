@@ -0,0 +1,71 @@
+"""Design system generation: style choice follows the reasoning rule's priority."""
+
+import pytest
+
+import design_system
+from design_system import DesignSystemGenerator, generate_batch, load_briefs, load_reasoning_table
+
+
+@pytest.fixture(scope="module")
+def generator():
+    return DesignSystemGenerator()
+
+
+@pytest.mark.parametrize("query, category, style", [
+    ("fintech crypto dashboard", "Fintech/Crypto", "Glassmorphism"),
+    ("saas b2b analytics", "SaaS (General)", "Glassmorphism"),
+])
+def test_style_follows_priority(generator, query, category, style):
+    result = generator.generate(query)
+    assert result["category"] == category
+    assert result["style"]["name"] == style
+
+
+def test_select_best_match_checks_priorities_in_order(generator):
+    results = [{"Style Category": "Dark Mode (OLED)"}, {"Style Category": "Cyberpunk UI"},
+               {"Style Category": "Glassmorphism"}]
+    best = generator._select_best_match(results, ["Glassmorphism", "Dark Mode (OLED)"])
+    assert best["Style Category"] == "Glassmorphism"
+
+
+def test_select_best_match_falls_back_to_top_hit(generator):
+    results = [{"Style Category": "Flat Design"}, {"Style Category": "Neubrutalism"}]
+    assert generator._select_best_match(results, ["Claymorphism"]) is results[0]
+    assert generator._select_best_match([], ["Claymorphism"]) == {}
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_load_briefs_names_the_bad_brief(tmp_path):
+    path = _write(tmp_path, "briefs.jsonl", '{"query": "spa"}\n\n{"query": "bank"}\n{"project_name": "X"}\n')
+    with pytest.raises(ValueError, match=r"^brief 3: missing 'query'$"):
+        load_briefs(path)
+    with pytest.raises(ValueError, match=r"^brief 2: expected an object"):
+        load_briefs(_write(tmp_path, "list.jsonl", '{"query": "spa"}\n[1, 2]\n'))
+    with pytest.raises(ValueError, match=r"^brief 2: invalid JSON"):
+        load_briefs(_write(tmp_path, "bad.jsonl", '{"query": "spa"}\n{"query": \n'))
+    with pytest.raises(ValueError, match=r"^brief 2: missing 'query'$"):
+        load_briefs(_write(tmp_path, "briefs.csv", 'query,project_name\nspa,Spa\n,Bank\n'))
+
+
+def test_persisted_batch_rejects_shared_project_folders(tmp_path):
+    briefs = [{"query": "spa", "project_name": "My App", "pages": []},
+              {"query": "bank", "project_name": None, "pages": []},
+              {"query": "fintech", "project_name": "my app", "pages": []}]
+    with pytest.raises(ValueError, match=r"^briefs 1 and 3 both write design-system/my-app/"):
+        generate_batch(briefs, persist=True, output_dir=str(tmp_path), workers=1)
+    assert not (tmp_path / "design-system").exists()
+    assert len(generate_batch(briefs, workers=1)) == 3  # nothing written, nothing to race on
+
+
+def test_reasoning_lookups_are_bounded(monkeypatch):
+    monkeypatch.setattr(design_system, "LOOKUP_CACHE_SIZE", 8)
+    table = design_system.ReasoningTable(load_reasoning_table().rules)
+    for i in range(50):
+        table.find(f"made up category {i}")
+    assert table._lookup.cache_info().currsize == 8
+    assert table.find("SaaS (General)") == table.find("saas (general)") == table._match("saas (general)")
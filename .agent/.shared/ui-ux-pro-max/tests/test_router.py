@@ -0,0 +1,51 @@
+"""Domain routing regression table: query -> expected best domain."""
+
+import pytest
+
+import core
+
+ROUTES = [
+    # colour: hex literals are read before the analyzer strips "#"
+    ("#ff0000 palette", "color"),
+    ("#1e293b background", "color"),
+    ("brand colors #0a84ff", "color"),
+    ("#fff text on #000", "color"),
+    ("hex color codes", "color"),
+    ("healthcare app colors", "color"),
+    ("color palette healthcare", "color"),
+    ("dark mode color palette", "color"),
+    ("glassmorphism card", "style"),
+    ("neumorphism buttons", "style"),
+    ("flat design style", "style"),
+    ("font pairing serif", "typography"),
+    ("heading font sans", "typography"),
+    ("pie chart revenue", "chart"),
+    ("line chart trend", "chart"),
+    ("bar graph", "chart"),
+    ("saas landing hero", "landing"),
+    ("pricing section cta", "landing"),
+    ("hero section testimonial", "landing"),
+    ("fintech crypto", "product"),
+    ("gaming portfolio", "product"),
+    ("accessibility keyboard focus", "ux"),
+    ("mobile touch targets", "ux"),
+    ("scroll navigation", "ux"),
+    ("tailwind css variables", "prompt"),
+    ("prompt checklist", "prompt"),
+    ("lucide icons", "icons"),
+    ("svg icon set", "icons"),
+    ("react suspense waterfall", "react"),
+    ("useeffect rerender memo", "react"),
+    ("aria label form", "web"),
+    ("input type email autocomplete", "web"),
+    ("xyzzy", core.DEFAULT_DOMAIN),
+]
+
+
+@pytest.mark.parametrize("query, domain", ROUTES)
+def test_route(query, domain):
+    assert core.detect_domain(query) == domain
+
+
+def test_hex_literal_needs_a_boundary():
+    assert core.HEX_COLOR.findall("#fff #1e293b #0a84ff80 #abcde a#fff") == ["#fff", "#1e293b", "#0a84ff80"]
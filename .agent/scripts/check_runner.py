@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Check Runner - Antigravity Kit
+==============================
+
+Runs one validation script for checklist.py / verify_all.py.
+
+A skill script that defines ``run(project_path, url=None, options=None)``
+returning a ``Result`` is imported and called in-process: no interpreter
+startup per check, and the report comes back as a dict instead of scraped
+stdout. Scripts without ``run()`` - and every script when ``isolate`` is
+set - run as ``python <script> <project> [url]`` in a subprocess, which
+is also the safe choice for untrusted or crash-prone checks.
+
+Checks that wrap an external tool (eslint, vitest, npm audit) start it
+with ``run_tool(cmd, cwd, timeout, options)``: the runner passes its
+cancel event and deadline in ``options``, so the tool is killed on
+cancellation or timeout even though the check itself runs in-process.
+
+Usage (from a skill script):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+    from check_runner import Result, finding
+
+    def run(project_path, url=None, options=None) -> Result:
+        report = build_report(project_path)
+        return Result(report["passed"], report,
+                      findings=[finding("high", issue) for issue in report["issues"]])
+"""
+
+import sys
+import json
+import time
+import threading
+import traceback
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from scan_engine import ScanResult, load_plugin
+
+DEFAULT_TIMEOUT = 600  # seconds
+CANCEL_GRACE = 2.0     # seconds an in-process check gets to stop once cancelled
+
+
+# ============================================================================
+#  RESULT
+# ============================================================================
+
+SEVERITIES = ("critical", "high", "medium", "low", "info")
+
+
+def finding(severity: str, message: str, file: Optional[str] = None, line: Optional[int] = None,
+            rule: Optional[str] = None) -> dict:
+    """One entry of Result.findings (file is relative to the project)."""
+    return {"severity": severity, "message": message, "file": file, "line": line, "rule": rule}
+
+
+def marked_severity(message: str, default: str = "info") -> str:
+    """Severity of a "[X] ..." / "[!] ..." style message."""
+    if message.startswith("[X]") or message.startswith("[!!]"):
+        return "high"
+    if message.startswith("[!]"):
+        return "medium"
+    return default
+
+
+class Result:
+    """Outcome of one check.
+
+    passed: the check's verdict (skipped checks count as passed, cancelled ones do not).
+    report: the script's structured summary (its JSON output as a dict).
+    findings: finding() dicts, most severe first once sorted by to_dict().
+    files_scanned / cache_hits: scan_engine statistics, when the check scans files.
+    changed_since: git ref when the scan only covered files changed since it
+        (the verdict then says nothing about unchanged files).
+    error: failure detail - exception text, stderr or a short reason.
+    output: raw stdout in subprocess mode, empty in-process.
+    mode: "inprocess" or "subprocess".
+    """
+
+    __slots__ = ("name", "passed", "report", "findings", "files_scanned", "cache_hits", "error",
+                 "output", "skipped", "cancelled", "duration", "mode", "changed_since")
+
+    def __init__(self, passed: bool, report: Optional[dict] = None, error: str = "",
+                 output: str = "", skipped: bool = False, name: str = "",
+                 findings: Optional[List[dict]] = None, files_scanned: int = 0):
+        self.name = name
+        self.passed = passed
+        self.report = report or {}
+        self.findings = findings or []
+        self.files_scanned = files_scanned
+        self.cache_hits = 0
+        self.error = error
+        self.output = output
+        self.skipped = skipped
+        self.cancelled = False
+        self.duration = 0.0
+        self.mode = "inprocess"
+        self.changed_since: Optional[str] = None
+
+    def add_scan(self, results: Dict[str, ScanResult]) -> "Result":
+        """Record the file statistics of a scan_engine.scan() result."""
+        self.files_scanned += len({rel for r in results.values() for rel in r.files})
+        self.cache_hits += sum(r.cache_hits for r in results.values())
+        self.changed_since = self.changed_since or next(
+            (r.changed_since for r in results.values() if r.changed_since), None)
+        return self
+
+    def to_dict(self) -> dict:
+        findings = sorted(self.findings, key=lambda f: SEVERITIES.index(f["severity"]))
+        return {
+            "name": self.name,
+            "passed": self.passed,
+            "skipped": self.skipped,
+            "cancelled": self.cancelled,
+            "duration": self.duration,
+            "mode": self.mode,
+            "files_scanned": self.files_scanned,
+            "cache_hits": self.cache_hits,
+            "changed_since": self.changed_since,
+            "findings": findings,
+            "error": self.error,
+            "output": self.output,
+            "report": self.report,
+        }
+
+
+# ============================================================================
+#  EXTERNAL TOOLS
+# ============================================================================
+
+class Cancelled(Exception):
+    """Raised by run_tool() when the runner cancelled the check; let it propagate."""
+
+
+def _kill_on_cancel(proc: subprocess.Popen, cancel: threading.Event, killed: threading.Event):
+    """Kill proc as soon as cancel is set (returns when either happens)."""
+    while proc.poll() is None:
+        if cancel.wait(0.2):
+            if proc.poll() is None:
+                proc.kill()
+                killed.set()
+            return
+
+
+def _communicate(proc: subprocess.Popen, timeout: Optional[float],
+                 cancel: Optional[threading.Event]) -> tuple:
+    """(stdout, stderr, killed): wait for proc, killing it on timeout or cancellation."""
+    killed = threading.Event()
+    if cancel is not None:
+        threading.Thread(target=_kill_on_cancel, args=(proc, cancel, killed), daemon=True).start()
+    try:
+        stdout, stderr = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        raise
+    return stdout, stderr, killed.is_set()
+
+
+def run_tool(cmd: List[str], cwd=None, timeout: Optional[float] = None,
+             options: Optional[dict] = None) -> subprocess.CompletedProcess:
+    """subprocess.run(cmd, capture_output=True, text=True) that honours the check runner.
+
+    options["cancel"] kills the tool and raises Cancelled; options["deadline"]
+    (time.monotonic()) caps timeout. Raises FileNotFoundError and
+    subprocess.TimeoutExpired like subprocess.run.
+    """
+    options = options or {}
+    cancel = options.get("cancel")
+    deadline = options.get("deadline")
+    if deadline is not None:
+        remaining = max(0.0, deadline - time.monotonic())
+        timeout = remaining if timeout is None else min(timeout, remaining)
+    if cancel is not None and cancel.is_set():
+        raise Cancelled(f"{cmd[0]} not started")
+
+    proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                            encoding='utf-8', errors='replace')
+    stdout, stderr, killed = _communicate(proc, timeout, cancel)
+    if killed:
+        raise Cancelled(f"{cmd[0]} killed")
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+
+# ============================================================================
+#  RUNNERS
+# ============================================================================
+
+def _entry_point(script_path: Path):
+    """The script's run() function, or None if it only has a CLI."""
+    try:
+        source = script_path.read_text(encoding='utf-8', errors='replace')
+    except OSError:
+        return None
+    if "\ndef run(" not in source:  # don't import CLI-only scripts just to find out
+        return None
+    return getattr(load_plugin(script_path), "run", None)
+
+
+def _call_run(func, project_path: str, url: Optional[str], options: dict) -> Result:
+    try:
+        result = func(project_path, url, options)
+    except Cancelled as e:
+        result = Result(False, error=f"Cancelled: {e}")
+        result.cancelled = True
+        return result
+    except subprocess.TimeoutExpired as e:
+        return Result(False, error=f"Timeout (>{e.timeout:.0f}s)")
+    except SystemExit as e:
+        return Result(False, error=f"Check exited with status {e.code}")
+    except Exception:
+        return Result(False, error=traceback.format_exc(limit=5))
+    if not isinstance(result, Result):
+        return Result(False, error=f"run() returned {type(result).__name__}, expected Result")
+    return result
+
+
+def _run_inprocess(func, project_path: str, url: Optional[str], options: Optional[dict],
+                   timeout: float, cancel: Optional[threading.Event]) -> Result:
+    """Call run() on a worker thread so the timeout and cancel hold even if it never returns.
+
+    The check sees its own cancel event, set on timeout too, so run_tool()
+    calls stop; a check that ignores it is abandoned (the thread is a daemon).
+    """
+    stop = threading.Event()
+    deadline = time.monotonic() + timeout
+    options = dict(options or {}, cancel=stop, deadline=deadline)
+    outcome = []
+    worker = threading.Thread(target=lambda: outcome.append(_call_run(func, project_path, url, options)),
+                              daemon=True)
+    worker.start()
+    while worker.is_alive():
+        if cancel is not None and cancel.is_set():
+            stop.set()
+            worker.join(CANCEL_GRACE)
+            if not outcome:
+                result = Result(False, error="Cancelled: check did not stop")
+                result.cancelled = True
+                return result
+            break
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            stop.set()
+            return Result(False, error=f"Timeout (>{timeout:.0f}s)")
+        worker.join(min(remaining, 0.2))
+    return outcome[0]
+
+
+def _run_subprocess(script_path: Path, project_path: str, url: Optional[str],
+                    timeout: float, cancel: Optional[threading.Event]) -> Result:
+    cmd = [sys.executable, str(script_path), project_path]
+    if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
+        cmd.append(url)
+
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                            encoding='utf-8', errors='replace')
+    try:
+        stdout, stderr, killed = _communicate(proc, timeout, cancel)
+    except subprocess.TimeoutExpired:
+        result = Result(False, error=f"Timeout (>{timeout:.0f}s)")
+    else:
+        result = Result(proc.returncode == 0, _last_json(stdout), error=stderr, output=stdout)
+        result.cancelled = killed
+    result.mode = "subprocess"
+    return result
+
+
+def _last_json(stdout: str) -> dict:
+    """The JSON object a script printed last, if any (the repo's report convention)."""
+    start = stdout.rfind("\n{")
+    start = start + 1 if start >= 0 else (0 if stdout.startswith("{") else -1)
+    if start < 0:
+        return {}
+    try:
+        report = json.loads(stdout[start:])
+    except ValueError:
+        return {}
+    return report if isinstance(report, dict) else {}
+
+
+def run_check(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+              options: Optional[dict] = None, isolate: bool = False,
+              timeout: float = DEFAULT_TIMEOUT, cancel: Optional[threading.Event] = None) -> Result:
+    """Run one validation script and return its Result.
+
+    `cancel` and `timeout` kill a subprocess check; an in-process check is
+    abandoned and its run_tool() calls killed (see _run_inprocess). Only a
+    check that was actually stopped comes back cancelled, and a cancelled
+    check has not passed.
+    """
+    script_path = Path(script_path)
+    if not script_path.is_file():
+        return Result(True, skipped=True, name=name, error="Script not found")
+
+    start_time = datetime.now()
+    func = None if isolate else _entry_point(script_path)
+    try:
+        if func is not None:
+            result = _run_inprocess(func, project_path, url, options, timeout, cancel)
+        else:
+            result = _run_subprocess(script_path, project_path, url, timeout, cancel)
+    except Exception as e:
+        result = Result(False, error=str(e))
+    result.name = name
+    result.duration = (datetime.now() - start_time).total_seconds()
+    if result.cancelled:
+        result.passed = False
+    return result
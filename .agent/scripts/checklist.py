@@ -21,11 +21,13 @@ Priority Order:
 """
 
 import sys
-import subprocess
+import os
 import argparse
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+from check_runner import run_check
+
 # ANSI colors for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -73,12 +75,16 @@ def check_script_exists(script_path: Path) -> bool:
     """Check if script file exists"""
     return script_path.exists() and script_path.is_file()
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               isolate: bool = False) -> dict:
     """
     Run a validation script and capture results
     
+    Scripts that define run() are called in-process (see check_runner.py);
+    others, or all of them with isolate, run as a subprocess.
+    
     Returns:
-        dict with keys: name, passed, output, skipped
+        dict with keys: name, passed, output, skipped, report, error
     """
     if not check_script_exists(script_path):
         print_warning(f"{name}: Script not found, skipping")
@@ -86,46 +92,18 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
     
     print_step(f"Running: {name}")
     
-    # Build command
-    cmd = ["python", str(script_path), project_path]
-    if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
-        cmd.append(url)
-    
-    # Run script
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
-        
-        passed = result.returncode == 0
-        
-        if passed:
-            print_success(f"{name}: PASSED")
-        else:
-            print_error(f"{name}: FAILED")
-            if result.stderr:
-                print(f"  Error: {result.stderr[:200]}")
-        
-        return {
-            "name": name,
-            "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
-            "skipped": False
-        }
-    
-    except subprocess.TimeoutExpired:
-        print_error(f"{name}: TIMEOUT (>5 minutes)")
-        return {"name": name, "passed": False, "output": "", "error": "Timeout", "skipped": False}
-    
-    except Exception as e:
-        print_error(f"{name}: ERROR - {str(e)}")
-        return {"name": name, "passed": False, "output": "", "error": str(e), "skipped": False}
-
-def print_summary(results: List[dict]):
+    result = run_check(name, script_path, project_path, url, isolate=isolate, timeout=300)  # 5 minute timeout
+    
+    if result.passed:
+        print_success(f"{name}: PASSED" + (" (changed files only)" if result.changed_since else ""))
+    else:
+        print_error(f"{name}: FAILED")
+        if result.error:
+            print(f"  Error: {result.error[:200]}")
+    
+    return result.to_dict()
+
+def print_summary(results: List[dict], changed_since: Optional[str] = None):
     """Print final summary report"""
     print_header("📊 CHECKLIST SUMMARY")
     
@@ -137,6 +115,9 @@ def print_summary(results: List[dict]):
     print(f"{Colors.GREEN}✅ Passed: {passed_count}{Colors.ENDC}")
     print(f"{Colors.RED}❌ Failed: {failed_count}{Colors.ENDC}")
     print(f"{Colors.YELLOW}⏭️  Skipped: {skipped_count}{Colors.ENDC}")
+    if changed_since:
+        print_warning(f"Partial run: file auditors only checked files changed since {changed_since}; "
+                      "findings in unchanged files were not re-checked")
     print()
     
     # Detailed results
@@ -167,16 +148,28 @@ def main():
 Examples:
   python scripts/checklist.py .                      # Core checks only
   python scripts/checklist.py . --url http://localhost:3000  # Include performance
+  python scripts/checklist.py . --changed-since HEAD         # Pre-commit: changed files only
         """
     )
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", help="URL for performance checks (lighthouse, playwright)")
     parser.add_argument("--skip-performance", action="store_true", help="Skip performance checks even if URL provided")
+    parser.add_argument("--changed-since", metavar="GIT_REF",
+                        help="File auditors only check files changed since this git ref")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the file auditors' result cache")
+    parser.add_argument("--isolate", action="store_true",
+                        help="Run every check as a subprocess instead of importing it")
     
     args = parser.parse_args()
     
     project_path = Path(args.project).resolve()
     
+    # Read by scan_engine in every auditor launched below
+    if args.changed_since:
+        os.environ["AUDIT_CHANGED_SINCE"] = args.changed_since
+    if args.no_cache:
+        os.environ["AUDIT_CACHE"] = "0"
+    
     if not project_path.exists():
         print_error(f"Project path does not exist: {project_path}")
         sys.exit(1)
@@ -184,6 +177,8 @@ Examples:
     print_header("🚀 ANTIGRAVITY KIT - MASTER CHECKLIST")
     print(f"Project: {project_path}")
     print(f"URL: {args.url if args.url else 'Not provided (performance checks skipped)'}")
+    if args.changed_since:
+        print(f"Changed since: {args.changed_since} (partial run - unchanged files are not audited)")
     
     results = []
     
@@ -191,13 +186,13 @@ Examples:
     print_header("📋 CORE CHECKS")
     for name, script_path, required in CORE_CHECKS:
         script = project_path / script_path
-        result = run_script(name, script, str(project_path))
+        result = run_script(name, script, str(project_path), isolate=args.isolate)
         results.append(result)
         
         # If required check fails, stop
         if required and not result["passed"] and not result.get("skipped"):
             print_error(f"CRITICAL: {name} failed. Stopping checklist.")
-            print_summary(results)
+            print_summary(results, args.changed_since)
             sys.exit(1)
     
     # Run performance checks if URL provided
@@ -205,11 +200,11 @@ Examples:
         print_header("⚡ PERFORMANCE CHECKS")
         for name, script_path, required in PERFORMANCE_CHECKS:
             script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
+            result = run_script(name, script, str(project_path), args.url, args.isolate)
             results.append(result)
     
     # Print summary
-    all_passed = print_summary(results)
+    all_passed = print_summary(results, args.changed_since)
     
     sys.exit(0 if all_passed else 1)
 
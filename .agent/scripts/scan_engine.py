@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""
+Scan Engine - Antigravity Kit
+=============================
+
+Shared file-scanning engine for the skill auditors. The project tree is
+walked once, every file any registered checker wants is read once (thread
+pool, mmap for large files), and its content is dispatched to each checker
+that accepts it. On large trees the checkers run in a process pool so the
+regex-heavy audits use every core.
+
+Each auditor script is a plugin: it exposes a ``CHECKERS`` list of
+``Checker`` objects and a ``collect(project_path, results)`` function that
+turns the per-file results into the JSON summary the script prints.
+
+Usage:
+    python scripts/scan_engine.py .                     # All auditors, one pass
+    python scripts/scan_engine.py . --only ux,security  # Selected auditors
+    python scripts/scan_engine.py . --json              # Machine-readable output
+    python scripts/scan_engine.py . --changed-since main  # Only files changed vs a git ref
+
+Per-file results are cached under .agent/.cache/audit/, keyed by checker
+version and file content hash, so unchanged files are not re-checked.
+The AUDIT_CACHE=0 and AUDIT_CHANGED_SINCE=<ref> environment variables set
+the same options for auditors launched as separate scripts.
+"""
+
+import sys
+import os
+import json
+import mmap
+import hashlib
+import argparse
+import subprocess
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+# Fix Windows console encoding
+try:
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+except AttributeError:
+    pass
+
+
+# ============================================================================
+#  CONFIGURATION
+# ============================================================================
+
+AGENT_DIR = Path(__file__).resolve().parent.parent
+
+# Auditor plugins, relative to .agent/
+PLUGINS = {
+    "security": "skills/vulnerability-scanner/scripts/security_scan.py",
+    "ux": "skills/frontend-design/scripts/ux_audit.py",
+    "accessibility": "skills/frontend-design/scripts/accessibility_checker.py",
+    "seo": "skills/seo-fundamentals/scripts/seo_checker.py",
+    "geo": "skills/geo-fundamentals/scripts/geo_checker.py",
+    "mobile": "skills/mobile-design/scripts/mobile_audit.py",
+    "i18n": "skills/i18n-localization/scripts/i18n_checker.py",
+}
+
+DEFAULT_SKIP_DIRS = frozenset({'node_modules', '.git', 'dist', 'build', '.next'})
+MMAP_THRESHOLD = 1 << 20          # Files this large are read through mmap
+PROCESS_MIN_BYTES = 1 << 20       # Below this much content, check in-process
+CHUNK_BYTES = 256 << 10           # Content per process-pool task
+READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+CACHE_DIR = AGENT_DIR / ".cache" / "audit"
+CACHE_FORMAT = 1                  # Bump to invalidate every cached result
+# Shared modules whose code shapes every checker's results (part of the cache key)
+ENGINE_SOURCES = ("scan_engine.py", "source_facts.py", "check_runner.py")
+
+
+class Checker:
+    """A per-file check registered by an auditor plugin.
+
+    ``func(rel_path, content)`` must be a module-level function so it can be
+    dispatched to worker processes; its return value must be picklable.
+    With a ``limit``, files are taken in ``extensions`` order and then in
+    the order ``Path.glob`` would find them, so pass an ordered sequence
+    rather than a set.
+    """
+
+    __slots__ = ("name", "func", "extensions", "names", "skip_dirs", "accept", "limit", "version")
+
+    def __init__(self, name: str, func: Callable[[str, str], object],
+                 extensions: Iterable[str] = (), names: Iterable[str] = (),
+                 skip_dirs: Iterable[str] = DEFAULT_SKIP_DIRS,
+                 accept: Optional[Callable[[Path], bool]] = None,
+                 limit: Optional[int] = None, version: str = ""):
+        self.name = name
+        self.func = func
+        self.extensions = tuple(dict.fromkeys(ext.lower() for ext in extensions))
+        self.names = frozenset(names)
+        self.skip_dirs = frozenset(skip_dirs)
+        self.accept = accept
+        self.limit = limit
+        self.version = version
+
+    def wants(self, rel_path: Path) -> bool:
+        """True if this checker should see the file at ``rel_path``."""
+        if rel_path.suffix.lower() not in self.extensions and rel_path.name not in self.names:
+            return False
+        if any(part in self.skip_dirs for part in rel_path.parts[:-1]):
+            return False
+        return self.accept is None or self.accept(rel_path)
+
+    def rank(self, rel_path: Path) -> int:
+        """Position of the file's extension in this checker's extension list."""
+        suffix = rel_path.suffix.lower()
+        return self.extensions.index(suffix) if suffix in self.extensions else len(self.extensions)
+
+    def fingerprint(self) -> str:
+        """Cache version: changes with the plugin's source, the engine's or its explicit version."""
+        key = f"{CACHE_FORMAT}:{self.name}:{self.version}:".encode("utf-8")
+        key += _source_bytes(Path(self.func.__code__.co_filename)) + _engine_code()
+        return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+
+def _source_bytes(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return b""
+
+
+_engine_code_bytes: Optional[bytes] = None
+
+
+def _engine_code() -> bytes:
+    """The ENGINE_SOURCES, read once per process."""
+    global _engine_code_bytes
+    if _engine_code_bytes is None:
+        scripts = Path(__file__).resolve().parent
+        _engine_code_bytes = b"\0".join(_source_bytes(scripts / name) for name in ENGINE_SOURCES)
+    return _engine_code_bytes
+
+
+class ScanResult:
+    """Per-checker output: the files it saw and one result per readable file."""
+
+    __slots__ = ("files", "results", "errors", "matched", "cache_hits", "changed_since")
+
+    def __init__(self):
+        self.files: List[str] = []
+        self.results: list = []
+        self.errors: List[tuple] = []   # (rel_path, message) for unreadable files
+        self.matched = 0                # Files accepted before any limit applied
+        self.cache_hits = 0             # Results reused from the audit cache
+        self.changed_since = None       # Git ref when only changed files were scanned (partial)
+
+    def items(self):
+        return zip(self.files, self.results)
+
+
+# ============================================================================
+#  ENUMERATION & READING
+# ============================================================================
+
+def walk_files(root: Path, skip_dirs: Iterable[str] = ()) -> Iterable[tuple]:
+    """Yield (relative path, size) for every file under root.
+
+    Files come in ``Path.glob("**/*")`` order: each directory's files in
+    os.scandir order, then its subdirectories depth-first. The audit cache
+    directory is never yielded.
+    """
+    skip_dirs = set(skip_dirs)
+    cache_dir = str(CACHE_DIR.parent)
+    stack = [(root, Path())]
+    while stack:
+        directory, rel_dir = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip_dirs and entry.path != cache_dir:
+                        subdirs.append((entry.path, rel_dir / entry.name))
+                elif entry.is_file():
+                    yield rel_dir / entry.name, entry.stat().st_size
+            except OSError:
+                continue
+        stack.extend(reversed(subdirs))
+
+
+def read_text(path: Path) -> str:
+    """Read a file as UTF-8 text with universal newlines, like open(path, 'r').
+
+    Large files are mapped instead of buffered.
+    """
+    return _load(path)[0]
+
+
+def _load(path: Path) -> tuple:
+    """(text, content hash) of a file."""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest = hashlib.blake2b(mapped, digest_size=16).hexdigest()
+                text = str(mapped, 'utf-8', 'replace')
+        else:
+            raw = f.read()
+            digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+            text = raw.decode('utf-8', 'replace')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text, digest
+
+
+def _read(path: Path):
+    try:
+        return _load(path) + (None,)
+    except (OSError, ValueError) as e:
+        return None, None, str(e)
+
+
+def changed_files(root: Path, ref: str) -> set:
+    """Paths under root (relative to it) that differ from a git ref, plus untracked files."""
+    commands = [
+        ["git", "-C", str(root), "diff", "--name-only", "--relative", ref, "--"],
+        ["git", "-C", str(root), "ls-files", "--others", "--exclude-standard"],
+    ]
+    changed = set()
+    for cmd in commands:
+        try:
+            proc = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            raise ValueError(f"git unavailable: {e}")
+        if proc.returncode != 0:
+            raise ValueError(proc.stderr.strip() or f"git failed for ref {ref!r}")
+        changed.update(Path(line) for line in proc.stdout.splitlines() if line)
+    return changed
+
+
+# ============================================================================
+#  AUDIT CACHE
+# ============================================================================
+
+class AuditCache:
+    """Per-checker results for one project, keyed by path and content hash.
+
+    Stored as JSON under CACHE_DIR; a changed checker fingerprint discards it.
+    """
+
+    def __init__(self, root: Path, checker: Checker):
+        root_key = hashlib.blake2b(str(root).encode("utf-8"), digest_size=6).hexdigest()
+        self.path = CACHE_DIR / f"{checker.name.replace(':', '-')}-{root_key}.json"
+        self.version = checker.fingerprint()
+        self.entries: Dict[str, list] = {}
+        self.seen = set()
+        self.dirty = False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == self.version:
+                self.entries = data["entries"]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+
+    def lookup(self, rel: str, digest: str):
+        """The cached result for this exact content, or None."""
+        self.seen.add(rel)
+        entry = self.entries.get(rel)
+        return entry[1] if entry and entry[0] == digest else None
+
+    def store(self, rel: str, digest: str, result) -> None:
+        self.entries[rel] = [digest, result]
+        self.dirty = True
+
+    def save(self, prune: bool = True) -> None:
+        """Write back if anything changed; prune drops files this scan did not see."""
+        if prune and len(self.seen) != len(self.entries):
+            self.entries = {rel: entry for rel, entry in self.entries.items() if rel in self.seen}
+            self.dirty = True
+        if not self.dirty:
+            return
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"version": self.version, "entries": self.entries}), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except (OSError, TypeError, ValueError):
+            pass  # The cache is an optimization; never fail a scan over it
+
+
+# ============================================================================
+#  DISPATCH
+# ============================================================================
+
+_LOADED: Dict[str, object] = {}
+
+
+def load_plugin(script: Path):
+    """Import an auditor script by path (cached per process)."""
+    key = str(Path(script).resolve())
+    module = _LOADED.get(key)
+    if module is None:
+        name = f"_audit_plugin_{Path(key).stem}"
+        spec = importlib.util.spec_from_file_location(name, key)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _LOADED[key] = module
+    return module
+
+
+def _select(tree: list, checker: Checker) -> tuple:
+    """(files accepted, indexes into tree that the checker will scan, in scan order)."""
+    matches = [i for i, (rel, _) in enumerate(tree) if checker.wants(rel)]
+    if checker.limit is None:
+        return len(matches), matches
+    return len(matches), sorted(matches, key=lambda i: checker.rank(tree[i][0]))[:checker.limit]
+
+
+def find_files(root, checker: Checker) -> List[Path]:
+    """The files scan() would hand to this checker, as absolute paths."""
+    root = Path(root).resolve()
+    tree = list(walk_files(root, checker.skip_dirs))
+    return [root / tree[i][0] for i in _select(tree, checker)[1]]
+
+
+def scan_options(options: Optional[dict]) -> dict:
+    """The scan() keyword arguments found in a check-runner options dict."""
+    return {k: options[k] for k in ("processes", "use_cache", "changed_since") if options and k in options}
+
+
+def _check_chunk(tasks: list) -> list:
+    """Worker entry point: tasks are (script, function, rel_path, content)."""
+    return [getattr(load_plugin(script), func)(rel, content) for script, func, rel, content in tasks]
+
+
+def _task_target(checker: Checker) -> tuple:
+    return checker.func.__code__.co_filename, checker.func.__name__
+
+
+def scan(root, checkers: List[Checker], processes: Optional[int] = None,
+         use_cache: Optional[bool] = None, changed_since: Optional[str] = None) -> Dict[str, ScanResult]:
+    """Walk root once and run every checker over the files it accepts.
+
+    processes: worker processes for the checks; None picks one per CPU when
+    the tree is large enough to amortize startup, 0 forces in-process.
+    use_cache: reuse results for unchanged files (default: AUDIT_CACHE != "0").
+    changed_since: only scan files that differ from this git ref
+    (default: AUDIT_CHANGED_SINCE); the results are then partial and record
+    the ref in ScanResult.changed_since. Raises ValueError if git cannot answer.
+    """
+    root = Path(root).resolve()
+    if use_cache is None:
+        use_cache = os.environ.get("AUDIT_CACHE", "1") != "0"
+    if changed_since is None:
+        changed_since = os.environ.get("AUDIT_CHANGED_SINCE") or None
+    results = {c.name: ScanResult() for c in checkers}
+    for result in results.values():
+        result.changed_since = changed_since or None
+    prune = frozenset.intersection(*(c.skip_dirs for c in checkers)) if checkers else frozenset()
+
+    # Enumerate once, then give each checker its files (a limited checker keeps
+    # the first `limit` in extension order, matching the per-pattern globs it replaced)
+    tree = list(walk_files(root, prune))
+    if changed_since:
+        changed = changed_files(root, changed_since)
+        tree = [(rel, size) for rel, size in tree if rel in changed]
+    wanted = [[] for _ in tree]
+    glob_order = {}
+    for checker in checkers:
+        results[checker.name].matched, selected = _select(tree, checker)
+        for i in selected:
+            wanted[i].append(checker)
+        if checker.limit is not None:
+            glob_order[checker.name] = {str(tree[i][0]): n for n, i in enumerate(selected)}
+    plan = [(rel, checkers_for) for (rel, _), checkers_for in zip(tree, wanted) if checkers_for]
+    total_bytes = sum(size for (_, size), checkers_for in zip(tree, wanted) if checkers_for)
+
+    if processes is None:
+        cpus = os.cpu_count() or 1
+        processes = cpus if cpus > 1 and total_bytes >= PROCESS_MIN_BYTES else 0
+    caches = {c.name: AuditCache(root, c) for c in checkers} if use_cache else {}
+
+    pool = None       # Started on the first cache miss, if processes are wanted
+    futures, pending = [], []
+    chunk, chunk_keys, chunk_bytes = [], [], 0
+    try:
+        with ThreadPoolExecutor(max_workers=READ_WORKERS) as readers:
+            for (rel, wanted), (content, digest, error) in zip(plan, readers.map(_read, [root / r for r, _ in plan])):
+                rel = str(rel)
+                for checker in wanted:
+                    result = results[checker.name]
+                    if content is None:
+                        result.errors.append((rel, error))
+                        continue
+                    cache = caches.get(checker.name)
+                    cached = cache.lookup(rel, digest) if cache else None
+                    result.files.append(rel)
+                    if cached is not None:
+                        result.results.append(cached)
+                        result.cache_hits += 1
+                    elif not processes:
+                        value = checker.func(rel, content)
+                        result.results.append(value)
+                        if cache:
+                            cache.store(rel, digest, value)
+                    else:
+                        result.results.append(None)
+                        chunk.append(_task_target(checker) + (rel, content))
+                        chunk_keys.append((checker.name, len(result.results) - 1, rel, digest))
+                        chunk_bytes += len(content)
+                if chunk_bytes >= CHUNK_BYTES:
+                    pool = pool or ProcessPoolExecutor(max_workers=processes)
+                    futures.append(pool.submit(_check_chunk, chunk))
+                    pending.append(chunk_keys)
+                    chunk, chunk_keys, chunk_bytes = [], [], 0
+        if chunk:
+            pool = pool or ProcessPoolExecutor(max_workers=processes)
+            futures.append(pool.submit(_check_chunk, chunk))
+            pending.append(chunk_keys)
+
+        for future, keys in zip(futures, pending):
+            for (name, index, rel, digest), value in zip(keys, future.result()):
+                results[name].results[index] = value
+                if name in caches:
+                    caches[name].store(rel, digest, value)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    # Limited checkers report in the order their globs found the files
+    for name, order in glob_order.items():
+        result = results[name]
+        pairs = sorted(zip(result.files, result.results), key=lambda pair: order[pair[0]])
+        result.files = [rel for rel, _ in pairs]
+        result.results = [value for _, value in pairs]
+        result.errors.sort(key=lambda error: order[error[0]])
+
+    for cache in caches.values():
+        cache.save(prune=not changed_since)
+    return results
+
+
+# ============================================================================
+#  MAIN
+# ============================================================================
+
+def run_plugins(project_path, names: List[str], processes: Optional[int] = None,
+                use_cache: Optional[bool] = None, changed_since: Optional[str] = None) -> Dict[str, dict]:
+    """Run several auditors over one shared scan and return their summaries."""
+    plugins = {name: load_plugin(AGENT_DIR / PLUGINS[name]) for name in names}
+    checkers = [c for module in plugins.values() for c in module.CHECKERS]
+    results = scan(project_path, checkers, processes, use_cache, changed_since)
+    return {name: module.collect(str(project_path), results) for name, module in plugins.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run skill auditors over one shared file scan")
+    parser.add_argument("project", nargs="?", default=".", help="Project path to scan")
+    parser.add_argument("--only", help=f"Comma-separated auditors ({', '.join(PLUGINS)})")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="Worker processes (default: auto, 0 = in-process)")
+    parser.add_argument("--json", action="store_true", help="Print JSON only")
+    parser.add_argument("--changed-since", metavar="GIT_REF", help="Only scan files changed since this git ref")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the audit cache")
+    args = parser.parse_args()
+
+    project_path = Path(args.project).resolve()
+    if not project_path.is_dir():
+        print(json.dumps({"error": f"Directory not found: {project_path}"}))
+        sys.exit(1)
+
+    names = [n.strip() for n in args.only.split(",")] if args.only else list(PLUGINS)
+    unknown = [n for n in names if n not in PLUGINS]
+    if unknown:
+        parser.error(f"unknown auditor(s): {', '.join(unknown)}")
+
+    try:
+        summaries = run_plugins(project_path, names, args.processes,
+                                use_cache=False if args.no_cache else None, changed_since=args.changed_since)
+    except ValueError as e:
+        print(json.dumps({"error": f"--changed-since: {e}"}))
+        sys.exit(1)
+    all_passed = all(s.get("passed", True) for s in summaries.values())
+    changed_since = args.changed_since or os.environ.get("AUDIT_CHANGED_SINCE") or None
+
+    if args.json:
+        print(json.dumps({"project": str(project_path), "passed": all_passed, "partial": bool(changed_since),
+                          "changed_since": changed_since, "auditors": summaries}, indent=2))
+    else:
+        print(f"\n{'='*60}")
+        print(f"  SCAN ENGINE - {len(names)} auditors, one pass")
+        print(f"{'='*60}")
+        print(f"Project: {project_path}")
+        if changed_since:
+            print(f"[!] Partial run: only files changed since {changed_since} were audited")
+        print("-" * 60)
+        for name, summary in summaries.items():
+            status = "[OK]" if summary.get("passed", True) else "[X]"
+            print(f"{status} {name}")
+        print("-" * 60)
+        print("PASSED" if all_passed else "FAILED")
+
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
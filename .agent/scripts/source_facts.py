@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Source Facts - Antigravity Kit
+==============================
+
+Tokenizes one JS/TS(X), CSS, HTML/Vue/Svelte or Dart file into a compact
+fact table that the file auditors query instead of regexing raw source:
+
+    text          the source with comments blanked (offsets and lines kept)
+    code          text with string literal contents blanked as well
+    elements      tags and their attributes (JSX / HTML)
+    classes       class tokens: class/className attributes, cn()/clsx()/cva()
+                  arguments and @apply
+    declarations  CSS (property, value, offset): stylesheets, <style> blocks,
+                  style="" attributes and template literals (CSS-in-JS)
+    imports       module specifiers: import/export ... from, require(), import()
+
+The tokenizer is a single regex pass per file; everything past text is
+built on first use. Tables are memoized per content hash, so auditors that
+see the same file in one scan (ux_audit and mobile_audit on .tsx/.jsx)
+tokenize it once.
+
+Usage (from a skill script):
+    from source_facts import extract
+
+    facts = extract(content, Path(rel_path).suffix)
+    if any(el.tag == "img" and "alt" not in el.attrs for el in facts.elements):
+        ...
+"""
+
+import re
+import hashlib
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Auditors add this to their Checker version so cached results follow the extractor
+VERSION = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+MEMO_SIZE = 32                    # Fact tables kept per process
+
+LANGUAGES = {
+    '.css': 'css', '.scss': 'css', '.sass': 'css', '.less': 'css',
+    '.html': 'markup', '.htm': 'markup', '.vue': 'markup', '.svelte': 'markup',
+    '.dart': 'dart',
+}                                 # Anything else is tokenized as JS/TS
+
+
+# ============================================================================
+#  TOKENIZER
+# ============================================================================
+
+# Strings end at the line if unterminated. Patterns are unrolled ("[^"\\]*(?:\\.[^"\\]*)*")
+# and start with a lookahead on the first character, which lets re skip plain code quickly.
+_STRING = r'"[^"\\\n]*(?:\\.[^"\\\n]*)*"?|\'[^\'\\\n]*(?:\\.[^\'\\\n]*)*\'?'
+_TEMPLATE = r'`[^`\\]*(?:\\.[^`\\]*)*`?'
+_BLOCK_COMMENT = r'/\*.*?(?:\*/|\Z)'
+
+TOKENS = {
+    'script': re.compile(rf'(?=[/"\'`])(?:(?P<comment>{_BLOCK_COMMENT}|//[^\n]*)|(?P<string>{_STRING}|{_TEMPLATE}))', re.S),
+    'dart': re.compile(rf'(?=[/"\'])(?:(?P<comment>{_BLOCK_COMMENT}|//[^\n]*)'
+                       rf'|(?P<string>\'\'\'.*?(?:\'\'\'|\Z)|""".*?(?:"""|\Z)|{_STRING}))', re.S),
+    'css': re.compile(rf'(?=[/"\'])(?:(?P<comment>{_BLOCK_COMMENT})|(?P<string>{_STRING}))', re.S),
+}
+# "//" that is page copy rather than a comment: a URL, or JSX text right after a tag
+URL_SCHEME = re.compile(r'(?<![\w.+-])(?:https?|s?ftp|wss?|file):$')
+JSX_TEXT_START = re.compile(r'(?:<[A-Za-z][\w.:-]*(?:\s[^<>]*)?|</[A-Za-z][\w.:-]*\s*|<)>$')
+CODE_CHARS = frozenset(';{}()=<>')
+MARKUP_BLOCKS = re.compile(r'<!--.*?(?:-->|\Z)|<(script|style)\b[^>]*>(.*?)(?:</\1\s*>|\Z)', re.S | re.I)
+NOT_NEWLINE = re.compile(r'[^\n]')
+
+
+def _is_jsx_text(source: str, start: int) -> bool:
+    """True if the "//" at start is not a JS comment: a URL or text between JSX tags."""
+    line_start = source.rfind('\n', 0, start) + 1
+    if URL_SCHEME.search(source, max(line_start, start - 8), start):
+        return True
+    # Walk back over plain text to the last code character; JSX text follows a tag's ">"
+    gt = start - 1
+    while gt >= 0 and source[gt] not in CODE_CHARS:
+        gt -= 1
+    return gt >= 0 and source[gt] == '>' and bool(JSX_TEXT_START.search(source, max(0, gt - 300), gt + 1))
+
+
+def _blank(s: str) -> str:
+    return NOT_NEWLINE.sub(' ', s) if '\n' in s else ' ' * len(s)
+
+
+def _blank_string(token: str) -> str:
+    """A string token with its contents blanked and its delimiters kept."""
+    quote = token[:3] if token[:3] in ("'''", '"""') else token[0]
+    if len(token) >= 2 * len(quote) and token.endswith(quote):
+        return quote + _blank(token[len(quote):-len(quote)]) + quote
+    return quote + _blank(token[len(quote):])
+
+
+def _tokenize(source: str, language: str, base: int, text: list, strings: list, css: list) -> None:
+    """Append source to text with comments blanked; record string and CSS spans (absolute offsets)."""
+    if language == 'css':
+        css.append((base, base + len(source)))
+    pattern = TOKENS[language]
+    pos = 0
+    m = pattern.search(source)
+    while m:
+        start, end = m.span()
+        if m.lastgroup == 'comment':
+            if language == 'script' and source.startswith('//', start) and _is_jsx_text(source, start):
+                m = pattern.search(source, start + 2)
+                continue
+            text.append(source[pos:start])
+            text.append(_blank(m.group()))
+            pos = end
+        else:
+            strings.append((base + start, base + end))
+            if language == 'script' and source[start] == '`':
+                closed = end - start > 1 and source[end - 1] == '`'
+                css.append((base + start + 1, base + end - (1 if closed else 0)))
+        m = pattern.search(source, end)
+    text.append(source[pos:])
+
+
+def _tokenize_markup(content: str, text: list, strings: list, css: list) -> None:
+    """HTML comments are blanked; <script> and <style> bodies use their own tokenizer."""
+    pos = 0
+    for m in MARKUP_BLOCKS.finditer(content):
+        text.append(content[pos:m.start()])
+        if m.group(1) is None:
+            text.append(_blank(m.group()))
+        else:
+            text.append(content[m.start():m.start(2)])
+            language = 'script' if m.group(1).lower() == 'script' else 'css'
+            _tokenize(m.group(2), language, m.start(2), text, strings, css)
+            text.append(content[m.end(2):m.end()])
+        pos = m.end()
+    text.append(content[pos:])
+
+
+# ============================================================================
+#  FACT TABLE
+# ============================================================================
+
+TAG = re.compile(r'<([A-Za-z][\w.:-]*)')
+ATTRIBUTE = re.compile(r'\s*([@:\w.-]+)\s*(=)?\s*')
+UNQUOTED = re.compile(r'[^\s"\'=<>`{}]+')
+SPACE = re.compile(r'\s*')
+NESTING = re.compile(rf'[(){{}}]|(?=["\'`])(?:{_STRING}|{_TEMPLATE})')
+STRING_LITERAL = re.compile(r'"([^"\\]*)"|\'([^\'\\]*)\'|`([^`\\]*)`')
+CLASS_ATTRIBUTES = {'class', 'className', ':class', 'v-bind:class', 'class:list'}
+CLASS_HELPER = re.compile(r'[ct](?<![\w$][ct])(?:n|lsx|va|lass[Nn]ames|w|wMerge|wJoin)\s*\(')  # cn( clsx( cva( tw( ...
+APPLY = re.compile(r'@apply\s+([^;}]+)')
+DECLARATION = re.compile(r'(?<![\w-])(-{0,2}[A-Za-z][\w-]*)\s*:\s*([^;{}]*?)\s*(?=[;}]|\Z)')
+IMPORT = re.compile(r'(?:\bfrom|\bimport\s*\(?|\brequire\s*\()\s*([\'"])([^\'"\n]+)\1')
+
+
+class Element:
+    """One tag: name as written, attributes (None for valueless) and offset."""
+
+    __slots__ = ("tag", "attrs", "offset")
+
+    def __init__(self, tag: str, attrs: Dict[str, Optional[str]], offset: int):
+        self.tag = tag
+        self.attrs = attrs
+        self.offset = offset
+
+    def __repr__(self):
+        return f"Element({self.tag!r}, {self.attrs!r}, {self.offset})"
+
+
+def _closing(text: str, pos: int) -> int:
+    """Index just past the bracket closing the one at pos (string literals skipped), or -1."""
+    opening = text[pos]
+    closing = ')' if opening == '(' else '}'
+    depth = 0
+    for m in NESTING.finditer(text, pos):
+        token = m.group()
+        if token == opening:
+            depth += 1
+        elif token == closing:
+            depth -= 1
+            if depth == 0:
+                return m.end()
+    return -1
+
+
+def _scan_element(text: str, pos: int):
+    """(attributes, end) of the tag whose attributes start at pos, or None if it is not one."""
+    attrs = {}
+    while True:
+        pos = SPACE.match(text, pos).end()
+        if text.startswith('>', pos) or text.startswith('/>', pos):
+            return attrs, text.index('>', pos) + 1
+        if text.startswith('{', pos):  # {...spread}
+            pos = _closing(text, pos)
+            if pos < 0:
+                return None
+            continue
+        m = ATTRIBUTE.match(text, pos)
+        if not m:
+            return None
+        name, pos = m.group(1), m.end()
+        if not m.group(2):
+            attrs[name] = None
+            continue
+        quote = text[pos:pos + 1]
+        if quote in ('"', "'"):
+            end = text.find(quote, pos + 1)
+            if end < 0:
+                return None
+            attrs[name], pos = text[pos + 1:end], end + 1
+        elif quote == '{':
+            end = _closing(text, pos)
+            if end < 0:
+                return None
+            attrs[name], pos = text[pos:end], end
+        else:
+            m = UNQUOTED.match(text, pos)
+            if not m:
+                return None
+            attrs[name], pos = m.group(), m.end()
+
+
+def _class_literals(text: str, start: int, end: int, found: dict) -> None:
+    """Class names in the string literals of text[start:end], keyed by literal offset."""
+    for m in STRING_LITERAL.finditer(text, start, end):
+        found[m.start()] = [t for t in (m.group(1) or m.group(2) or m.group(3) or '').split()
+                            if '$' not in t and '{' not in t and '}' not in t]
+
+
+class SourceFacts:
+    """The fact table of one file; build it with extract()."""
+
+    __slots__ = ("language", "text", "_strings", "_css", "_code", "_elements", "_classes",
+                 "_declarations", "_imports", "_lines")
+
+    def __init__(self, content: str, language: str):
+        text, strings, css = [], [], []
+        if language == 'markup':
+            _tokenize_markup(content, text, strings, css)
+        else:
+            _tokenize(content, language, 0, text, strings, css)
+        self.language = language
+        self.text = ''.join(text)
+        self._strings = strings
+        self._css = css
+        self._code = self._elements = self._classes = self._declarations = self._imports = self._lines = None
+
+    @property
+    def code(self) -> str:
+        if self._code is None:
+            parts, pos = [], 0
+            for start, end in self._strings:
+                parts.append(self.text[pos:start])
+                parts.append(_blank_string(self.text[start:end]))
+                pos = end
+            parts.append(self.text[pos:])
+            self._code = ''.join(parts)
+        return self._code
+
+    def in_string(self, offset: int) -> bool:
+        """True if offset falls inside a string literal."""
+        i = bisect_right(self._strings, (offset, float('inf'))) - 1
+        return i >= 0 and self._strings[i][1] > offset
+
+    @property
+    def elements(self) -> List[Element]:
+        if self._elements is None:
+            self._elements = []
+            if self.language in ('script', 'markup'):
+                for m in TAG.finditer(self.text):
+                    scanned = _scan_element(self.text, m.end())
+                    if scanned is not None:
+                        self._elements.append(Element(m.group(1), scanned[0], m.start()))
+        return self._elements
+
+    @property
+    def classes(self) -> List[str]:
+        if self._classes is None:
+            found = {}  # Offset -> tokens, so a cn() inside className counts once
+            for el in self.elements:
+                for name, value in el.attrs.items():
+                    start = self.text.find(value, el.offset) if name in CLASS_ATTRIBUTES and value else -1
+                    if start < 0:
+                        continue
+                    if value[0] == '{':
+                        _class_literals(self.text, start, start + len(value), found)
+                    else:
+                        found[start] = value.split()
+            if self.language == 'script':
+                for m in CLASS_HELPER.finditer(self.text):
+                    if self.in_string(m.start()):
+                        continue
+                    end = _closing(self.text, m.end() - 1)
+                    _class_literals(self.text, m.end(), end if end >= 0 else len(self.text), found)
+            for start, end in self._css:
+                for m in APPLY.finditer(self.text, start, end):
+                    found[m.start(1)] = m.group(1).split()
+            self._classes = [token for _, tokens in sorted(found.items()) for token in tokens]
+        return self._classes
+
+    @property
+    def declarations(self) -> List[tuple]:
+        """(property in lowercase, value, offset) for every CSS declaration."""
+        if self._declarations is None:
+            spans = list(self._css)
+            for el in self.elements:
+                style = el.attrs.get('style')
+                if style and style[:1] != '{':
+                    start = self.text.find(style, el.offset)
+                    if start >= 0:
+                        spans.append((start, start + len(style)))
+            decls = []
+            for start, end in spans:
+                for m in DECLARATION.finditer(self.text[start:end]):
+                    decls.append((m.group(1).lower(), m.group(2), start + m.start()))
+            self._declarations = decls
+        return self._declarations
+
+    @property
+    def imports(self) -> List[str]:
+        if self._imports is None:
+            self._imports = [m.group(2) for m in IMPORT.finditer(self.text)]
+        return self._imports
+
+    def values(self, *properties: str) -> List[str]:
+        """Values of the CSS declarations of these properties, in source order."""
+        return [value for prop, value, _ in self.declarations if prop in properties]
+
+    def line_of(self, offset: int) -> int:
+        """1-based line number of an offset into the content."""
+        if self._lines is None:
+            self._lines = [m.end() for m in re.finditer(r'\n', self.text)]
+        return bisect_right(self._lines, offset) + 1
+
+
+_MEMO: "OrderedDict[tuple, SourceFacts]" = OrderedDict()
+_MEMO_LOCK = threading.Lock()     # verify_all runs in-process checks on threads
+
+
+def extract(content: str, suffix: str = "") -> SourceFacts:
+    """The fact table for content, tokenized as the language of a file suffix."""
+    language = LANGUAGES.get(suffix.lower(), 'script')
+    key = (hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest(), language)
+    with _MEMO_LOCK:
+        facts = _MEMO.get(key)
+        if facts is not None:
+            _MEMO.move_to_end(key)
+            return facts
+    facts = SourceFacts(content, language)
+    with _MEMO_LOCK:
+        _MEMO[key] = facts
+        if len(_MEMO) > MEMO_SIZE:
+            _MEMO.popitem(last=False)
+    return facts
@@ -0,0 +1,6 @@
+"""Put .agent/scripts on sys.path so tests import the runners like the CLIs do."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
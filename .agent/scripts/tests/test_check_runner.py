@@ -0,0 +1,78 @@
+"""check_runner: skill scripts run in-process end to end."""
+
+import threading
+import time
+from pathlib import Path
+
+import check_runner
+
+SKILLS_DIR = Path(__file__).resolve().parents[2] / "skills"
+TEST_RUNNER = SKILLS_DIR / "testing-patterns" / "scripts" / "test_runner.py"
+
+
+def _python_project(tmp_path, body):
+    (tmp_path / "requirements.txt").write_text("", encoding="utf-8")
+    (tmp_path / "test_sample.py").write_text(body, encoding="utf-8")
+    return str(tmp_path)
+
+
+def test_test_runner_runs_in_process(tmp_path):
+    project = _python_project(tmp_path, "def test_ok():\n    assert True\n")
+    result = check_runner.run_check("Test Suite", TEST_RUNNER, project)
+    assert result.mode == "inprocess"
+    assert "Traceback" not in result.error
+    assert result.passed, result.error
+    assert result.report["tests_passed"] == 1
+
+
+def test_test_runner_reports_failures(tmp_path):
+    project = _python_project(tmp_path, "def test_bad():\n    assert False\n")
+    result = check_runner.run_check("Test Suite", TEST_RUNNER, project)
+    assert "Traceback" not in result.error
+    assert not result.passed and not result.cancelled
+    assert result.report["tests_failed"] == 1
+    assert result.findings[0]["severity"] == "high"
+
+
+def _check_script(tmp_path, name, body):
+    """A skill-style script whose run() executes body."""
+    script = tmp_path / f"{name}.py"
+    script.write_text(
+        "import sys, time\n"
+        "from check_runner import Result, run_tool\n"
+        "\n"
+        "def run(project_path, url=None, options=None):\n"
+        + "".join(f"    {line}\n" for line in body.splitlines())
+        + "    return Result(True)\n", encoding="utf-8")
+    return script
+
+
+def test_inprocess_timeout_holds_without_run_tool(tmp_path):
+    script = _check_script(tmp_path, "spin", "while True:\n    time.sleep(0.05)")
+    start = time.monotonic()
+    result = check_runner.run_check("Spin", script, str(tmp_path), timeout=0.5)
+    assert time.monotonic() - start < 5
+    assert not result.passed and not result.cancelled
+    assert result.error.startswith("Timeout")
+
+
+def test_cancelled_check_is_not_passed(tmp_path):
+    script = _check_script(tmp_path, "tool", "run_tool([sys.executable, '-c', 'import time; time.sleep(30)'], "
+                                             "options=options)")
+    cancel = threading.Event()
+    threading.Timer(0.5, cancel.set).start()
+    start = time.monotonic()
+    result = check_runner.run_check("Tool", script, str(tmp_path), cancel=cancel)
+    assert time.monotonic() - start < 10
+    assert result.cancelled
+    assert not result.passed and not result.skipped
+    assert result.to_dict()["passed"] is False
+
+
+def test_cancel_abandons_a_check_that_ignores_it(tmp_path, monkeypatch):
+    monkeypatch.setattr(check_runner, "CANCEL_GRACE", 0.2)
+    script = _check_script(tmp_path, "stubborn", "while True:\n    time.sleep(0.05)")
+    cancel = threading.Event()
+    cancel.set()
+    result = check_runner.run_check("Stubborn", script, str(tmp_path), cancel=cancel)
+    assert result.cancelled and not result.passed
@@ -0,0 +1,206 @@
+"""scan_engine: the shared walk, file selection and the audit cache."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import scan_engine
+from check_runner import Result
+from scan_engine import AGENT_DIR, PLUGINS, Checker, find_files, load_plugin, scan
+
+# (plugin, glob patterns the auditor used before the shared walk, file cap)
+GLOB_AUDITORS = [
+    ("accessibility", ["**/*.html", "**/*.jsx", "**/*.tsx"], 50),
+    ("seo", ["**/*.html", "**/*.htm", "**/*.jsx", "**/*.tsx"], 50),
+    ("geo", ["**/*.html", "**/*.htm", "**/*.jsx", "**/*.tsx"], 30),
+    ("i18n", ["**/*.tsx", "**/*.jsx", "**/*.ts", "**/*.js", "**/*.vue", "**/*.py"], 50),
+]
+
+
+def _write(root: Path, rel: str, text: str = "") -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def count_lines(rel_path: str, content: str) -> int:
+    return content.count("\n")
+
+
+def shout(rel_path: str, content: str) -> str:
+    return content.upper()
+
+
+@pytest.fixture
+def small_tree(tmp_path):
+    root = tmp_path / "proj"
+    _write(root, "src/app.js", "a\nb\n")
+    _write(root, "src/style.css", "x\n")
+    _write(root, "build/out.js", "built\n")
+    _write(root, "node_modules/dep/index.js", "dep\n")
+    _write(root, "README.md", "# hi\n")
+    return root
+
+
+@pytest.fixture
+def page_tree(tmp_path):
+    """More pages than any cap, spread so glob order differs from sorted order."""
+    root = tmp_path / "site"
+    page = '<html><body><h1>Hello</h1><img src="a.png"><button>Go</button></body></html>'
+    for d, folder in enumerate(["src/pages", "src/app/routes", "pages/blog", "views"]):
+        for i in range(18):
+            name = f"{(i * 7919 + d) % 97:02d}_{'zyxwvutsrq'[i % 10]}page"
+            _write(root, f"{folder}/{name}.tsx", f"export default () => {page}")
+            if i % 3 == 0:
+                _write(root, f"{folder}/{name}.jsx", f"export default () => {page}")
+            if i % 4 == 0:
+                _write(root, f"{folder}/{name}.html", page)
+                _write(root, f"{folder}/{name}.ts", "export const label = 'Hello there';")
+    _write(root, "node_modules/pkg/index.html", page)
+    _write(root, "src/pages/helper.tsx", page)
+    _write(root, "server/main.py", "print('Hello world')")
+    return root
+
+
+def _glob_selection(root: Path, patterns: list, checker, limit: int) -> list:
+    """The files the auditor's old per-pattern glob loop would have checked."""
+    files = []
+    for pattern in patterns:
+        for path in root.glob(pattern):
+            rel = path.relative_to(root)
+            if checker.wants(rel):
+                files.append(str(rel))
+    return files[:limit]
+
+
+def test_one_walk_serves_every_checker(small_tree, monkeypatch):
+    walks = []
+    walk = scan_engine.walk_files
+    monkeypatch.setattr(scan_engine, "walk_files", lambda root, skip=(): walks.append(skip) or walk(root, skip))
+    js = Checker("js", count_lines, [".js"])
+    everything = Checker("all", shout, [".js", ".css", ".md"], skip_dirs={"node_modules"})
+
+    results = scan(small_tree, [js, everything], processes=0, use_cache=False)
+
+    # Walked once, pruning only the directories every checker skips
+    assert walks == [frozenset({"node_modules"})]
+    assert results["js"].files == ["src/app.js"]
+    assert results["js"].results == [2]
+    assert sorted(results["all"].files) == ["README.md", "build/out.js", "src/app.js", "src/style.css"]
+    assert dict(results["all"].items())["src/style.css"] == "X\n"
+
+
+def test_worker_processes_match_in_process(small_tree):
+    checkers = [Checker("js", count_lines, [".js", ".css", ".md"], skip_dirs=())]
+    inline = scan(small_tree, checkers, processes=0, use_cache=False)["js"]
+    pooled = scan(small_tree, checkers, processes=2, use_cache=False)["js"]
+    assert dict(pooled.items()) == dict(inline.items())
+    assert len(inline.files) == 5
+
+
+def test_walk_skips_the_audit_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(scan_engine, "CACHE_DIR", tmp_path / ".cache" / "audit")
+    _write(tmp_path, ".cache/audit/x.js", "cached")
+    _write(tmp_path, "real.js", "code")
+    assert [str(rel) for rel, _ in scan_engine.walk_files(tmp_path)] == ["real.js"]
+
+
+@pytest.mark.parametrize("name,patterns,limit", GLOB_AUDITORS)
+def test_capped_auditors_match_glob_selection(page_tree, name, patterns, limit):
+    checker = load_plugin(AGENT_DIR / PLUGINS[name]).CHECKERS[0]
+    assert checker.limit == limit
+    expected = _glob_selection(page_tree, patterns, checker, limit)
+    assert len(expected) == limit
+
+    assert [str(p.relative_to(page_tree)) for p in find_files(page_tree, checker)] == expected
+    result = scan(page_tree, [checker], processes=0, use_cache=False)[checker.name]
+    assert result.files == expected
+    assert result.matched > limit
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "cache"
+    monkeypatch.setattr(scan_engine, "CACHE_DIR", path)
+    return path
+
+
+def test_cache_reuses_unchanged_files(small_tree, cache_dir):
+    checker = Checker("js", count_lines, [".js", ".css"])
+    first = scan(small_tree, [checker], processes=0, use_cache=True)["js"]
+    assert first.cache_hits == 0 and len(first.files) == 2
+    again = scan(small_tree, [checker], processes=0, use_cache=True)["js"]
+    assert again.cache_hits == 2
+    assert dict(again.items()) == dict(first.items())
+
+    _write(small_tree, "src/app.js", "a\nb\nc\n")
+    edited = scan(small_tree, [checker], processes=0, use_cache=True)["js"]
+    assert edited.cache_hits == 1
+    assert dict(edited.items())["src/app.js"] == 3
+
+
+def test_cache_invalidated_by_checker_version(small_tree, cache_dir):
+    scan(small_tree, [Checker("js", count_lines, [".js"], version="1")], processes=0, use_cache=True)
+    bumped = scan(small_tree, [Checker("js", count_lines, [".js"], version="2")], processes=0, use_cache=True)
+    assert bumped["js"].cache_hits == 0
+
+
+def test_cache_prunes_deleted_files_and_can_be_disabled(small_tree, cache_dir):
+    checker = Checker("js", count_lines, [".js"], skip_dirs={"node_modules"})
+    scan(small_tree, [checker], processes=0, use_cache=True)
+    (small_tree / "build" / "out.js").unlink()
+    scan(small_tree, [checker], processes=0, use_cache=True)
+    assert list(scan_engine.AuditCache(small_tree.resolve(), checker).entries) == ["src/app.js"]
+
+    _write(small_tree, "src/new.js", "new\n")
+    assert scan(small_tree, [checker], processes=0, use_cache=False)["js"].cache_hits == 0
+    assert "src/new.js" not in scan_engine.AuditCache(small_tree.resolve(), checker).entries
+
+
+def test_fingerprint_covers_engine_sources(monkeypatch):
+    checker = load_plugin(AGENT_DIR / PLUGINS["ux"]).CHECKERS[0]
+    before = checker.fingerprint()
+    assert "source_facts.py" in scan_engine.ENGINE_SOURCES
+    monkeypatch.setattr(scan_engine, "_engine_code_bytes", scan_engine._engine_code() + b"# edited")
+    assert checker.fingerprint() != before
+
+
+@pytest.fixture
+def git_tree(tmp_path):
+    """A committed two-page repo whose b/home.html has since been edited."""
+    root = tmp_path / "repo"
+    _write(root, "a/index.html", "<html><body></body></html>")
+    _write(root, "b/home.html", "<html><body></body></html>")
+    git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run(git + ["init", "-q"], cwd=root, check=True)
+    subprocess.run(git + ["add", "."], cwd=root, check=True)
+    subprocess.run(git + ["commit", "-qm", "init"], cwd=root, check=True)
+    _write(root, "b/home.html", "<html lang='en'><body></body></html>")
+    return root
+
+
+def test_changed_since_scan_is_marked_partial(git_tree):
+    root = git_tree
+    checker = load_plugin(AGENT_DIR / PLUGINS["accessibility"]).CHECKERS[0]
+    results = scan(root, [checker], processes=0, use_cache=False, changed_since="HEAD")
+    assert results[checker.name].files == ["b/home.html"]
+    assert results[checker.name].changed_since == "HEAD"
+    assert Result(True).add_scan(results).to_dict()["changed_since"] == "HEAD"
+
+    full = scan(root, [checker], processes=0, use_cache=False, changed_since="")
+    assert full[checker.name].changed_since is None
+
+
+def test_changed_since_keeps_cache_entries_of_unchanged_files(git_tree, cache_dir):
+    checker = Checker("html", count_lines, [".html"])
+    scan(git_tree, [checker], processes=0, use_cache=True, changed_since="")
+    partial = scan(git_tree, [checker], processes=0, use_cache=True, changed_since="HEAD")
+    assert partial["html"].files == ["b/home.html"]
+    assert sorted(scan_engine.AuditCache(git_tree, checker).entries) == ["a/index.html", "b/home.html"]
+
+
+def test_changed_since_rejects_unknown_ref(git_tree):
+    with pytest.raises(ValueError):
+        scan(git_tree, [Checker("html", count_lines, [".html"])], processes=0, use_cache=False,
+             changed_since="no-such-ref")
@@ -0,0 +1,27 @@
+"""security_scan: the scanner does not report its own pattern tables."""
+
+import shutil
+from pathlib import Path
+
+from scan_engine import AGENT_DIR, PLUGINS, load_plugin
+
+SCANNER = AGENT_DIR / PLUGINS["security"]
+
+
+def test_scanner_skips_its_own_source(tmp_path):
+    security_scan = load_plugin(SCANNER)
+    kit_copy = tmp_path / ".agent" / "skills" / "vulnerability-scanner" / "scripts" / "security_scan.py"
+    kit_copy.parent.mkdir(parents=True)
+    shutil.copy(SCANNER, kit_copy)
+    (tmp_path / "app.py").write_text("result = eval(user_input)\n", encoding="utf-8")
+
+    result = security_scan.run(str(tmp_path), options={"use_cache": False, "processes": 0})
+    files = {f["file"] for f in result.findings if f["file"]}
+    assert files == {"app.py"}
+    assert any(f["rule"] == "eval() usage" for f in result.findings)
+
+
+def test_only_the_kit_copy_is_excluded(tmp_path):
+    security_scan = load_plugin(SCANNER)
+    assert not security_scan.is_scannable(Path(".agent/skills/vulnerability-scanner/scripts/security_scan.py"))
+    assert security_scan.is_scannable(Path("src/security_scan.py"))
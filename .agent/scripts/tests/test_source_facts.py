@@ -0,0 +1,90 @@
+"""source_facts: tokenizer views and the fact table."""
+
+import pytest
+
+import source_facts
+from source_facts import extract
+
+
+@pytest.mark.parametrize("source", [
+    '<p>See http://x.io <button className="btn primary">Go</button></p>',
+    '<p>\n  Docs: https://x.io/a // b <button className="btn primary">Go</button>\n</p>',
+    '<p>Visit our docs // or ask <button className="btn primary">Go</button></p>',
+])
+def test_double_slash_in_jsx_text_is_not_a_comment(source):
+    facts = extract(source, ".tsx")
+    assert [el.tag for el in facts.elements] == ["p", "button"]
+    assert facts.classes == ["btn", "primary"]
+
+
+@pytest.mark.parametrize("source", [
+    'const a = 1; // <button className="x">',
+    'const f = () => x > y // <button className="x">',
+    'const o = {url: 1, // <button className="x">\n b: 2}',
+])
+def test_line_comments_in_code_are_blanked(source):
+    facts = extract(source, ".tsx")
+    assert facts.elements == [] and "button" not in facts.text
+
+
+def test_comments_are_blanked_in_place():
+    source = 'const a = 1; /* <img>\n  old */ const b = "x"; // note\nconst c = 2;'
+    facts = extract(source, ".ts")
+    assert len(facts.text) == len(source)
+    assert facts.text.count("\n") == source.count("\n")
+    assert "<img" not in facts.text and "note" not in facts.text
+    assert facts.line_of(facts.text.index("const c")) == 3
+
+
+def test_code_view_blanks_string_contents():
+    facts = extract('const url = "https://x.io"; go(url)', ".js")
+    assert "https" in facts.text and "https" not in facts.code
+    assert len(facts.code) == len(facts.text)
+    assert facts.in_string(facts.text.index("https"))
+    assert not facts.in_string(facts.text.index("go("))
+
+
+def test_elements_and_attributes():
+    facts = extract('<img src="a.png" alt />\n<Button onClick={() => a > b} disabled>Go</Button>', ".tsx")
+    img, button = facts.elements
+    assert img.tag == "img" and img.attrs["src"] == "a.png" and "alt" in img.attrs
+    assert button.tag == "Button" and "onClick" in button.attrs and "disabled" in button.attrs
+
+
+def test_class_tokens_from_attributes_helpers_and_apply():
+    facts = extract('<div className={cn("p-4 flex", active && "bg-red")} />\n'
+                    'const s = clsx("m-2");', ".tsx")
+    assert facts.classes == ["p-4", "flex", "bg-red", "m-2"]
+    css = extract(".btn { @apply px-2 py-1; }", ".css")
+    assert css.classes == ["px-2", "py-1"]
+    vue = extract('<template><div class="card" :class="{ open: isOpen }"></div></template>', ".vue")
+    assert "card" in vue.classes
+
+
+def test_declarations_from_every_css_source():
+    assert extract(".a { color: red; /* margin: 0 */ }", ".css").values("color", "margin") == ["red"]
+    html = extract('<style>p { font-size: 14px }</style><p style="line-height: 1.5">x</p>', ".html")
+    assert [(prop, value) for prop, value, _ in html.declarations] == [("font-size", "14px"),
+                                                                      ("line-height", "1.5")]
+    styled = extract("const Box = styled.div`\n  box-shadow: 0 0 4px red;\n`;", ".tsx")
+    assert styled.values("box-shadow") == ["0 0 4px red"]
+
+
+def test_imports():
+    facts = extract("import React from 'react';\nconst x = require(\"lodash\");\n"
+                    "const Page = lazy(() => import('./Page'));\n// import y from 'gone'", ".tsx")
+    assert facts.imports == ["react", "lodash", "./Page"]
+
+
+def test_markup_comments_and_script_blocks():
+    facts = extract('<!-- <img src="x"> -->\n<script>// <b>\nconst t = 1; /* <i> */</script><p>ok</p>', ".html")
+    assert [el.tag for el in facts.elements] == ["script", "p"]
+
+
+def test_extract_memoizes_by_content_and_language():
+    source = "<div className='memo-test' />"
+    assert extract(source, ".tsx") is extract(source, ".jsx")
+    assert extract(source, ".tsx") is not extract(source, ".html")
+    for i in range(source_facts.MEMO_SIZE + 5):
+        extract(f"const n = {i};", ".ts")
+    assert len(source_facts._MEMO) == source_facts.MEMO_SIZE
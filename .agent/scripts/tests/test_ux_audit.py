@@ -0,0 +1,104 @@
+"""ux_audit: the Probe/Facts/Rule engine behind UXAuditor."""
+
+import pytest
+
+from scan_engine import AGENT_DIR, PLUGINS, load_plugin
+from source_facts import extract
+
+ux_audit = load_plugin(AGENT_DIR / PLUGINS["ux"])
+Probe, Facts, Rule = ux_audit.Probe, ux_audit.Facts, ux_audit.Rule
+
+
+def _facts(source: str, ext: str = ".tsx"):
+    return Facts(extract(source, ext))
+
+
+def _audit(source: str, name: str = "Page.tsx") -> dict:
+    auditor = ux_audit.UXAuditor()
+    auditor.audit_content(name, source)
+    return auditor.get_report()
+
+
+@pytest.mark.parametrize("kind,pattern,expected", [
+    ("any", ("hover:", "focus:"), True),
+    ("search", r"bg-\w+", True),
+    ("count", r"px-\d", 2),
+    ("findall", r"text-(\w+)", ["lg", "red"]),
+])
+def test_probe_kinds(kind, pattern, expected):
+    facts = _facts('<div className="px-4 hover:bg-blue text-lg text-red px-2">Hi</div>')
+    assert Probe(kind, pattern)(facts) == expected
+
+
+def test_nocase_probe_matches_any_case():
+    probe = Probe("any", ("wizard",), ux_audit.NOCASE)
+    assert probe(_facts("<Wizard step={1} />"))
+    assert probe(_facts("<WIZARD />"))
+    assert not probe(_facts("<Form />"))
+    # Text whose lowercase form is not a safe stand-in falls back to IGNORECASE
+    unfolded = _facts("const ſ = 1; <WIZARD />")
+    assert not unfolded.folded
+    assert probe(unfolded)
+
+
+def test_nocase_probe_must_be_written_in_lowercase():
+    with pytest.raises(ValueError):
+        Probe("search", r"Wizard", ux_audit.NOCASE)
+
+
+def test_facts_are_evaluated_once(monkeypatch):
+    calls = []
+    monkeypatch.setitem(ux_audit.FACTS, "counted", lambda f: calls.append(1) or 3)
+    facts = _facts("<p>x</p>")
+    assert facts["counted"] == facts["counted"] == 3
+    assert calls == [1]
+
+
+def test_rule_scopes():
+    facts = _facts("<p>x</p>")
+    assert Rule("f", ux_audit.FILE, ux_audit.WARNING, "m", lambda f: {"n": 2}).matches(facts) == [{"n": 2}]
+    assert Rule("f", ux_audit.FILE, ux_audit.WARNING, "m", lambda f: True).matches(facts) == [{}]
+    assert Rule("f", ux_audit.FILE, ux_audit.WARNING, "m", lambda f: 0).matches(facts) == []
+    each = Rule("m", ux_audit.MATCH, ux_audit.WARNING, "m", lambda f: ({"i": i} for i in range(3)))
+    assert each.matches(facts) == [{"i": 0}, {"i": 1}, {"i": 2}]
+
+
+def test_rule_table_is_well_formed():
+    ids = [rule.id for rule in ux_audit.RULES]
+    assert len(ids) == len(set(ids))
+    for rule in ux_audit.RULES:
+        assert rule.scope in (ux_audit.FILE, ux_audit.MATCH)
+        assert rule.severity in (ux_audit.ISSUE, ux_audit.WARNING, ux_audit.PASS)
+        assert rule.message or rule.severity == ux_audit.PASS
+
+
+def test_file_rules_fill_their_templates():
+    nav = "".join(f'<a href="/{i}">Item {i}</a>' for i in range(8))
+    report = _audit(f'<nav>{nav}</nav><img src="logo.png">')
+    assert "[Hick's Law] Page.tsx: 8 nav items (Max 7)" in report["issues"]
+    assert "[Accessibility] Page.tsx: Missing img alt text" in report["issues"]
+    assert not report["compliant"]
+
+
+def test_match_rules_report_every_item():
+    report = _audit("<h1>A</h1><h3>B</h3><h2>C</h2><h5>D</h5>")
+    skipped = [w for w in report["warnings"] if w.startswith("[Typography] Page.tsx: Skipped heading")]
+    assert skipped == [
+        "[Typography] Page.tsx: Skipped heading level (h1 -> h3). Maintain sequential hierarchy.",
+        "[Typography] Page.tsx: Skipped heading level (h2 -> h5). Maintain sequential hierarchy.",
+    ]
+
+
+def test_commented_out_markup_is_ignored():
+    nav = "".join(f'<a href="/{i}">Item {i}</a>' for i in range(8))
+    report = _audit(f"export const Page = () => null;\n/* <nav>{nav}</nav> */\n")
+    assert not any("Hick's Law" in issue for issue in report["issues"])
+
+
+def test_check_file_reports_merge():
+    auditor = ux_audit.UXAuditor()
+    auditor.merge(ux_audit.check_file("a.tsx", '<img src="a.png">'))
+    auditor.merge(ux_audit.check_file("b.css", ".x { color: red; }"))
+    report = auditor.get_report()
+    assert report["files_checked"] == 2
+    assert "[Accessibility] a.tsx: Missing img alt text" in report["issues"]
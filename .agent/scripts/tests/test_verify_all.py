@@ -0,0 +1,205 @@
+"""verify_all: the concurrent check scheduler and the CI exports."""
+
+import json
+import threading
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from verify_all import (PREVIEW_CHECK, plan_checks, print_timing, run_checks, write_json_report,
+                        write_junit_report)
+
+
+def _script(project, name, body="", passed=True):
+    """checks/<name>.py: logs its start and end to log.txt around body."""
+    path = project / "checks" / f"{name}.py"
+    path.parent.mkdir(exist_ok=True)
+    lines = "".join(f"    {line}\n" for line in body.splitlines())
+    path.write_text(
+        "import sys, time\n"
+        "from pathlib import Path\n"
+        "from check_runner import Result, run_tool\n"
+        "\n"
+        "def run(project_path, url=None, options=None):\n"
+        "    log = Path(project_path) / 'log.txt'\n"
+        f"    with open(log, 'a') as f: f.write('start {name}\\n')\n"
+        f"{lines}"
+        f"    with open(log, 'a') as f: f.write('end {name}\\n')\n"
+        f"    return Result({passed})\n", encoding="utf-8")
+    return f"checks/{name}.py"
+
+
+def _log(project):
+    return (project / "log.txt").read_text(encoding="utf-8").split("\n")[:-1]
+
+
+def _suite(category, *checks, **extra):
+    return dict(category=category, checks=list(checks), **extra)
+
+
+def _by_name(results):
+    return {r["name"]: r for r in results}
+
+
+def test_ready_checks_start_in_priority_order(tmp_path):
+    suites = [_suite(c, (c, _script(tmp_path, c), False)) for c in ("a", "b", "c")]
+    checks = plan_checks(suites)
+    for check, priority in zip(checks, (2, 0, 1)):
+        check["priority"] = priority
+
+    results = run_checks(checks, tmp_path, None, jobs=1)
+
+    assert [line for line in _log(tmp_path) if line.startswith("start")] == ["start b", "start c", "start a"]
+    assert [r["name"] for r in results] == ["a", "b", "c"]  # plan order
+    assert all(r["passed"] for r in results)
+
+
+def test_dependent_waits_for_its_category(tmp_path):
+    suites = [
+        _suite("Base", ("slow", _script(tmp_path, "slow", "time.sleep(0.3)"), False)),
+        _suite("Next", ("after", _script(tmp_path, "after"), False), depends_on=["Base"]),
+        _suite("Free", ("free", _script(tmp_path, "free"), False)),
+    ]
+    results = run_checks(plan_checks(suites), tmp_path, None, jobs=3)
+
+    log = _log(tmp_path)
+    assert log.index("end slow") < log.index("start after")
+    assert log.index("start free") < log.index("end slow")
+    assert all(r["passed"] and not r.get("skipped") for r in results)
+
+
+def test_dependent_skipped_when_its_category_fails(tmp_path):
+    suites = [
+        _suite("Base", ("broken", _script(tmp_path, "broken", passed=False), False)),
+        _suite("Next", ("after", _script(tmp_path, "after"), False), depends_on=["Base"]),
+    ]
+    results = _by_name(run_checks(plan_checks(suites), tmp_path, None, jobs=2))
+
+    assert not results["broken"]["passed"]
+    assert results["after"]["skipped"] and "Dependency failed" in results["after"]["error"]
+    assert "start after" not in _log(tmp_path)
+
+
+def test_dependency_cycle_fails_instead_of_hanging(tmp_path):
+    suites = [
+        _suite("A", ("a", _script(tmp_path, "a"), False), depends_on=["B"]),
+        _suite("B", ("b", _script(tmp_path, "b"), False), depends_on=["A"]),
+    ]
+    results = run_checks(plan_checks(suites), tmp_path, None, jobs=2)
+    assert all(not r["passed"] and r["error"] == "Unresolvable dependencies" for r in results)
+
+
+class _Ok(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def preview_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Ok)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def _preview_suites(project):
+    return [
+        _suite("Preview", ("Preview Server", PREVIEW_CHECK, True), requires_url=True),
+        _suite("Performance", ("perf", _script(project, "perf"), False), depends_on=["Preview"]),
+    ]
+
+
+def test_url_checks_run_once_preview_answers(tmp_path, preview_url):
+    results = _by_name(run_checks(plan_checks(_preview_suites(tmp_path)), tmp_path, preview_url, jobs=2))
+    assert results["Preview Server"]["passed"]
+    assert results["perf"]["passed"] and not results["perf"].get("skipped")
+
+
+def test_url_checks_skipped_when_preview_is_down(tmp_path):
+    # Nothing listens on port 1
+    results = _by_name(run_checks(plan_checks(_preview_suites(tmp_path)), tmp_path, "http://127.0.0.1:1/",
+                                  jobs=2, url_timeout=0.3))
+    assert not results["Preview Server"]["passed"]
+    assert results["perf"]["skipped"]
+    assert not (tmp_path / "log.txt").exists()
+
+
+def test_stop_on_fail_cancels_running_and_pending_checks(tmp_path):
+    sleeper = "run_tool([sys.executable, '-c', 'import time; time.sleep(30)'], options=options)"
+    suites = [
+        _suite("Security", ("critical", _script(tmp_path, "critical", "time.sleep(0.3)", passed=False), True)),
+        _suite("Slow", ("slow", _script(tmp_path, "slow", sleeper), False)),
+        _suite("Later", ("later", _script(tmp_path, "later"), False)),
+    ]
+    start = time.monotonic()
+    results = _by_name(run_checks(plan_checks(suites), tmp_path, None, jobs=2, stop_on_fail=True))
+
+    assert time.monotonic() - start < 15
+    assert not results["critical"]["passed"] and not results["critical"].get("cancelled")
+    for name in ("slow", "later"):
+        assert results[name]["cancelled"] and not results[name]["passed"]
+    assert "start later" not in _log(tmp_path)
+
+
+EXPORT_RESULTS = [
+    {"name": "Security Scan", "category": "Security", "required": True, "passed": True, "duration": 1.25,
+     "mode": "inprocess", "files_scanned": 40, "cache_hits": 12,
+     "findings": [{"severity": "medium", "message": "eval() usage", "file": "app.js", "line": 3, "rule": "eval"}]},
+    {"name": "Lint Check", "category": "Code Quality", "required": True, "passed": False, "duration": 2.0,
+     "error": "3 errors\nmore", "findings": []},
+    {"name": "Schema Validation", "category": "Data Layer", "passed": True, "skipped": True, "duration": 0,
+     "error": "Script not found"},
+    {"name": "Test Suite", "category": "Testing", "passed": False, "cancelled": True, "duration": 0.5,
+     "error": "Cancelled before start"},
+]
+
+
+def test_json_report_uses_the_common_schema(tmp_path):
+    out = tmp_path / "results.json"
+    write_json_report(EXPORT_RESULTS, str(out), tmp_path, None, datetime.now(), 2, changed_since="main")
+    document = json.loads(out.read_text(encoding="utf-8"))
+
+    assert [c["status"] for c in document["checks"]] == ["passed", "failed", "skipped", "cancelled"]
+    assert document["summary"] == {"total": 4, "passed": 1, "failed": 1, "skipped": 1, "cancelled": 1}
+    assert document["passed"] is False
+    assert document["partial"] is True and document["changed_since"] == "main"
+    security = document["checks"][0]
+    assert security["files_scanned"] == 40 and security["cache_hits"] == 12 and security["duration"] == 1.25
+    assert security["findings"][0]["file"] == "app.js"
+
+
+def test_json_report_fails_on_cancelled_checks_alone(tmp_path):
+    out = tmp_path / "results.json"
+    write_json_report([EXPORT_RESULTS[0], EXPORT_RESULTS[3]], str(out), tmp_path, None, datetime.now(), 1)
+    document = json.loads(out.read_text(encoding="utf-8"))
+    assert document["passed"] is False and document["partial"] is False
+
+
+def test_junit_report_maps_statuses(tmp_path):
+    out = tmp_path / "results.xml"
+    write_junit_report(EXPORT_RESULTS, str(out), datetime.now(), changed_since="main")
+    suites = {s.get("name"): s for s in ET.parse(out).getroot().findall("testsuite")}
+
+    assert list(suites) == ["Security", "Code Quality", "Data Layer", "Testing"]
+    assert suites["Security"].find("testcase/system-out").text == "[medium] app.js:3 eval() usage"
+    assert suites["Code Quality"].find("testcase/failure").get("message") == "3 errors"
+    assert suites["Code Quality"].get("failures") == "1"
+    assert suites["Data Layer"].find("testcase/skipped").get("message") == "Script not found"
+    assert suites["Testing"].find("testcase/error").get("type") == "cancelled"
+    assert suites["Testing"].get("errors") == "1"
+    assert suites["Security"].find("properties/property").get("value") == "main"
+
+
+def test_timing_report_lists_slowest_first(capsys):
+    print_timing(EXPORT_RESULTS, wall_clock=2.5)
+    lines = [line for line in capsys.readouterr().out.splitlines() if line.startswith("  ")]
+    assert [line.split("%  ")[1] for line in lines] == [
+        "Lint Check", "Security Scan  40 files, 12 cached", "Test Suite"]
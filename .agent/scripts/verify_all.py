@@ -9,6 +9,14 @@ Use this before deployment or major releases.
 Usage:
     python scripts/verify_all.py . --url <URL>
 
+Independent checks run concurrently (--jobs, default one per CPU). Suites
+start in priority order and may declare "depends_on" other categories;
+URL-based checks wait for the preview server to answer first. Scripts that
+define run() execute in-process (see check_runner.py); --isolate forces
+a subprocess per check. --json / --junit write every result (findings,
+severity, file, line, duration, files scanned, cache hits) for CI, and
+the final report breaks wall-clock time down per check.
+
 Includes ALL checks:
     ✅ Security Scan (OWASP, secrets, dependencies)
     ✅ Lint & Type Coverage
@@ -23,12 +31,21 @@ Includes ALL checks:
 """
 
 import sys
-import subprocess
+import os
+import time
+import threading
+import json
 import argparse
+import urllib.request
+import xml.etree.ElementTree as ET
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from check_runner import run_check
+
 # ANSI colors
 class Colors:
     HEADER = '\033[95m'
@@ -57,7 +74,12 @@ def print_warning(text: str):
 def print_error(text: str):
     print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
 
-# Complete verification suite
+# Built-in check: wait until the preview URL answers
+PREVIEW_CHECK = "<preview>"
+PREVIEW_TIMEOUT = 60
+CHECK_TIMEOUT = 600  # 10 minute timeout for slow checks
+
+# Complete verification suite (list order = priority; "depends_on" names categories)
 VERIFICATION_SUITE = [
     # P0: Security (CRITICAL)
     {
@@ -111,26 +133,37 @@ VERIFICATION_SUITE = [
         ]
     },
     
-    # P6: Performance (requires URL)
+    # P6: Preview server (gates every URL-based check)
+    {
+        "category": "Preview",
+        "requires_url": True,
+        "checks": [
+            ("Preview Server", PREVIEW_CHECK, True),
+        ]
+    },
+    
+    # P7: Performance (requires URL)
     {
         "category": "Performance",
         "requires_url": True,
+        "depends_on": ["Preview"],
         "checks": [
             ("Lighthouse Audit", ".agent/skills/performance-profiling/scripts/lighthouse_audit.py", True),
             ("Bundle Analysis", ".agent/skills/performance-profiling/scripts/bundle_analyzer.py", False),
         ]
     },
     
-    # P7: E2E Testing (requires URL)
+    # P8: E2E Testing (requires URL)
     {
         "category": "E2E Testing",
         "requires_url": True,
+        "depends_on": ["Preview"],
         "checks": [
             ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False),
         ]
     },
     
-    # P8: Mobile (if applicable)
+    # P9: Mobile (if applicable)
     {
         "category": "Mobile",
         "checks": [
@@ -138,7 +171,7 @@ VERIFICATION_SUITE = [
         ]
     },
     
-    # P9: Internationalization
+    # P10: Internationalization
     {
         "category": "Internationalization",
         "checks": [
@@ -147,59 +180,166 @@ VERIFICATION_SUITE = [
     },
 ]
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
-    """Run validation script"""
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               cancel: Optional[threading.Event] = None, isolate: bool = False) -> dict:
+    """Run validation script (in-process if it defines run()); setting `cancel` stops it"""
     if not script_path.exists():
         print_warning(f"{name}: Script not found, skipping")
         return {"name": name, "passed": True, "skipped": True, "duration": 0}
     
     print_step(f"Running: {name}")
-    start_time = datetime.now()
+    result = run_check(name, script_path, project_path, url, isolate=isolate,
+                       timeout=CHECK_TIMEOUT, cancel=cancel)
     
-    # Build command
-    cmd = ["python", str(script_path), project_path]
-    if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
-        cmd.append(url)
-    
-    # Run
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout for slow checks
-        )
-        
-        duration = (datetime.now() - start_time).total_seconds()
-        passed = result.returncode == 0
-        
-        if passed:
-            print_success(f"{name}: PASSED ({duration:.1f}s)")
-        else:
-            print_error(f"{name}: FAILED ({duration:.1f}s)")
-            if result.stderr:
-                print(f"  {result.stderr[:300]}")
-        
-        return {
-            "name": name,
-            "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
-            "skipped": False,
-            "duration": duration
-        }
-    
-    except subprocess.TimeoutExpired:
-        duration = (datetime.now() - start_time).total_seconds()
-        print_error(f"{name}: TIMEOUT (>{duration:.0f}s)")
-        return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": "Timeout"}
+    partial = ", changed files only" if result.changed_since else ""
+    if result.cancelled:
+        print_warning(f"{name}: CANCELLED ({result.duration:.1f}s)")
+    elif result.passed:
+        print_success(f"{name}: PASSED ({result.duration:.1f}s{partial})")
+    else:
+        print_error(f"{name}: FAILED ({result.duration:.1f}s)")
+        if result.error:
+            print(f"  {result.error[:300]}")
     
-    except Exception as e:
+    return result.to_dict()
+
+def wait_for_url(name: str, url: str, cancel: Optional[threading.Event] = None,
+                 timeout: float = PREVIEW_TIMEOUT) -> dict:
+    """Built-in check: poll url until it answers (any HTTP status counts as up)"""
+    print_step(f"Waiting for: {url}")
+    start_time = datetime.now()
+    deadline = time.monotonic() + timeout
+    error = ""
+    while time.monotonic() < deadline and not (cancel and cancel.is_set()):
+        try:
+            urllib.request.urlopen(url, timeout=5).close()
+            error = ""
+        except urllib.error.HTTPError:
+            error = ""
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            error = str(getattr(e, "reason", e))
+            time.sleep(1)
+            continue
         duration = (datetime.now() - start_time).total_seconds()
-        print_error(f"{name}: ERROR - {str(e)}")
-        return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": str(e)}
+        print_success(f"{name}: UP ({duration:.1f}s)")
+        return {"name": name, "passed": True, "skipped": False, "duration": duration}
+    
+    duration = (datetime.now() - start_time).total_seconds()
+    cancelled = bool(cancel and cancel.is_set())
+    if cancelled:
+        print_warning(f"{name}: CANCELLED ({duration:.1f}s)")
+    else:
+        print_error(f"{name}: not reachable after {duration:.0f}s")
+    return {"name": name, "passed": False, "skipped": False, "cancelled": cancelled, "duration": duration,
+            "error": f"{url} not reachable: {error or 'cancelled'}"}
+
+# ============================================================================
+#  SCHEDULER
+# ============================================================================
+
+def plan_checks(suites: List[dict]) -> List[dict]:
+    """Flatten suites into check specs with priority and dependencies"""
+    checks = []
+    for priority, suite in enumerate(suites):
+        for name, script_path, required in suite["checks"]:
+            checks.append({
+                "name": name,
+                "script": script_path,
+                "required": required,
+                "category": suite["category"],
+                "priority": priority,
+                "depends_on": list(suite.get("depends_on", [])),
+            })
+    return checks
 
-def print_final_report(results: List[dict], start_time: datetime):
+def run_checks(checks: List[dict], project_path: Path, url: Optional[str],
+               jobs: int, stop_on_fail: bool = False, url_timeout: float = PREVIEW_TIMEOUT,
+               isolate: bool = False) -> List[dict]:
+    """Run checks concurrently, at most `jobs` at a time.
+    
+    A check starts once every category it depends on has finished; if one of
+    those failed it is skipped. Among ready checks the highest priority (lowest
+    number) starts first. With stop_on_fail, a failed required check cancels
+    the running ones and nothing new starts; both come back cancelled (not
+    passed). Results come back in plan order.
+    """
+    cancel = threading.Event()
+    results: Dict[int, dict] = {}
+    pending = list(range(len(checks)))
+    running = {}
+    open_count = {}  # category -> checks not finished yet
+    failed_categories = set()
+    for check in checks:
+        open_count[check["category"]] = open_count.get(check["category"], 0) + 1
+    
+    def launch(check: dict) -> dict:
+        if check["script"] == PREVIEW_CHECK:
+            return wait_for_url(check["name"], url, cancel, url_timeout)
+        return run_script(check["name"], project_path / check["script"], str(project_path), url, cancel, isolate)
+    
+    def finish(index: int, result: dict):
+        check = checks[index]
+        result["category"] = check["category"]
+        result["required"] = check["required"]
+        results[index] = result
+        open_count[check["category"]] -= 1
+        if not result["passed"] and not result.get("skipped"):
+            failed_categories.add(check["category"])
+    
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while pending or running:
+            # Start whatever is ready, best priority first
+            for index in sorted(pending, key=lambda i: checks[i]["priority"]):
+                check = checks[index]
+                deps = check["depends_on"]
+                if cancel.is_set():
+                    pending.remove(index)
+                    finish(index, {"name": check["name"], "passed": False, "skipped": False, "cancelled": True,
+                                   "duration": 0, "error": "Cancelled before start"})
+                elif failed_categories.intersection(deps):
+                    pending.remove(index)
+                    print_warning(f"{check['name']}: skipped ({', '.join(deps)} failed)")
+                    finish(index, {"name": check["name"], "passed": True, "skipped": True, "duration": 0,
+                                   "error": f"Dependency failed: {', '.join(deps)}"})
+                elif len(running) < jobs and all(open_count.get(d, 0) == 0 for d in deps):
+                    pending.remove(index)
+                    running[pool.submit(launch, check)] = index
+            
+            if not running:
+                if pending and not cancel.is_set():
+                    # Only unsatisfiable dependencies are left (e.g. an unknown category)
+                    for index in list(pending):
+                        pending.remove(index)
+                        finish(index, {"name": checks[index]["name"], "passed": False, "skipped": False,
+                                       "duration": 0, "error": "Unresolvable dependencies"})
+                continue
+            
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                finish(index, future.result())
+                result = results[index]
+                if (stop_on_fail and checks[index]["required"] and not result["passed"]
+                        and not result.get("skipped") and not cancel.is_set()):
+                    print_error(f"CRITICAL: {checks[index]['name']} failed. Cancelling remaining checks.")
+                    cancel.set()
+    
+    return [results[i] for i in range(len(checks))]
+
+def print_timing(results: List[dict], wall_clock: float):
+    """Print where the time went, slowest check first"""
+    timed = sorted((r for r in results if r.get("duration")), key=lambda r: -r["duration"])
+    if not timed:
+        return
+    busy = sum(r["duration"] for r in timed)
+    print(f"{Colors.BOLD}Timing (check time {busy:.1f}s over {wall_clock:.1f}s wall clock):{Colors.ENDC}")
+    for r in timed:
+        share = r["duration"] / busy * 100 if busy else 0
+        scanned = f"  {r['files_scanned']} files, {r['cache_hits']} cached" if r.get("files_scanned") else ""
+        print(f"  {r['duration']:7.2f}s {share:5.1f}%  {r['name']}{scanned}")
+    print()
+
+def print_final_report(results: List[dict], start_time: datetime, changed_since: Optional[str] = None):
     """Print comprehensive final report"""
     total_duration = (datetime.now() - start_time).total_seconds()
     
@@ -208,14 +348,20 @@ def print_final_report(results: List[dict], start_time: datetime):
     # Statistics
     total = len(results)
     passed = sum(1 for r in results if r["passed"] and not r.get("skipped"))
-    failed = sum(1 for r in results if not r["passed"] and not r.get("skipped"))
+    failed = sum(1 for r in results if not r["passed"] and not r.get("skipped") and not r.get("cancelled"))
     skipped = sum(1 for r in results if r.get("skipped"))
+    cancelled = sum(1 for r in results if r.get("cancelled"))
     
     print(f"Total Duration: {total_duration:.1f}s")
     print(f"Total Checks: {total}")
     print(f"{Colors.GREEN}✅ Passed: {passed}{Colors.ENDC}")
     print(f"{Colors.RED}❌ Failed: {failed}{Colors.ENDC}")
     print(f"{Colors.YELLOW}⏭️  Skipped: {skipped}{Colors.ENDC}")
+    if cancelled:
+        print(f"{Colors.YELLOW}⏹️  Cancelled: {cancelled}{Colors.ENDC}")
+    if changed_since:
+        print_warning(f"Partial run: file auditors only checked files changed since {changed_since}; "
+                      "findings in unchanged files were not re-checked")
     print()
     
     # Category breakdown
@@ -228,7 +374,9 @@ def print_final_report(results: List[dict], start_time: datetime):
             print(f"\n{Colors.BOLD}{Colors.CYAN}{current_category}:{Colors.ENDC}")
         
         # Print result
-        if r.get("skipped"):
+        if r.get("cancelled"):
+            status = f"{Colors.YELLOW}⏹️ {Colors.ENDC}"
+        elif r.get("skipped"):
             status = f"{Colors.YELLOW}⏭️ {Colors.ENDC}"
         elif r["passed"]:
             status = f"{Colors.GREEN}✅{Colors.ENDC}"
@@ -240,26 +388,112 @@ def print_final_report(results: List[dict], start_time: datetime):
     
     print()
     
+    print_timing(results, total_duration)
+    
     # Failed checks detail
     if failed > 0:
         print(f"{Colors.BOLD}{Colors.RED}❌ FAILED CHECKS:{Colors.ENDC}")
         for r in results:
-            if not r["passed"] and not r.get("skipped"):
+            if not r["passed"] and not r.get("skipped") and not r.get("cancelled"):
                 print(f"\n{Colors.RED}✗ {r['name']}{Colors.ENDC}")
                 if r.get("error"):
                     error_preview = r["error"][:200]
                     print(f"  Error: {error_preview}")
         print()
     
-    # Final verdict
-    if failed > 0:
-        print_error(f"VERIFICATION FAILED - {failed} check(s) need attention")
+    # Final verdict: a cancelled check did not pass
+    if failed > 0 or cancelled > 0:
+        print_error(f"VERIFICATION FAILED - {failed} check(s) need attention"
+                    + (f", {cancelled} cancelled" if cancelled else ""))
         print(f"\n{Colors.YELLOW}💡 Tip: Fix critical (security, lint) issues first{Colors.ENDC}")
         return False
     else:
         print_success("✨ ALL CHECKS PASSED - Ready for deployment! ✨")
         return True
 
+# ============================================================================
+#  EXPORT
+# ============================================================================
+
+def check_record(r: dict) -> dict:
+    """One check in the common result schema (see check_runner.Result)"""
+    return {
+        "name": r["name"],
+        "category": r.get("category"),
+        "required": r.get("required", False),
+        "status": ("cancelled" if r.get("cancelled") else "skipped" if r.get("skipped")
+                   else "passed" if r["passed"] else "failed"),
+        "duration": round(r.get("duration", 0), 3),
+        "mode": r.get("mode"),
+        "files_scanned": r.get("files_scanned", 0),
+        "cache_hits": r.get("cache_hits", 0),
+        "changed_since": r.get("changed_since"),
+        "findings": r.get("findings", []),
+        "error": r.get("error") or "",
+        "report": r.get("report", {}),
+    }
+
+def write_json_report(results: List[dict], path: str, project_path: Path, url: Optional[str],
+                      start_time: datetime, jobs: int, changed_since: Optional[str] = None):
+    """Write every check result, with timings and findings, as one JSON document"""
+    records = [check_record(r) for r in results]
+    counts = {}
+    for record in records:
+        counts[record["status"]] = counts.get(record["status"], 0) + 1
+    document = {
+        "project": str(project_path),
+        "url": url,
+        "started": start_time.isoformat(timespec="seconds"),
+        "duration": round((datetime.now() - start_time).total_seconds(), 3),
+        "jobs": jobs,
+        "passed": not counts.get("failed") and not counts.get("cancelled"),
+        "partial": bool(changed_since),
+        "changed_since": changed_since,
+        "summary": {"total": len(records), **counts},
+        "checks": records,
+    }
+    Path(path).write_text(json.dumps(document, indent=2, default=str), encoding="utf-8")
+
+def write_junit_report(results: List[dict], path: str, start_time: datetime,
+                       changed_since: Optional[str] = None):
+    """Write JUnit XML: one testsuite per category, one testcase per check"""
+    root = ET.Element("testsuites", name="verify_all",
+                      time=f"{(datetime.now() - start_time).total_seconds():.3f}")
+    suites = {}
+    for r in results:
+        record = check_record(r)
+        category = record["category"] or "Checks"
+        suite = suites.get(category)
+        if suite is None:
+            suite = suites[category] = ET.SubElement(root, "testsuite", name=category,
+                                                     timestamp=start_time.isoformat(timespec="seconds"))
+            if changed_since:
+                properties = ET.SubElement(suite, "properties")
+                ET.SubElement(properties, "property", name="changed_since", value=changed_since)
+        case = ET.SubElement(suite, "testcase", classname=category, name=record["name"],
+                             time=f"{record['duration']:.3f}")
+        details = "\n".join(
+            f"[{f['severity']}] {f.get('file') or ''}{':' + str(f['line']) if f.get('line') else ''} {f['message']}"
+            for f in record["findings"])
+        if record["status"] == "failed":
+            message = (record["error"].strip().splitlines() or [f"{len(record['findings'])} finding(s)"])[0]
+            ET.SubElement(case, "failure", message=message[:200]).text = details or record["error"]
+        elif record["status"] == "cancelled":
+            ET.SubElement(case, "error", type="cancelled", message=record["error"] or "cancelled")
+        elif record["status"] == "skipped":
+            ET.SubElement(case, "skipped", message=record["error"] or record["status"])
+        elif details:
+            ET.SubElement(case, "system-out").text = details
+    
+    for suite in suites.values():
+        cases = suite.findall("testcase")
+        suite.set("tests", str(len(cases)))
+        suite.set("failures", str(sum(1 for c in cases if c.find("failure") is not None)))
+        suite.set("errors", str(sum(1 for c in cases if c.find("error") is not None)))
+        suite.set("skipped", str(sum(1 for c in cases if c.find("skipped") is not None)))
+        suite.set("time", f"{sum(float(c.get('time')) for c in cases):.3f}")
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
 def main():
     parser = argparse.ArgumentParser(
         description="Run complete Antigravity Kit verification suite",
@@ -268,17 +502,38 @@ def main():
 Examples:
   python scripts/verify_all.py . --url http://localhost:3000
   python scripts/verify_all.py . --url https://staging.example.com --no-e2e
+  python scripts/verify_all.py . --url http://localhost:3000 --changed-since main
+  python scripts/verify_all.py . --url http://localhost:3000 --jobs 4 --stop-on-fail
+  python scripts/verify_all.py . --url http://localhost:3000 --json results.json --junit junit.xml
         """
     )
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", required=True, help="URL for performance & E2E checks")
     parser.add_argument("--no-e2e", action="store_true", help="Skip E2E tests")
-    parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first failure")
+    parser.add_argument("--stop-on-fail", action="store_true",
+                        help="On a critical failure, cancel running checks and start no new ones")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="Checks to run at once (default: CPU count)")
+    parser.add_argument("--url-timeout", type=float, default=PREVIEW_TIMEOUT,
+                        help=f"Seconds to wait for --url to answer (default: {PREVIEW_TIMEOUT})")
+    parser.add_argument("--isolate", action="store_true",
+                        help="Run every check as a subprocess instead of importing it")
+    parser.add_argument("--json", metavar="FILE", help="Also write the results as JSON")
+    parser.add_argument("--junit", metavar="FILE", help="Also write the results as JUnit XML")
+    parser.add_argument("--changed-since", metavar="GIT_REF",
+                        help="File auditors only check files changed since this git ref")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the file auditors' result cache")
     
     args = parser.parse_args()
     
     project_path = Path(args.project).resolve()
     
+    # Read by scan_engine in every auditor launched below
+    if args.changed_since:
+        os.environ["AUDIT_CHANGED_SINCE"] = args.changed_since
+    if args.no_cache:
+        os.environ["AUDIT_CACHE"] = "0"
+    
     if not project_path.exists():
         print_error(f"Project path does not exist: {project_path}")
         sys.exit(1)
@@ -287,11 +542,15 @@ Examples:
     print(f"Project: {project_path}")
     print(f"URL: {args.url}")
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    if args.changed_since:
+        print(f"Changed since: {args.changed_since} (partial run - unchanged files are not audited)")
+    
+    print(f"Parallel jobs: {args.jobs}")
     
     start_time = datetime.now()
-    results = []
     
-    # Run all verification categories
+    # Select suites
+    suites = []
     for suite in VERIFICATION_SUITE:
         category = suite["category"]
         requires_url = suite.get("requires_url", False)
@@ -304,22 +563,21 @@ Examples:
         if args.no_e2e and category == "E2E Testing":
             continue
         
-        print_header(f"📋 {category.upper()}")
-        
-        for name, script_path, required in suite["checks"]:
-            script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
-            result["category"] = category
-            results.append(result)
-            
-            # Stop on critical failure if flag set
-            if args.stop_on_fail and required and not result["passed"] and not result.get("skipped"):
-                print_error(f"CRITICAL: {name} failed. Stopping verification.")
-                print_final_report(results, start_time)
-                sys.exit(1)
+        suites.append(suite)
+    
+    print_header(f"📋 RUNNING {sum(len(s['checks']) for s in suites)} CHECKS")
+    results = run_checks(plan_checks(suites), project_path, args.url, args.jobs,
+                         args.stop_on_fail, args.url_timeout, args.isolate)
+    
+    # Machine-readable results for CI
+    if args.json:
+        write_json_report(results, args.json, project_path, args.url, start_time, args.jobs,
+                          args.changed_since)
+    if args.junit:
+        write_junit_report(results, args.junit, start_time, args.changed_since)
     
     # Print final report
-    all_passed = print_final_report(results, start_time)
+    all_passed = print_final_report(results, start_time, args.changed_since)
     
     sys.exit(0 if all_passed else 1)
 
@@ -25,6 +25,9 @@ try:
 except:
     pass
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from check_runner import Result, finding
+
 
 def find_schema_files(project_path: Path) -> list:
     """Find database schema files."""
@@ -91,6 +94,55 @@ def validate_prisma_schema(file_path: Path) -> list:
     return issues
 
 
+def validate_schemas(project_path: Path, schemas: list) -> dict:
+    """Validate every schema file and build the JSON summary."""
+    all_issues = []
+    
+    for schema_type, file_path in schemas:
+        if schema_type == 'prisma':
+            issues = validate_prisma_schema(file_path)
+        else:
+            issues = []  # Drizzle validation could be added
+        
+        if issues:
+            all_issues.append({
+                "file": str(file_path.name),
+                "type": schema_type,
+                "issues": issues
+            })
+    
+    if not schemas:
+        return {
+            "script": "schema_validator",
+            "project": str(project_path),
+            "schemas_checked": 0,
+            "issues_found": 0,
+            "passed": True,
+            "message": "No schema files found"
+        }
+    
+    # Schema issues are warnings, not failures
+    return {
+        "script": "schema_validator",
+        "project": str(project_path),
+        "schemas_checked": len(schemas),
+        "issues_found": sum(len(item["issues"]) for item in all_issues),
+        "passed": True,
+        "issues": all_issues
+    }
+
+
+def run(project_path, url=None, options=None) -> Result:
+    """check_runner entry point."""
+    project_path = Path(project_path).resolve()
+    schemas = find_schema_files(project_path)
+    report = validate_schemas(project_path, schemas)
+    paths = {file_path.name: str(file_path.relative_to(project_path)) for _, file_path in schemas}
+    findings = [finding("low", issue, paths.get(item["file"], item["file"]))
+                for item in report.get("issues", []) for issue in item["issues"]]
+    return Result(report["passed"], report, findings=findings, files_scanned=len(schemas))
+
+
 def main():
     project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
     
@@ -105,35 +157,14 @@ def main():
     schemas = find_schema_files(project_path)
     print(f"Found {len(schemas)} schema files")
     
+    output = validate_schemas(project_path, schemas)
     if not schemas:
-        output = {
-            "script": "schema_validator",
-            "project": str(project_path),
-            "schemas_checked": 0,
-            "issues_found": 0,
-            "passed": True,
-            "message": "No schema files found"
-        }
         print(json.dumps(output, indent=2))
         sys.exit(0)
     
-    # Validate each schema
-    all_issues = []
-    
     for schema_type, file_path in schemas:
         print(f"\nValidating: {file_path.name} ({schema_type})")
-        
-        if schema_type == 'prisma':
-            issues = validate_prisma_schema(file_path)
-        else:
-            issues = []  # Drizzle validation could be added
-        
-        if issues:
-            all_issues.append({
-                "file": str(file_path.name),
-                "type": schema_type,
-                "issues": issues
-            })
+    all_issues = output["issues"]
     
     # Summary
     print("\n" + "="*60)
@@ -150,19 +181,6 @@ def main():
     else:
         print("No schema issues found!")
     
-    total_issues = sum(len(item["issues"]) for item in all_issues)
-    # Schema issues are warnings, not failures
-    passed = True
-    
-    output = {
-        "script": "schema_validator",
-        "project": str(project_path),
-        "schemas_checked": len(schemas),
-        "issues_found": total_issues,
-        "passed": passed,
-        "issues": all_issues
-    }
-    
     print("\n" + json.dumps(output, indent=2))
     
     sys.exit(0)
@@ -26,88 +26,142 @@ try:
 except:
     pass
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from scan_engine import Checker, find_files, scan, scan_options
+from check_runner import Result, finding
+
+
+SKIP_DIRS = {'node_modules', '.next', 'dist', 'build', '.git'}
+EXTENSIONS = ['.html', '.jsx', '.tsx']  # In glob priority order
+
 
 def find_html_files(project_path: Path) -> list:
     """Find all HTML/JSX/TSX files."""
-    patterns = ['**/*.html', '**/*.jsx', '**/*.tsx']
-    skip_dirs = {'node_modules', '.next', 'dist', 'build', '.git'}
-    
-    files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            if not any(skip in f.parts for skip in skip_dirs):
-                files.append(f)
-    
-    return files[:50]
+    return find_files(project_path, CHECKERS[0])
 
 
 def check_accessibility(file_path: Path) -> list:
     """Check a single file for accessibility issues."""
-    issues = []
-    
     try:
         content = file_path.read_text(encoding='utf-8', errors='ignore')
-        
-        # Check for form inputs without labels
-        inputs = re.findall(r'<input[^>]*>', content, re.IGNORECASE)
-        for inp in inputs:
-            if 'type="hidden"' not in inp.lower():
-                if 'aria-label' not in inp.lower() and 'id=' not in inp.lower():
-                    issues.append("Input without label or aria-label")
-                    break
-        
-        # Check for buttons without accessible text
-        buttons = re.findall(r'<button[^>]*>[^<]*</button>', content, re.IGNORECASE)
-        for btn in buttons:
-            # Check if button has text content or aria-label
-            if 'aria-label' not in btn.lower():
-                text = re.sub(r'<[^>]+>', '', btn)
-                if not text.strip():
-                    issues.append("Button without accessible text")
-                    break
-        
-        # Check for missing lang attribute
-        if '<html' in content.lower() and 'lang=' not in content.lower():
-            issues.append("Missing lang attribute on <html>")
-        
-        # Check for missing skip link
-        if '<main' in content.lower() or '<body' in content.lower():
-            if 'skip' not in content.lower() and '#main' not in content.lower():
-                issues.append("Consider adding skip-to-main-content link")
-        
-        # Check for click handlers without keyboard support
-        onclick_count = content.lower().count('onclick=')
-        onkeydown_count = content.lower().count('onkeydown=') + content.lower().count('onkeyup=')
-        if onclick_count > 0 and onkeydown_count == 0:
-            issues.append("onClick without keyboard handler (onKeyDown)")
-        
-        # Check for tabIndex misuse
-        if 'tabindex=' in content.lower():
-            if 'tabindex="-1"' not in content.lower() and 'tabindex="0"' not in content.lower():
-                positive_tabindex = re.findall(r'tabindex="([1-9]\d*)"', content, re.IGNORECASE)
-                if positive_tabindex:
-                    issues.append("Avoid positive tabIndex values")
-        
-        # Check for autoplay media
-        if 'autoplay' in content.lower():
-            if 'muted' not in content.lower():
-                issues.append("Autoplay media should be muted")
-        
-        # Check for role usage
-        if 'role="button"' in content.lower():
-            # Divs with role button should have tabindex
-            div_buttons = re.findall(r'<div[^>]*role="button"[^>]*>', content, re.IGNORECASE)
-            for div in div_buttons:
-                if 'tabindex' not in div.lower():
-                    issues.append("role='button' without tabindex")
-                    break
-        
     except Exception as e:
-        issues.append(f"Error reading file: {str(e)[:50]}")
+        return [f"Error reading file: {str(e)[:50]}"]
+    return check_content(str(file_path), content)
+
+
+def check_content(rel_path: str, content: str) -> list:
+    """Check already-read file content for accessibility issues."""
+    issues = []
+    
+    # Check for form inputs without labels
+    inputs = re.findall(r'<input[^>]*>', content, re.IGNORECASE)
+    for inp in inputs:
+        if 'type="hidden"' not in inp.lower():
+            if 'aria-label' not in inp.lower() and 'id=' not in inp.lower():
+                issues.append("Input without label or aria-label")
+                break
+    
+    # Check for buttons without accessible text
+    buttons = re.findall(r'<button[^>]*>[^<]*</button>', content, re.IGNORECASE)
+    for btn in buttons:
+        # Check if button has text content or aria-label
+        if 'aria-label' not in btn.lower():
+            text = re.sub(r'<[^>]+>', '', btn)
+            if not text.strip():
+                issues.append("Button without accessible text")
+                break
+    
+    # Check for missing lang attribute
+    if '<html' in content.lower() and 'lang=' not in content.lower():
+        issues.append("Missing lang attribute on <html>")
+    
+    # Check for missing skip link
+    if '<main' in content.lower() or '<body' in content.lower():
+        if 'skip' not in content.lower() and '#main' not in content.lower():
+            issues.append("Consider adding skip-to-main-content link")
+    
+    # Check for click handlers without keyboard support
+    onclick_count = content.lower().count('onclick=')
+    onkeydown_count = content.lower().count('onkeydown=') + content.lower().count('onkeyup=')
+    if onclick_count > 0 and onkeydown_count == 0:
+        issues.append("onClick without keyboard handler (onKeyDown)")
+    
+    # Check for tabIndex misuse
+    if 'tabindex=' in content.lower():
+        if 'tabindex="-1"' not in content.lower() and 'tabindex="0"' not in content.lower():
+            positive_tabindex = re.findall(r'tabindex="([1-9]\d*)"', content, re.IGNORECASE)
+            if positive_tabindex:
+                issues.append("Avoid positive tabIndex values")
+    
+    # Check for autoplay media
+    if 'autoplay' in content.lower():
+        if 'muted' not in content.lower():
+            issues.append("Autoplay media should be muted")
+    
+    # Check for role usage
+    if 'role="button"' in content.lower():
+        # Divs with role button should have tabindex
+        div_buttons = re.findall(r'<div[^>]*role="button"[^>]*>', content, re.IGNORECASE)
+        for div in div_buttons:
+            if 'tabindex' not in div.lower():
+                issues.append("role='button' without tabindex")
+                break
     
     return issues
 
 
+CHECKERS = [Checker("accessibility", check_content, EXTENSIONS, skip_dirs=SKIP_DIRS, limit=50)]
+
+
+def file_issues(results: dict) -> list:
+    """Per-file issue lists from a scan, skipping clean files."""
+    result = results["accessibility"]
+    all_issues = [{"file": Path(rel).name, "issues": issues} for rel, issues in result.items() if issues]
+    all_issues += [{"file": Path(rel).name, "issues": [f"Error reading file: {error[:50]}"]}
+                   for rel, error in result.errors]
+    return all_issues
+
+
+def collect(project_path: str, results: dict) -> dict:
+    """Build the JSON summary from a scan that included CHECKERS."""
+    result = results["accessibility"]
+    files_checked = len(result.files) + len(result.errors)
+    if not files_checked:
+        return {
+            "script": "accessibility_checker",
+            "project": project_path,
+            "files_checked": 0,
+            "issues_found": 0,
+            "passed": True,
+            "message": "No HTML files found"
+        }
+    
+    all_issues = file_issues(results)
+    total_issues = sum(len(item["issues"]) for item in all_issues)
+    # Accessibility issues are important but not blocking
+    passed = total_issues < 5  # Allow minor issues
+    
+    return {
+        "script": "accessibility_checker",
+        "project": project_path,
+        "files_checked": files_checked,
+        "files_with_issues": len(all_issues),
+        "issues_found": total_issues,
+        "passed": passed
+    }
+
+
+def run(project_path, url=None, options=None) -> Result:
+    """check_runner entry point: scan and summarize in-process."""
+    project_path = str(Path(project_path).resolve())
+    results = scan(project_path, CHECKERS, **scan_options(options))
+    report = collect(project_path, results)
+    result = results["accessibility"]
+    findings = [finding("high", issue, rel) for rel, issues in result.items() for issue in issues]
+    findings += [finding("info", f"Error reading file: {error}", rel) for rel, error in result.errors]
+    return Result(report["passed"], report, findings=findings).add_scan(results)
+
+
 def main():
     project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
     
@@ -118,32 +172,16 @@ def main():
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("-"*60)
     
-    # Find HTML files
-    files = find_html_files(project_path)
-    print(f"Found {len(files)} HTML/JSX/TSX files")
+    # Scan HTML files
+    results = scan(project_path, CHECKERS)
+    output = collect(str(project_path), results)
+    print(f"Found {output['files_checked']} HTML/JSX/TSX files")
     
-    if not files:
-        output = {
-            "script": "accessibility_checker",
-            "project": str(project_path),
-            "files_checked": 0,
-            "issues_found": 0,
-            "passed": True,
-            "message": "No HTML files found"
-        }
+    if not output["files_checked"]:
         print(json.dumps(output, indent=2))
         sys.exit(0)
     
-    # Check each file
-    all_issues = []
-    
-    for f in files:
-        issues = check_accessibility(f)
-        if issues:
-            all_issues.append({
-                "file": str(f.name),
-                "issues": issues
-            })
+    all_issues = file_issues(results)
     
     # Summary
     print("\n" + "="*60)
@@ -161,22 +199,9 @@ def main():
     else:
         print("No accessibility issues found!")
     
-    total_issues = sum(len(item["issues"]) for item in all_issues)
-    # Accessibility issues are important but not blocking
-    passed = total_issues < 5  # Allow minor issues
-    
-    output = {
-        "script": "accessibility_checker",
-        "project": str(project_path),
-        "files_checked": len(files),
-        "files_with_issues": len(all_issues),
-        "issues_found": total_issues,
-        "passed": passed
-    }
-    
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if passed else 1)
+    sys.exit(0 if output["passed"] else 1)
 
 
 if __name__ == "__main__":
@@ -87,6 +87,10 @@ Analyzes code for compliance with:
    - Form labels
 
 Total: 80+ checks across all design principles
+
+The checks are declared as data (RULES) over named facts about the file
+(FACTS), so each pattern is compiled once and evaluated at most once per
+file however many rules read it.
 """
 
 import sys
@@ -95,7 +99,634 @@ import re
 import json
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from scan_engine import Checker, scan, scan_options
+from check_runner import Result, finding
+from source_facts import SourceFacts, extract, VERSION as FACTS_VERSION
+
+# ============================================================================
+#  RULE ENGINE
+# ============================================================================
+#
+# Facts are named probes over one file's source_facts table - regexes over its
+# comment-free text, or queries of its elements, class tokens and CSS
+# declarations - evaluated on first use and shared by every rule that reads them. Rules are data: an id, a scope
+# ("file": at most one message, "match": one message per item), a severity
+# ("issue", "warning" or "pass") and a message template filled from the
+# values the rule's test returns.
+
+CASE, NOCASE, LOWER = "case", "nocase", "lower"
+FILE, MATCH = "file", "match"
+ISSUE, WARNING, PASS = "issue", "warning", "pass"
+
+
+class Probe:
+    """One fact: literal containment ("any") or a regex search/count/findall.
+
+    NOCASE probes are written in lowercase and matched case-sensitively
+    against the lowercased content, which is much faster than IGNORECASE;
+    LOWER probes always read the lowercased content.
+    """
+
+    __slots__ = ("kind", "mode", "literals", "regex", "fallback")
+
+    def __init__(self, kind: str, pattern, mode: str = CASE):
+        self.kind = kind
+        self.mode = mode
+        if mode == NOCASE and any(p != p.lower() for p in ([pattern] if kind != "any" else pattern)):
+            raise ValueError(f"NOCASE probe must be lowercase: {pattern!r}")
+        self.literals = tuple(pattern) if kind == "any" else None
+        source = "|".join(map(re.escape, pattern)) if kind == "any" else pattern
+        self.regex = re.compile(source)
+        self.fallback = re.compile(source, re.IGNORECASE) if mode == NOCASE else self.regex
+
+    def __call__(self, facts: "Facts"):
+        text, regex = facts.content, self.regex
+        if self.mode == LOWER or (self.mode == NOCASE and facts.folded):
+            text = facts.lower
+        elif self.mode == NOCASE:
+            regex = self.fallback
+        if self.kind == "any" and regex is self.regex:
+            return any(literal in text for literal in self.literals)
+        if self.kind in ("any", "search"):
+            return regex.search(text) is not None
+        if self.kind == "count":
+            return len(regex.findall(text))
+        return regex.findall(text)
+
+
+class Facts:
+    """Lazily evaluated, memoized FACTS for one file's source_facts table."""
+
+    __slots__ = ("source", "content", "lower", "folded", "_memo")
+
+    def __init__(self, source: SourceFacts):
+        self.source = source
+        self.content = source.text
+        self.lower = self.content.lower()
+        # Lowercased text stands in for IGNORECASE unless lowering changed the
+        # length or kept characters IGNORECASE folds onto ASCII letters
+        self.folded = len(self.lower) == len(self.content) and 'ſ' not in self.lower and 'ı' not in self.lower
+        self._memo = {}
+
+    def __getitem__(self, name: str):
+        try:
+            return self._memo[name]
+        except KeyError:
+            value = self._memo[name] = FACTS[name](self)
+            return value
+
+
+class Rule:
+    __slots__ = ("id", "scope", "severity", "message", "test")
+
+    def __init__(self, id: str, scope: str, severity: str, message: str, test):
+        self.id = id
+        self.scope = scope
+        self.severity = severity
+        self.message = message
+        self.test = test
+
+    def matches(self, facts: Facts) -> list:
+        """Template values for every message this rule emits on these facts."""
+        if self.scope == MATCH:
+            return list(self.test(facts))
+        hit = self.test(facts)
+        if not hit:
+            return []
+        return [hit if isinstance(hit, dict) else {}]
+
+
+# ---- Derived facts ----------------------------------------------------------
+
+GENERIC_FONTS = {'sans-serif', 'serif', 'monospace', 'cursive', 'fantasy', 'system-ui', 'inherit', 'arial',
+                 'georgia', 'times new roman', 'courier new', 'verdana', 'helvetica', 'tahoma'}
+WEIGHT_NAMES = {'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500',
+                'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900'}
+COMMON_RATIOS = {1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618}
+LAYOUT_PROPS = ['width', 'height', 'top', 'left', 'right', 'bottom', 'margin', 'padding']
+PURPLES = ['#8B5CF6', '#A855F7', '#9333EA', '#7C3AED', '#6D28D9',
+           '#8B5CF6', '#A78BFA', '#C4B5FD', '#DDD6FE', '#EDE9FE',
+           '#8b5cf6', '#a855f7', '#9333ea', '#7c3aed', '#6d28d9',
+           'purple', 'violet', 'fuchsia', 'magenta', 'lavender']
+
+
+HEADING = re.compile(r'[hH][1-6]')
+SMALL_HEIGHT = re.compile(r'h-(?:[1-9](?:\.5)?|10)')
+LEADING = re.compile(r'leading-(\d+(?:\.\d+)?)')
+NUMBER = re.compile(r'\d+(?:\.\d+)?|\.\d+')
+FONT_SIZE = re.compile(r'(\d+(?:\.\d+)?)(px|rem|em)')
+DURATION = re.compile(r'(\d*\.?\d+)(ms|s)\b')
+GLOW = re.compile(r'0\s+0\s+')
+
+
+def _utility(token: str) -> str:
+    """A class token without its variant prefixes (md:hover:h-8 -> h-8)."""
+    return token.rsplit(':', 1)[-1]
+
+
+def _matches(pattern, values: list) -> list:
+    """pattern's groups for every value it matches at the start of."""
+    return [m.groups() for m in map(pattern.match, values) if m]
+
+
+def _tag_count(*tags: str):
+    return lambda f: sum(1 for el in f.source.elements if el.tag.lower() in tags)
+
+
+def _nav_items(f: Facts) -> int:
+    links = sum(1 for el in f.source.elements
+                if el.tag in ('NavLink', 'Link') or (el.tag.lower() == 'a' and 'href' in el.attrs))
+    return links + f.source.classes.count('nav-item')
+
+
+def _labels(f: Facts) -> bool:
+    return any(el.tag.lower() == 'label' or 'placeholder' in el.attrs or 'aria-label' in el.attrs
+               for el in f.source.elements)
+
+
+def _radios(f: Facts) -> bool:
+    return any(el.tag.lower() == 'input' and (el.attrs.get('type') or '').lower() == 'radio'
+               for el in f.source.elements)
+
+
+def _line_heights(f: Facts) -> list:
+    heights = [m.group(1) for m in map(LEADING.fullmatch, map(_utility, f.source.classes)) if m]
+    return heights + [m.group() for m in map(NUMBER.match, f.source.values('line-height')) if m]
+
+
+def _font_families(f: Facts) -> set:
+    families = {font.strip().lower() for font in f["font_faces"]}
+    for font in f["google_fonts"]:
+        for name in font.replace('+', ' ').split('|'):
+            families.add(name.split(':')[0].strip().lower())
+    for family in f["font_family_css"]:
+        first_font = family.split(',')[0].strip().strip('"\'')  # First font of the stack
+        if first_font.lower() not in GENERIC_FONTS:
+            families.add(first_font.lower())
+    return families
+
+
+def _weight_values(f: Facts) -> list:
+    values = []
+    for w in f["font_weights"]:
+        val = w[0] or w[1]
+        if val:
+            try:
+                values.append(int(WEIGHT_NAMES.get(val.lower(), val)))
+            except ValueError:
+                pass
+    return values
+
+
+def _scale_ratio(f: Facts):
+    """First font-size step off every common modular scale ratio, if any."""
+    sizes = [float(size) / (16 if unit == 'px' else 1) for size, unit in f["font_sizes"]]  # In rem
+    if len(sizes) <= 2:
+        return None
+    steps = sorted(set(sizes))
+    ratios = [steps[i] / steps[i - 1] for i in range(1, len(steps)) if steps[i - 1] > 0]
+    for ratio in ratios[:3]:
+        if not any(abs(ratio - cr) < 0.05 for cr in COMMON_RATIOS):
+            return ratio
+    return None
+
+
+def _shadow_opacities(f: Facts) -> list:
+    return [float(o) for o in f["rgba_alphas"] if float(o) < 0.5]
+
+
+def _purple(f: Facts):
+    return next((purple for purple in PURPLES if purple.lower() in f.lower), None)
+
+
+def _expensive_props(f: Facts) -> str:
+    return ', '.join(dict.fromkeys(f["layout_props"]))
+
+
+def _hue_range(f: Facts) -> int:
+    hues = [int(h) for h in f["hsl_hues"]]
+    return max(hues) - min(hues)
+
+
+FACTS = {
+    # Shared page facts
+    "long_text": Probe("search", r'<p|<div.*class=.*text|article|<span.*text', NOCASE),
+    "form": Probe("any", ('<form', '<input', 'password', 'credit', 'card', 'payment'), NOCASE),
+    "form_elements": _tag_count('input', 'select', 'textarea', 'option'),
+    "form_fields": _tag_count('input', 'select', 'textarea'),
+    "nav_items": _nav_items,
+    "nav_labels": Probe("findall", r'<navlink|<link|<a\s+href[^>]*>([^<]+)</a>', NOCASE),
+    "hero": Probe("any", ('hero', '<h1', 'banner'), NOCASE),
+    "gradient": Probe("any", ('gradient',)),
+    "animation": Probe("any", ('@keyframes', 'transition:', 'animate-')),
+    "animations": Probe("count", r'@keyframes|transition:|animate-'),
+    "keyframes_or_transition": Probe("any", ('@keyframes', 'transition:')),
+    "background": Probe("any", ('background:', 'bg-')),
+    "click_handler": Probe("any", ('onClick', '@click', 'onclick')),
+    "hover_focus": Probe("any", ('hover:', 'focus:', ':hover', ':focus')),
+    "shadows": lambda f: f.source.values('box-shadow'),
+    "rgba_alphas": Probe("findall", r'rgba?\([^)]+,\s*([\d.]+)\)'),
+    "text_shadows": lambda f: f.source.values('text-shadow'),
+    "lottie": Probe("any", ('lottie', 'Lottie')),
+    "gsap": Probe("any", ('gsap', 'ScrollTrigger')),
+    # Psychology, emotion, trust, cognitive load, persuasion
+    "small_target_px": Probe("search", r'height:\s*([0-3]\d)px'),
+    "small_target_class": lambda f: any(SMALL_HEIGHT.fullmatch(_utility(t)) for t in f.source.classes),
+    "stepped": Probe("any", ('step', 'wizard', 'stage'), NOCASE),
+    "button": Probe("any", ('button',), LOWER),
+    "primary": Probe("any", ('primary',), NOCASE),
+    "feedback": Probe("any", ('transition', 'animate', 'hover:', 'focus:', 'disabled', 'loading', 'spinner'), NOCASE),
+    "state_change": Probe("any", ('setState', 'useState', 'disabled', 'loading')),
+    "reflective": Probe("any", ('about', 'story', 'mission', 'values', 'why we', 'our journey', 'testimonials'), NOCASE),
+    "security_signal": Probe("any", ('ssl', 'secure', 'encrypt', 'lock', 'padlock', 'https'), NOCASE),
+    "checkout": Probe("any", ('checkout', 'payment'), NOCASE),
+    "social_proof": Probe("any", ('review', 'testimonial', 'rating', 'star', 'trust', 'customer', 'logo'), NOCASE),
+    "footer": Probe("any", ('footer',), NOCASE),
+    "authority": Probe("any", ('certif', 'award', 'media', 'press', 'featured', 'as seen in'), NOCASE),
+    "progressive": Probe("any", ('step', 'wizard', 'stage', 'accordion', 'collapsible', 'tab', 'more...',
+                                 'advanced', 'show more'), NOCASE),
+    "color_literals": Probe("count", r'#[0-9a-fA-F]{3,6}|rgb|hsl'),
+    "borders": Probe("count", r'border:|border-'),
+    "labels": _labels,
+    "defaults": Probe("search", r'checked|selected|default|value=["\'].*["\']'),
+    "radios": _radios,
+    "price": Probe("search", r'price|pricing|cost|\$\d+', NOCASE),
+    "price_anchor": Probe("search", r'original|was|strike|del|save \d+%', NOCASE),
+    "community": Probe("any", ('join', 'subscriber', 'member', 'user'), NOCASE),
+    "specific_count": Probe("search", r'\d+[+kmb]|\d+,\d+'),
+    "progress": Probe("search", r'progress|step \d+|complete|%|bar', NOCASE),
+    # Typography
+    "font_faces": Probe("findall", r'@font-face\s*\{[^}]*family:\s*["\']?([^;"\'\s}]+)', NOCASE),
+    "google_fonts": Probe("findall", r'fonts\.googleapis\.com[^"\']*family=([^"&]+)', NOCASE),
+    "font_family_css": lambda f: f.source.values('font-family'),
+    "font_families": _font_families,
+    "line_length": Probe("search", r'max-w-(?:prose|[\[\\]?\d+ch[\]\\]?)|max-width:\s*\d+ch'),
+    "text_elements": Probe("search", r'<p|<span|<div.*text|<h[1-6]', NOCASE),
+    "line_height": Probe("any", ('leading-', 'line-height:')),
+    "heading_text": Probe("search", r'<h[1-6]|text-(?:xl|2xl|3xl|4xl|5xl|6xl)', NOCASE),
+    "line_heights": _line_heights,
+    "uppercase": Probe("any", ('uppercase',), NOCASE),
+    "tracking": Probe("any", ('tracking-', 'letter-spacing:')),
+    "display_text": Probe("search", r'text-(?:4xl|5xl|6xl|7xl|8xl|9xl)|font-size:\s*[3-9]\dpx'),
+    "tight_tracking": Probe("search", r'tracking-tight|letter-spacing:\s*-[0-9]'),
+    "font_weights": Probe("findall", r'font-weight:\s*(\d+)|font-(?:thin|extralight|light|normal|medium|semibold|bold'
+                                     r'|extrabold|black)|fw-(\d+)', NOCASE),
+    "weight_values": _weight_values,
+    "font_size": Probe("search", r'font-size:|text-(?:xs|sm|base|lg|xl|2xl)'),
+    "fluid_type": Probe("any", ('clamp(', 'responsive:')),
+    "headings": lambda f: [el.tag for el in f.source.elements if HEADING.fullmatch(el.tag)],
+    "font_sizes": lambda f: _matches(FONT_SIZE, f.source.values('font-size')),
+    "scale_ratio": _scale_ratio,
+    "paragraphs": Probe("findall", r'<p[^>]*>([^<]+)</p>', NOCASE),
+    "subheadings": Probe("search", r'<h[2-6]', NOCASE),
+    # Visual effects
+    "blur": Probe("any", ('backdrop-filter', 'blur(')),
+    "translucent_bg": Probe("search", r'background:\s*rgba|bg-opacity|bg-[a-z0-9]+\/\d+'),
+    "layout_props": Probe("findall", r'width|height|top|left|right|bottom|margin|padding'),
+    "expensive_props": _expensive_props,
+    "reduced_motion": Probe("any", ('prefers-reduced-motion',)),
+    "layered_shadow": Probe("search", r'\d+px\s+[1-9]\d*px'),
+    "shadow_opacities": _shadow_opacities,
+    "gradients": Probe("count", r'gradient', NOCASE),
+    "border": Probe("any", ('border:', 'border-')),
+    "border_declarations": Probe("count", r'border:'),
+    "glows": lambda f: sum(1 for s in f["shadows"] if GLOW.search(s)),
+    "images": Probe("any", ('<img', 'background-image:', 'bg-[url')),
+    "overlay": Probe("search", r'overlay|rgba\(0|gradient.*transparent|::after|::before'),
+    "will_change": lambda f: f.source.values('will-change'),
+    "will_change_count": lambda f: len(f["will_change"]),
+    "blurs": Probe("count", r'backdrop-filter|blur\('),
+    # Color
+    "purple": _purple,
+    "hex_colors": Probe("count", r'#[0-9a-fA-F]{3,6}'),
+    "hsl_colors": Probe("count", r'hsl\('),
+    "bg_declaration": Probe("search", r'(?:background|bg-|bg\[)([^;}\s]+)'),
+    "text_declaration": Probe("search", r'(?:color|text-)([^;}\s]+)'),
+    "hex6": Probe("findall", r'#[0-9a-fA-F]{6}'),
+    "hsl_hues": Probe("findall", r'hsl\((\d+),\s*\d+%,\s*\d+%\)'),
+    "hue_range": _hue_range,
+    "pure_black": Probe("search", r'color:\s*#000000|#000\b'),
+    "pure_white": Probe("search", r'background:\s*#ffffff|#fff\b'),
+    "dark_mode": Probe("any", ('dark:',)),
+    "low_contrast": Probe("search", r'bg-(?:gray|slate|zinc)-50|bg-white.*text-(?:gray|slate)-[12]'
+                                    r'|bg-(?:gray|slate|zinct)-9|bg-black.*text-(?:gray|slate)-[89]'),
+    "blue": Probe("search", r'bg-blue|text-blue|from-blue|#[0-9a-fA-F]*00[0-9A-Fa-f]{2}|#[0-9a-fA-F]*1[0-9A-Fa-f]{2}'),
+    "food": Probe("any", ('restaurant', 'food', 'cooking', 'recipe', 'menu', 'dish', 'meal'), NOCASE),
+    "color_vars": Probe("any", ('color-', 'primary-', 'secondary-')),
+    "hsl": Probe("any", ('hsl(',)),
+    # Animation and motion
+    "durations": lambda f: _matches(DURATION, f.source.values('duration', 'animation-duration', 'transition-duration')),
+    "transition_word": Probe("any", ('transition',), LOWER),
+    "entry_ease_in": Probe("search", r'ease-in\s+.*entry|fade-in.*ease-in'),
+    "exit_ease_out": Probe("search", r'ease-out\s+.*exit|fade-out.*ease-out'),
+    "interactive": Probe("count", r'<button|<a\s+href|onClick|@click'),
+    "async": Probe("any", ('async', 'await', 'fetch', 'axios', 'loading', 'isLoading')),
+    "loading_indicator": Probe("search", r'skeleton|spinner|progress|loading|<circle.*animate'),
+    "routing": Probe("search", r'router|navigate|Link.*to|useHistory'),
+    "page_transition": Probe("search", r'AnimatePresence|motion\.|transition.*page|fade.*route'),
+    "scroll_animation": Probe("search", r'onScroll|scroll.*trigger|IntersectionObserver'),
+    "scroll_layout": Probe("search", r'onScroll.*[^\w](width|height|top|left)'),
+    "lottie_fallback": Probe("search", r'prefers-reduced-motion.*lottie|lottie.*isPaused|lottie.*stop'),
+    "gsap_cleanup": Probe("search", r'kill\(|revert\(|useEffect.*return.*gsap'),
+    "svg_animations": Probe("count", r'<animate|<animateTransform|stroke-dasharray|stroke-dashoffset'),
+    "transform_3d": Probe("search", r'transform3d|perspective\(|rotate3d|translate3d'),
+    "perspective": Probe("search", r'perspective:\s*\d+px|perspective\s*\('),
+    "particles": Probe("search", r'particle|canvas.*loop|requestAnimationFrame.*draw|Three\.js'),
+    "scroll_driven": Probe("search", r'IntersectionObserver.*animate|scroll.*progress|view-timeline'),
+    "throttled": Probe("any", ('throttle', 'debounce', 'requestAnimationFrame')),
+    "functional_animations": Probe("count", r'hover:|focus:|disabled|loading|error|success'),
+    # Accessibility
+    "img_without_alt": lambda f: any(el.tag.lower() == 'img' and 'alt' not in el.attrs for el in f.source.elements),
+}
+
+
+def _serial_position(f: Facts):
+    if f["nav_items"] <= 3:
+        return False
+    labels = f["nav_labels"]
+    return len(labels) > 2 and not any(x in labels[-1].lower() for x in
+                                       ['contact', 'login', 'sign', 'get started', 'cta', 'button'])
+
+
+def _effect_count(f: Facts) -> int:
+    return f["gradient"] + len(f["shadows"]) + f["blurs"] + len(f["text_shadows"])
+
+
+def _animation_count(f: Facts) -> int:
+    return f["animations"] + f["lottie"] + f["gsap"]
+
+
+def _adjacent_weights(f: Facts):
+    values = f["weight_values"]
+    for a, b in zip(values, values[1:]):
+        if abs(a - b) == 100:
+            yield {"a": a, "b": b}
+
+
+def _skipped_headings(f: Facts):
+    headings = f["headings"]
+    for a, b in zip(headings, headings[1:]):
+        if int(b[1]) > int(a[1]) + 1:
+            yield {"a": int(a[1]), "b": int(b[1])}
+
+
+def _uniform_shadows(f: Facts) -> bool:
+    if not f["shadows"]:
+        return False
+    opacities = f["shadow_opacities"]
+    return len(f["shadows"]) >= 3 and len(opacities) > 0 and len(set(opacities)) < 2
+
+
+def _durations(f: Facts):
+    for duration, unit in f["durations"]:
+        duration_ms = float(duration) * (1000 if unit == 's' else 1)
+        if duration_ms < 50:
+            yield {"problem": "Very fast animation", "value": f"{duration}{unit}",
+                   "advice": "Minimum 50ms for visibility."}
+        elif duration_ms > 1000 and f["transition_word"]:
+            yield {"problem": "Long transition", "value": f"{duration}{unit}",
+                   "advice": "Transitions should be 100-300ms for responsiveness."}
+
+
+RULES = [
+    # --- 1. PSYCHOLOGY LAWS ---
+    Rule("hicks-law", FILE, ISSUE, "[Hick's Law] {file}: {n} nav items (Max 7)",
+         lambda f: f["nav_items"] > 7 and {"n": f["nav_items"]}),
+    Rule("fitts-law", FILE, WARNING, "[Fitts' Law] {file}: Small targets (< 44px)",
+         lambda f: f["small_target_px"] or f["small_target_class"]),
+    Rule("millers-law", FILE, WARNING, "[Miller's Law] {file}: Complex form ({n} fields)",
+         lambda f: f["form_fields"] > 7 and not f["stepped"] and {"n": f["form_fields"]}),
+    Rule("von-restorff", FILE, WARNING, "[Von Restorff] {file}: No primary CTA",
+         lambda f: f["button"] and not f["primary"]),
+    Rule("serial-position", FILE, WARNING,
+         "[Serial Position] {file}: Last nav item may not be important. Place key actions at start/end.",
+         _serial_position),
+    # --- 1.5 EMOTIONAL DESIGN (Don Norman) ---
+    Rule("visceral", FILE, WARNING,
+         "[Visceral] {file}: Hero section lacks visual appeal. Consider gradients or subtle animations.",
+         lambda f: f["hero"] and not (f["gradient"] or f["animation"]) and not f["background"]),
+    Rule("behavioral", FILE, WARNING,
+         "[Behavioral] {file}: Interactive elements lack immediate feedback. Add hover/focus/disabled states.",
+         lambda f: f["click_handler"] and not f["feedback"] and not f["state_change"]),
+    Rule("reflective", FILE, WARNING,
+         "[Reflective] {file}: Long-form content without brand story/values. Add 'About' or 'Why We Exist' section.",
+         lambda f: f["long_text"] and not f["reflective"]),
+    # --- 1.6 TRUST BUILDING ---
+    Rule("trust-security", FILE, WARNING,
+         "[Trust] {file}: Form without security indicators. Add 'SSL Secure' or lock icon.",
+         lambda f: f["form"] and not f["security_signal"] and not f["checkout"]),
+    Rule("trust-social-proof", FILE, PASS, "", lambda f: f["social_proof"]),
+    Rule("trust-no-social-proof", FILE, WARNING,
+         "[Trust] {file}: No social proof detected. Consider adding testimonials, ratings, or 'Trusted by' logos.",
+         lambda f: not f["social_proof"] and f["long_text"]),
+    Rule("trust-authority", FILE, WARNING,
+         "[Trust] {file}: Footer lacks authority signals. Add certifications, awards, or media mentions.",
+         lambda f: f["footer"] and not f["authority"]),
+    # --- 1.7 COGNITIVE LOAD MANAGEMENT ---
+    Rule("progressive-disclosure", FILE, WARNING,
+         "[Cognitive Load] {file}: Many form elements without progressive disclosure. "
+         "Consider accordion, tabs, or 'Advanced' toggle.",
+         lambda f: f["form_elements"] > 5 and not f["progressive"]),
+    Rule("visual-noise", FILE, WARNING,
+         "[Cognitive Load] {file}: High visual noise detected. Many colors and borders increase cognitive load.",
+         lambda f: f["color_literals"] > 15 and f["borders"] > 10),
+    Rule("form-labels", FILE, ISSUE,
+         "[Cognitive Load] {file}: Form inputs without labels. Use <label> for accessibility and clarity.",
+         lambda f: f["form"] and not f["labels"]),
+    # --- 1.8 PERSUASIVE DESIGN (Ethical) ---
+    Rule("smart-defaults", FILE, WARNING,
+         "[Persuasion] {file}: Radio buttons without default selection. Pre-select recommended option.",
+         lambda f: f["form"] and f["radios"] and not f["defaults"]),
+    Rule("price-anchoring", FILE, WARNING,
+         "[Persuasion] {file}: Prices without anchoring. Show original price to frame discount value.",
+         lambda f: f["price"] and not f["price_anchor"]),
+    Rule("social-numbers", FILE, WARNING,
+         "[Persuasion] {file}: Social proof without specific numbers. Use 'Join 10,000+' format.",
+         lambda f: f["community"] and not f["specific_count"]),
+    Rule("progress-indicator", FILE, WARNING,
+         "[Persuasion] {file}: Long form without progress indicator. Add progress bar or 'Step X of Y'.",
+         lambda f: f["form"] and f["form_elements"] > 5 and not f["progress"]),
+    # --- 2. TYPOGRAPHY SYSTEM ---
+    Rule("font-pairing", FILE, ISSUE,
+         "[Typography] {file}: {n} font families detected. Limit to 2-3 for cohesion.",
+         lambda f: len(f["font_families"]) > 3 and {"n": len(f["font_families"])}),
+    Rule("line-length", FILE, WARNING,
+         "[Typography] {file}: No line length constraint (45-75ch). Use max-w-prose or max-w-[65ch].",
+         lambda f: f["long_text"] and not f["line_length"]),
+    Rule("line-height", FILE, WARNING,
+         "[Typography] {file}: Text elements found without line-height. Body: 1.4-1.6, Headings: 1.1-1.3",
+         lambda f: f["text_elements"] and not f["line_height"]),
+    Rule("heading-line-height", MATCH, WARNING,
+         "[Typography] {file}: Heading has line-height {lh} (>1.3). Headings should be tighter (1.1-1.3).",
+         lambda f: ({"lh": lh} for lh in (f["line_heights"] if f["heading_text"] else []) if float(lh) > 1.5)),
+    Rule("uppercase-tracking", FILE, WARNING,
+         "[Typography] {file}: Uppercase text without tracking. ALL CAPS needs +5-10% spacing.",
+         lambda f: f["uppercase"] and not f["tracking"]),
+    Rule("display-tracking", FILE, WARNING,
+         "[Typography] {file}: Large display text without tracking-tight. Big text needs -1% to -4% spacing.",
+         lambda f: f["display_text"] and not f["tight_tracking"]),
+    Rule("adjacent-weights", MATCH, WARNING,
+         "[Typography] {file}: Adjacent font weights ({a}/{b}). Skip at least 2 levels for contrast.",
+         _adjacent_weights),
+    Rule("weight-count", FILE, WARNING,
+         "[Typography] {file}: {n} font weights. Limit to 3-4 per page.",
+         lambda f: len(set(f["weight_values"])) > 4 and {"n": len(set(f["weight_values"]))}),
+    Rule("fluid-type", FILE, WARNING,
+         "[Typography] {file}: Fixed font sizes without clamp(). Consider fluid typography: clamp(MIN, PREFERRED, MAX)",
+         lambda f: f["font_size"] and not f["fluid_type"]),
+    Rule("heading-skip", MATCH, WARNING,
+         "[Typography] {file}: Skipped heading level (h{a} -> h{b}). Maintain sequential hierarchy.",
+         _skipped_headings),
+    Rule("missing-h1", FILE, WARNING,
+         "[Typography] {file}: No h1 found. Each page should have one primary heading.",
+         lambda f: f["headings"] and 'h1' not in [h.lower() for h in f["headings"]] and f["long_text"]),
+    Rule("modular-scale", FILE, WARNING,
+         "[Typography] {file}: Font sizes may not follow modular scale (ratio: {ratio:.2f}). "
+         "Consider consistent ratio like 1.25 (Major Third).",
+         lambda f: f["scale_ratio"] is not None and {"ratio": f["scale_ratio"]}),
+    Rule("long-paragraph", MATCH, WARNING,
+         "[Typography] {file}: Long paragraph detected ({n} words). Break into 3-4 line chunks for readability.",
+         lambda f: ({"n": n} for n in (len(p.split()) for p in f["paragraphs"]) if n > 100)),
+    Rule("subheadings", FILE, WARNING,
+         "[Typography] {file}: Long content without subheadings. Add h2/h3 to break up text.",
+         lambda f: len(f["paragraphs"]) > 5 and not f["subheadings"]),
+    # --- 3. VISUAL EFFECTS ---
+    Rule("glassmorphism", FILE, WARNING,
+         "[Visual] {file}: Blur used without semi-transparent background (Glassmorphism fail)",
+         lambda f: f["blur"] and not f["translucent_bg"]),
+    Rule("animated-layout", FILE, WARNING,
+         "[Performance] {file}: Animating expensive properties ({props}). Use transform/opacity where possible.",
+         lambda f: f["keyframes_or_transition"] and f["layout_props"] and {"props": f["expensive_props"]}),
+    Rule("reduced-motion", FILE, WARNING,
+         "[Accessibility] {file}: Animations found without prefers-reduced-motion check",
+         lambda f: f["keyframes_or_transition"] and not f["reduced_motion"]),
+    Rule("natural-shadow", MATCH, WARNING,
+         "[Visual] {file}: Simple/Unnatural shadow detected. Consider multiple layers or Y > X offset for realism.",
+         lambda f: ({} for s in f["shadows"] if ',' not in s and not FACTS["layered_shadow"].regex.search(s))),
+    Rule("neomorphism", MATCH, WARNING,
+         "[Visual] {file}: Neomorphism inset detected. Ensure adequate contrast for accessibility.",
+         lambda f: ({} for s in f["shadows"] if ',' in s and '-' in s and 'inset' in s)),
+    Rule("shadow-hierarchy", FILE, WARNING,
+         "[Visual] {file}: All shadows at same opacity level. Vary shadow intensity for elevation hierarchy.",
+         _uniform_shadows),
+    Rule("gradient-overuse", FILE, WARNING,
+         "[Visual] {file}: Many gradients detected ({n}). Ensure this serves purpose, not decoration.",
+         lambda f: f["gradient"] and f["gradients"] > 5 and {"n": f["gradients"]}),
+    Rule("hero-depth", FILE, WARNING,
+         "[Visual] {file}: Hero section without visual interest. Consider gradient for depth.",
+         lambda f: not f["gradient"] and f["hero"] and not f["background"]),
+    Rule("border-count", FILE, WARNING,
+         "[Visual] {file}: Many border declarations ({n}). Simplify for cleaner look.",
+         lambda f: f["border"] and f["border_declarations"] > 8 and {"n": f["border_declarations"]}),
+    Rule("text-glow", MATCH, WARNING,
+         "[Visual] {file}: Text glow effect detected. Ensure readability is maintained.",
+         lambda f: ({} for ts in f["text_shadows"] if ',' in ts)),
+    Rule("box-glow", FILE, WARNING,
+         "[Visual] {file}: Multiple glow effects detected. Use sparingly for emphasis only.",
+         lambda f: f["glows"] > 2),
+    Rule("image-overlay", FILE, WARNING,
+         "[Visual] {file}: Text over image without overlay. Add gradient overlay for readability.",
+         lambda f: f["images"] and f["long_text"] and not f["overlay"]),
+    Rule("will-change-layout", MATCH, ISSUE,
+         "[Performance] {file}: will-change on '{prop}' (layout property). Use only for transform/opacity.",
+         lambda f: ({"prop": p} for p in (p.strip().lower() for p in f["will_change"]) if p in LAYOUT_PROPS)),
+    Rule("will-change-count", FILE, WARNING,
+         "[Performance] {file}: Many will-change declarations ({n}). Use sparingly, only for heavy animations.",
+         lambda f: f["will_change_count"] > 3 and {"n": f["will_change_count"]}),
+    Rule("effect-overuse", FILE, WARNING,
+         "[Visual] {file}: Many visual effects ({n}). Ensure effects serve purpose, not decoration.",
+         lambda f: _effect_count(f) > 10 and {"n": _effect_count(f)}),
+    Rule("flat-design", FILE, WARNING,
+         "[Visual] {file}: Flat design with no depth. Consider shadows or subtle gradients for hierarchy.",
+         lambda f: f["long_text"] and _effect_count(f) == 0),
+    # --- 4. COLOR SYSTEM ---
+    Rule("purple-ban", FILE, ISSUE,
+         "[Color] {file}: PURPLE DETECTED ('{color}'). Banned by Maestro rules. Use Teal/Cyan/Emerald instead.",
+         lambda f: f["purple"] and {"color": f["purple"]}),
+    Rule("color-count", FILE, WARNING,
+         "[Color] {file}: {n} distinct colors. Consider 60-30-10 rule: dominant (60%), secondary (30%), accent (10%).",
+         lambda f: f["hex_colors"] + f["hsl_colors"] > 3 and f["bg_declaration"] and f["text_declaration"]
+         and len(set(f["hex6"])) > 5 and {"n": len(set(f["hex6"]))}),
+    Rule("monochromatic", FILE, WARNING,
+         "[Color] {file}: Monochromatic palette detected (hue variance: {n}deg). Ensure adequate contrast.",
+         lambda f: len(f["hsl_hues"]) >= 3 and f["hue_range"] < 10 and {"n": f["hue_range"]}),
+    Rule("pure-black", FILE, WARNING,
+         "[Color] {file}: Pure black (#000000) detected. Use #1a1a1a or darker grays for better dark mode.",
+         lambda f: f["pure_black"]),
+    Rule("pure-white", FILE, WARNING,
+         "[Color] {file}: Pure white background in dark mode context. "
+         "Use slight off-white (#f9fafb) for reduced eye strain.",
+         lambda f: f["pure_white"] and f["dark_mode"]),
+    Rule("low-contrast", FILE, WARNING,
+         "[Color] {file}: Possible low-contrast combination detected. Verify WCAG AA (4.5:1 for text).",
+         lambda f: f["low_contrast"]),
+    Rule("blue-food", FILE, WARNING,
+         "[Color] {file}: Blue color in food context. Blue suppresses appetite; consider warm colors (red, orange, yellow).",
+         lambda f: f["food"] and f["blue"]),
+    Rule("hsl-palette", FILE, WARNING,
+         "[Color] {file}: Color variables without HSL. Consider HSL for easier palette adjustment "
+         "(Hue, Saturation, Lightness).",
+         lambda f: f["color_vars"] and not f["hsl"]),
+    # --- 5. ANIMATION GUIDE ---
+    Rule("animation-duration", MATCH, WARNING, "[Animation] {file}: {problem} ({value}). {advice}", _durations),
+    Rule("easing-entry", FILE, WARNING,
+         "[Animation] {file}: Entry animation with ease-in. Entry should use ease-out for snappy feel.",
+         lambda f: f["entry_ease_in"]),
+    Rule("easing-exit", FILE, WARNING,
+         "[Animation] {file}: Exit animation with ease-out. Exit should use ease-in for natural feel.",
+         lambda f: f["exit_ease_out"]),
+    Rule("micro-interactions", FILE, WARNING,
+         "[Animation] {file}: Interactive elements without hover/focus states. Add micro-interactions for feedback.",
+         lambda f: f["interactive"] > 2 and not f["hover_focus"]),
+    Rule("loading-state", FILE, WARNING,
+         "[Animation] {file}: Async operations without loading indicator. "
+         "Add skeleton or spinner for perceived performance.",
+         lambda f: f["async"] and not f["loading_indicator"]),
+    Rule("page-transition", FILE, WARNING,
+         "[Animation] {file}: Routing detected without page transitions. Consider fade/slide for context continuity.",
+         lambda f: f["routing"] and not f["page_transition"]),
+    Rule("scroll-layout", FILE, ISSUE,
+         "[Animation] {file}: Scroll handler animating layout properties. Use transform/opacity for 60fps.",
+         lambda f: f["scroll_animation"] and f["scroll_layout"]),
+    # --- 6. MOTION GRAPHICS ---
+    Rule("lottie-fallback", FILE, WARNING,
+         "[Motion] {file}: Lottie animation without reduced-motion fallback. Add pause/stop for accessibility.",
+         lambda f: f["lottie"] and not f["lottie_fallback"]),
+    Rule("gsap-cleanup", FILE, ISSUE,
+         "[Motion] {file}: GSAP animation without cleanup (kill/revert). Memory leak risk on unmount.",
+         lambda f: f["gsap"] and not f["gsap_cleanup"]),
+    Rule("svg-animations", FILE, WARNING,
+         "[Motion] {file}: Multiple SVG animations detected. "
+         "Ensure stroke-dashoffset is used sparingly for mobile performance.",
+         lambda f: f["svg_animations"] > 3),
+    Rule("3d-perspective", FILE, WARNING,
+         "[Motion] {file}: 3D transform without perspective parent. Add perspective: 1000px for realistic depth.",
+         lambda f: f["transform_3d"] and not f["perspective"]),
+    Rule("3d-mobile", FILE, WARNING,
+         "[Motion] {file}: 3D transforms detected. Test on mobile; can impact performance on low-end devices.",
+         lambda f: f["transform_3d"]),
+    Rule("particles", FILE, WARNING,
+         "[Motion] {file}: Particle effects detected. Ensure fallback or reduced-quality option for mobile devices.",
+         lambda f: f["particles"]),
+    Rule("scroll-throttle", FILE, ISSUE,
+         "[Motion] {file}: Scroll-driven animation without throttling. Add requestAnimationFrame for 60fps.",
+         lambda f: f["scroll_driven"] and not f["throttled"]),
+    Rule("decorative-motion", FILE, WARNING,
+         "[Motion] {file}: Many animations ({n}). Ensure majority serve functional purpose "
+         "(feedback, guidance), not decoration.",
+         lambda f: _animation_count(f) > 5 and f["functional_animations"] < _animation_count(f) / 2
+         and {"n": _animation_count(f)}),
+    # --- 7. ACCESSIBILITY ---
+    Rule("img-alt", FILE, ISSUE, "[Accessibility] {file}: Missing img alt text",
+         lambda f: f["img_without_alt"]),
+]
+
+
 class UXAuditor:
+    EXTENSIONS = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
+    SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next'}
+
     def __init__(self):
         self.issues = []
         self.warnings = []
@@ -107,577 +738,32 @@ class UXAuditor:
             with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
                 content = f.read()
         except: return
-        
+        self.audit_content(filepath, content)
+
+    def audit_content(self, filepath: str, content: str) -> None:
         self.files_checked += 1
         filename = os.path.basename(filepath)
+        facts = Facts(extract(content, os.path.splitext(filepath)[1]))
 
-        # Pre-calculate common flags
-        has_long_text = bool(re.search(r'<p|<div.*class=.*text|article|<span.*text', content, re.IGNORECASE))
-        has_form = bool(re.search(r'<form|<input|password|credit|card|payment', content, re.IGNORECASE))
-        complex_elements = len(re.findall(r'<input|<select|<textarea|<option', content, re.IGNORECASE))
-
-        # --- 1. PSYCHOLOGY LAWS ---
-        # Hick's Law
-        nav_items = len(re.findall(r'<NavLink|<Link|<a\s+href|nav-item', content, re.IGNORECASE))
-        if nav_items > 7:
-            self.issues.append(f"[Hick's Law] {filename}: {nav_items} nav items (Max 7)")
-        
-        # Fitts' Law
-        if re.search(r'height:\s*([0-3]\d)px', content) or re.search(r'h-[1-9]\b|h-10\b', content):
-            self.warnings.append(f"[Fitts' Law] {filename}: Small targets (< 44px)")
-        
-        # Miller's Law
-        form_fields = len(re.findall(r'<input|<select|<textarea', content, re.IGNORECASE))
-        if form_fields > 7 and not re.search(r'step|wizard|stage', content, re.IGNORECASE):
-            self.warnings.append(f"[Miller's Law] {filename}: Complex form ({form_fields} fields)")
-            
-        # Von Restorff
-        if 'button' in content.lower() and not re.search(r'primary|bg-primary|Button.*primary|variant=["\']primary', content, re.IGNORECASE):
-            self.warnings.append(f"[Von Restorff] {filename}: No primary CTA")
-
-        # Serial Position Effect - Important items at beginning/end
-        if nav_items > 3:
-            # Check if last nav item is important (contact, login, etc.)
-            nav_content = re.findall(r'<NavLink|<Link|<a\s+href[^>]*>([^<]+)</a>', content, re.IGNORECASE)
-            if nav_content and len(nav_content) > 2:
-                last_item = nav_content[-1].lower() if nav_content else ''
-                if not any(x in last_item for x in ['contact', 'login', 'sign', 'get started', 'cta', 'button']):
-                    self.warnings.append(f"[Serial Position] {filename}: Last nav item may not be important. Place key actions at start/end.")
-
-        # --- 1.5 EMOTIONAL DESIGN (Don Norman) ---
-
-        # Visceral: First impressions (aesthetics, gradients, animations)
-        has_hero = bool(re.search(r'hero|<h1|banner', content, re.IGNORECASE))
-        if has_hero:
-            # Check for visual appeal elements
-            has_gradient = bool(re.search(r'gradient|linear-gradient|radial-gradient', content))
-            has_animation = bool(re.search(r'@keyframes|transition:|animate-', content))
-            has_visual_interest = has_gradient or has_animation
-
-            if not has_visual_interest and not re.search(r'background:|bg-', content):
-                self.warnings.append(f"[Visceral] {filename}: Hero section lacks visual appeal. Consider gradients or subtle animations.")
-
-        # Behavioral: Instant feedback and usability
-        if 'onClick' in content or '@click' in content or 'onclick' in content:
-            has_feedback = re.search(r'transition|animate|hover:|focus:|disabled|loading|spinner', content, re.IGNORECASE)
-            has_state_change = re.search(r'setState|useState|disabled|loading', content)
-
-            if not has_feedback and not has_state_change:
-                self.warnings.append(f"[Behavioral] {filename}: Interactive elements lack immediate feedback. Add hover/focus/disabled states.")
-
-        # Reflective: Brand story, values, identity
-        has_reflective = bool(re.search(r'about|story|mission|values|why we|our journey|testimonials', content, re.IGNORECASE))
-        if has_long_text and not has_reflective:
-            self.warnings.append(f"[Reflective] {filename}: Long-form content without brand story/values. Add 'About' or 'Why We Exist' section.")
-
-        # --- 1.6 TRUST BUILDING (Enhanced) ---
-
-        # Security signals
-        if has_form:
-            security_signals = re.findall(r'ssl|secure|encrypt|lock|padlock|https', content, re.IGNORECASE)
-            if len(security_signals) == 0 and not re.search(r'checkout|payment', content, re.IGNORECASE):
-                self.warnings.append(f"[Trust] {filename}: Form without security indicators. Add 'SSL Secure' or lock icon.")
-
-        # Social proof elements
-        social_proof = re.findall(r'review|testimonial|rating|star|trust|trusted by|customer|logo', content, re.IGNORECASE)
-        if len(social_proof) > 0:
-            self.passed_count += 1
-        else:
-            if has_long_text:
-                self.warnings.append(f"[Trust] {filename}: No social proof detected. Consider adding testimonials, ratings, or 'Trusted by' logos.")
-
-        # Authority indicators
-        has_footer = bool(re.search(r'footer|<footer', content, re.IGNORECASE))
-        if has_footer:
-            authority = re.findall(r'certif|award|media|press|featured|as seen in', content, re.IGNORECASE)
-            if len(authority) == 0:
-                self.warnings.append(f"[Trust] {filename}: Footer lacks authority signals. Add certifications, awards, or media mentions.")
-
-        # --- 1.7 COGNITIVE LOAD MANAGEMENT ---
-
-        # Progressive disclosure
-        if complex_elements > 5:
-            has_progressive = re.search(r'step|wizard|stage|accordion|collapsible|tab|more\.\.\.|advanced|show more', content, re.IGNORECASE)
-            if not has_progressive:
-                self.warnings.append(f"[Cognitive Load] {filename}: Many form elements without progressive disclosure. Consider accordion, tabs, or 'Advanced' toggle.")
-
-        # Visual noise check
-        has_many_colors = len(re.findall(r'#[0-9a-fA-F]{3,6}|rgb|hsl', content)) > 15
-        has_many_borders = len(re.findall(r'border:|border-', content)) > 10
-        if has_many_colors and has_many_borders:
-            self.warnings.append(f"[Cognitive Load] {filename}: High visual noise detected. Many colors and borders increase cognitive load.")
-
-        # Familiar patterns
-        if has_form:
-            has_standard_labels = bool(re.search(r'<label|placeholder|aria-label', content, re.IGNORECASE))
-            if not has_standard_labels:
-                self.issues.append(f"[Cognitive Load] {filename}: Form inputs without labels. Use <label> for accessibility and clarity.")
-
-        # --- 1.8 PERSUASIVE DESIGN (Ethical) ---
-
-        # Smart defaults
-        if has_form:
-            has_defaults = bool(re.search(r'checked|selected|default|value=["\'].*["\']', content))
-            radio_inputs = len(re.findall(r'type=["\']radio', content, re.IGNORECASE))
-            if radio_inputs > 0 and not has_defaults:
-                self.warnings.append(f"[Persuasion] {filename}: Radio buttons without default selection. Pre-select recommended option.")
-
-        # Anchoring (showing original price)
-        if re.search(r'price|pricing|cost|\$\d+', content, re.IGNORECASE):
-            has_anchor = bool(re.search(r'original|was|strike|del|save \d+%', content, re.IGNORECASE))
-            if not has_anchor:
-                self.warnings.append(f"[Persuasion] {filename}: Prices without anchoring. Show original price to frame discount value.")
-
-        # Social proof live indicators
-        has_social = bool(re.search(r'join|subscriber|member|user', content, re.IGNORECASE))
-        if has_social:
-            has_count = bool(re.findall(r'\d+[+kmb]|\d+,\d+', content))
-            if not has_count:
-                self.warnings.append(f"[Persuasion] {filename}: Social proof without specific numbers. Use 'Join 10,000+' format.")
-
-        # Progress indicators
-        if has_form:
-            has_progress = bool(re.search(r'progress|step \d+|complete|%|bar', content, re.IGNORECASE))
-            if complex_elements > 5 and not has_progress:
-                self.warnings.append(f"[Persuasion] {filename}: Long form without progress indicator. Add progress bar or 'Step X of Y'.")
-
-        # --- 2. TYPOGRAPHY SYSTEM (Complete Coverage) ---
-
-        # 2.1 Font Pairing - Too many font families
-        font_families = set()
-        # Check for @font-face, Google Fonts, font-family declarations
-        font_faces = re.findall(r'@font-face\s*\{[^}]*family:\s*["\']?([^;"\'\s}]+)', content, re.IGNORECASE)
-        google_fonts = re.findall(r'fonts\.googleapis\.com[^"\']*family=([^"&]+)', content, re.IGNORECASE)
-        font_family_css = re.findall(r'font-family:\s*([^;]+)', content, re.IGNORECASE)
-
-        for font in font_faces: font_families.add(font.strip().lower())
-        for font in google_fonts:
-            for f in font.replace('+', ' ').split('|'):
-                font_families.add(f.split(':')[0].strip().lower())
-        for family in font_family_css:
-            # Extract first font from stack
-            first_font = family.split(',')[0].strip().strip('"\'')
-
-            if first_font.lower() not in {'sans-serif', 'serif', 'monospace', 'cursive', 'fantasy', 'system-ui', 'inherit', 'arial', 'georgia', 'times new roman', 'courier new', 'verdana', 'helvetica', 'tahoma'}:
-                font_families.add(first_font.lower())
-
-        if len(font_families) > 3:
-            self.issues.append(f"[Typography] {filename}: {len(font_families)} font families detected. Limit to 2-3 for cohesion.")
-
-        # 2.2 Line Length - Character-based width
-        if has_long_text and not re.search(r'max-w-(?:prose|[\[\\]?\d+ch[\]\\]?)|max-width:\s*\d+ch', content):
-            self.warnings.append(f"[Typography] {filename}: No line length constraint (45-75ch). Use max-w-prose or max-w-[65ch].")
-
-        # 2.3 Line Height - Proper leading ratios
-        # Check for text without proper line-height
-        text_elements = len(re.findall(r'<p|<span|<div.*text|<h[1-6]', content, re.IGNORECASE))
-        if text_elements > 0 and not re.search(r'leading-|line-height:', content):
-            self.warnings.append(f"[Typography] {filename}: Text elements found without line-height. Body: 1.4-1.6, Headings: 1.1-1.3")
-
-        # Check for heading-specific line height issues
-        if re.search(r'<h[1-6]|text-(?:xl|2xl|3xl|4xl|5xl|6xl)', content, re.IGNORECASE):
-            # Extract line-height values
-            line_heights = re.findall(r'(?:leading-|line-height:\s*)([\d.]+)', content)
-            for lh in line_heights:
-                if float(lh) > 1.5:
-                    self.warnings.append(f"[Typography] {filename}: Heading has line-height {lh} (>1.3). Headings should be tighter (1.1-1.3).")
-
-        # 2.4 Letter Spacing (Tracking)
-        # Uppercase without tracking
-        if re.search(r'uppercase|text-transform:\s*uppercase', content, re.IGNORECASE):
-            if not re.search(r'tracking-|letter-spacing:', content):
-                self.warnings.append(f"[Typography] {filename}: Uppercase text without tracking. ALL CAPS needs +5-10% spacing.")
-
-        # Large text (display/hero) should have negative tracking
-        if re.search(r'text-(?:4xl|5xl|6xl|7xl|8xl|9xl)|font-size:\s*[3-9]\dpx', content):
-            if not re.search(r'tracking-tight|letter-spacing:\s*-[0-9]', content):
-                self.warnings.append(f"[Typography] {filename}: Large display text without tracking-tight. Big text needs -1% to -4% spacing.")
-
-        # 2.5 Weight and Emphasis - Contrast levels
-        # Check for adjacent weight levels (poor contrast)
-        weights = re.findall(r'font-weight:\s*(\d+)|font-(?:thin|extralight|light|normal|medium|semibold|bold|extrabold|black)|fw-(\d+)', content, re.IGNORECASE)
-        weight_values = []
-        for w in weights:
-            val = w[0] or w[1]
-            if val:
-                # Map named weights to numbers
-                weight_map = {'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500', 'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900'}
-                val = weight_map.get(val.lower(), val)
-                try:
-                    weight_values.append(int(val))
-                except: pass
-
-        # Check for adjacent weights (400/500, 500/600, etc.)
-        for i in range(len(weight_values) - 1):
-            diff = abs(weight_values[i] - weight_values[i+1])
-            if diff == 100:
-                self.warnings.append(f"[Typography] {filename}: Adjacent font weights ({weight_values[i]}/{weight_values[i+1]}). Skip at least 2 levels for contrast.")
-
-        # Too many weight levels
-        unique_weights = set(weight_values)
-        if len(unique_weights) > 4:
-            self.warnings.append(f"[Typography] {filename}: {len(unique_weights)} font weights. Limit to 3-4 per page.")
-
-        # 2.6 Responsive Typography - Fluid sizing with clamp()
-        has_font_sizes = bool(re.search(r'font-size:|text-(?:xs|sm|base|lg|xl|2xl)', content))
-        if has_font_sizes and not re.search(r'clamp\(|responsive:', content):
-            self.warnings.append(f"[Typography] {filename}: Fixed font sizes without clamp(). Consider fluid typography: clamp(MIN, PREFERRED, MAX)")
-
-        # 2.7 Hierarchy - Heading structure
-        headings = re.findall(r'<(h[1-6])', content, re.IGNORECASE)
-        if headings:
-            # Check for skipped levels (h1 -> h3)
-            for i in range(len(headings) - 1):
-                curr = int(headings[i][1])
-                next_h = int(headings[i+1][1])
-                if next_h > curr + 1:
-                    self.warnings.append(f"[Typography] {filename}: Skipped heading level (h{curr} -> h{next_h}). Maintain sequential hierarchy.")
-
-            # Check if h1 exists for main content
-            if 'h1' not in [h.lower() for h in headings] and has_long_text:
-                self.warnings.append(f"[Typography] {filename}: No h1 found. Each page should have one primary heading.")
-
-        # 2.8 Modular Scale - Consistent sizing
-        # Extract font-size values
-        font_sizes = re.findall(r'font-size:\s*(\d+(?:\.\d+)?)(px|rem|em)', content)
-        size_values = []
-        for size, unit in font_sizes:
-            if unit == 'rem' or unit == 'em':
-                size_values.append(float(size))
-            elif unit == 'px':
-                size_values.append(float(size) / 16)  # Normalize to rem
-
-        if len(size_values) > 2:
-            # Check if sizes follow a modular scale roughly
-            sorted_sizes = sorted(set(size_values))
-            ratios = []
-            for i in range(1, len(sorted_sizes)):
-                if sorted_sizes[i-1] > 0:
-                    ratios.append(sorted_sizes[i] / sorted_sizes[i-1])
-
-            # Common scale ratios: 1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618
-            common_ratios = {1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618}
-            for ratio in ratios[:3]:  # Check first 3 ratios
-                if not any(abs(ratio - cr) < 0.05 for cr in common_ratios):
-                    self.warnings.append(f"[Typography] {filename}: Font sizes may not follow modular scale (ratio: {ratio:.2f}). Consider consistent ratio like 1.25 (Major Third).")
-                    break
-
-        # 2.9 Readability - Content chunking
-        # Check for very long paragraphs (>5 lines estimated)
-        paragraphs = re.findall(r'<p[^>]*>([^<]+)</p>', content, re.IGNORECASE)
-        for p in paragraphs:
-            word_count = len(p.split())
-            if word_count > 100:  # ~5-6 lines
-                self.warnings.append(f"[Typography] {filename}: Long paragraph detected ({word_count} words). Break into 3-4 line chunks for readability.")
-
-        # Check for missing subheadings in long content
-        if len(paragraphs) > 5:
-            subheadings = len(re.findall(r'<h[2-6]', content, re.IGNORECASE))
-            if subheadings == 0:
-                self.warnings.append(f"[Typography] {filename}: Long content without subheadings. Add h2/h3 to break up text.")
-
-        # --- 3. VISUAL EFFECTS (visual-effects.md) ---
-        
-        # Glassmorphism Check
-        if 'backdrop-filter' in content or 'blur(' in content:
-            if not re.search(r'background:\s*rgba|bg-opacity|bg-[a-z0-9]+\/\d+', content):
-                self.warnings.append(f"[Visual] {filename}: Blur used without semi-transparent background (Glassmorphism fail)")
-        
-        # GPU Acceleration / Performance
-        if re.search(r'@keyframes|transition:', content):
-            expensive_props = re.findall(r'width|height|top|left|right|bottom|margin|padding', content)
-            if expensive_props:
-                self.warnings.append(f"[Performance] {filename}: Animating expensive properties ({', '.join(set(expensive_props))}). Use transform/opacity where possible.")
-            
-            # Reduced Motion
-            if not re.search(r'prefers-reduced-motion', content):
-                self.warnings.append(f"[Accessibility] {filename}: Animations found without prefers-reduced-motion check")
-
-        # Natural Shadows
-        shadows = re.findall(r'box-shadow:\s*([^;]+)', content)
-        for shadow in shadows:
-            # Check if natural (Y > X) or multiple layers
-            if ',' not in shadow and not re.search(r'\d+px\s+[1-9]\d*px', shadow): # Simple heuristic for Y-offset
-                 self.warnings.append(f"[Visual] {filename}: Simple/Unnatural shadow detected. Consider multiple layers or Y > X offset for realism.")
-
-        # --- 3.1 NEOMORPHISM CHECK ---
-        # Check for neomorphism patterns (dual shadows with opposite directions)
-        neo_shadows = re.findall(r'box-shadow:\s*([^;]+)', content)
-        for shadow in neo_shadows:
-            # Neomorphism has two shadows: positive offset + negative offset
-            if ',' in shadow and '-' in shadow:
-                # Check for inset pattern (pressed state)
-                if 'inset' in shadow:
-                    self.warnings.append(f"[Visual] {filename}: Neomorphism inset detected. Ensure adequate contrast for accessibility.")
-
-        # --- 3.2 SHADOW HIERARCHY ---
-        # Count shadow levels to check for elevation consistency
-        shadow_count = len(shadows)
-        if shadow_count > 0:
-            # Check for shadow opacity levels (should indicate hierarchy)
-            opacities = re.findall(r'rgba?\([^)]+,\s*([\d.]+)\)', content)
-            shadow_opacities = [float(o) for o in opacities if float(o) < 0.5]
-            if shadow_count >= 3 and len(shadow_opacities) > 0:
-                # Check if there's variety in shadow opacities for different elevations
-                unique_opacities = len(set(shadow_opacities))
-                if unique_opacities < 2:
-                    self.warnings.append(f"[Visual] {filename}: All shadows at same opacity level. Vary shadow intensity for elevation hierarchy.")
-
-        # --- 3.3 GRADIENT CHECKS ---
-        # Check for gradient usage
-        has_gradient = bool(re.search(r'gradient|linear-gradient|radial-gradient|conic-gradient', content))
-        if has_gradient:
-            # Warn about mesh/aurora gradients (can be overused)
-            gradient_count = len(re.findall(r'gradient', content, re.IGNORECASE))
-            if gradient_count > 5:
-                self.warnings.append(f"[Visual] {filename}: Many gradients detected ({gradient_count}). Ensure this serves purpose, not decoration.")
-        else:
-            # Check if hero section exists without gradient
-            if has_hero and not re.search(r'background:|bg-', content):
-                self.warnings.append(f"[Visual] {filename}: Hero section without visual interest. Consider gradient for depth.")
-
-        # --- 3.4 BORDER EFFECTS ---
-        # Check for gradient borders or animated borders
-        has_border = bool(re.search(r'border:|border-', content))
-        if has_border:
-            # Check for overly complex borders
-            border_count = len(re.findall(r'border:', content))
-            if border_count > 8:
-                self.warnings.append(f"[Visual] {filename}: Many border declarations ({border_count}). Simplify for cleaner look.")
-
-        # --- 3.5 GLOW EFFECTS ---
-        # Check for text-shadow or multiple box-shadow layers (glow effects)
-        text_shadows = re.findall(r'text-shadow:', content)
-        for ts in text_shadows:
-            # Multiple text-shadow layers indicate glow
-            if ',' in ts:
-                self.warnings.append(f"[Visual] {filename}: Text glow effect detected. Ensure readability is maintained.")
-
-        # Check for box-shadow glow (multiple layers with 0 offset)
-        glow_shadows = re.findall(r'box-shadow:\s*[^;]*0\s+0\s+', content)
-        if len(glow_shadows) > 2:
-            self.warnings.append(f"[Visual] {filename}: Multiple glow effects detected. Use sparingly for emphasis only.")
-
-        # --- 3.6 OVERLAY TECHNIQUES ---
-        # Check for image overlays (for readability)
-        has_images = bool(re.search(r'<img|background-image:|bg-\[url', content))
-        if has_images and has_long_text:
-            has_overlay = bool(re.search(r'overlay|rgba\(0|gradient.*transparent|::after|::before', content))
-            if not has_overlay:
-                self.warnings.append(f"[Visual] {filename}: Text over image without overlay. Add gradient overlay for readability.")
-
-        # --- 3.7 PERFORMANCE: will-change ---
-        # Check for will-change usage
-        if re.search(r'will-change:', content):
-            will_change_props = re.findall(r'will-change:\s*([^;]+)', content)
-            for prop in will_change_props:
-                prop = prop.strip().lower()
-                if prop in ['width', 'height', 'top', 'left', 'right', 'bottom', 'margin', 'padding']:
-                    self.issues.append(f"[Performance] {filename}: will-change on '{prop}' (layout property). Use only for transform/opacity.")
-
-        # Check for excessive will-change usage
-        will_change_count = len(re.findall(r'will-change:', content))
-        if will_change_count > 3:
-            self.warnings.append(f"[Performance] {filename}: Many will-change declarations ({will_change_count}). Use sparingly, only for heavy animations.")
-
-        # --- 3.8 EFFECT SELECTION ---
-        # Check for effect overuse (too many visual effects)
-        effect_count = (
-            (1 if has_gradient else 0) +
-            shadow_count +
-            len(re.findall(r'backdrop-filter|blur\(', content)) +
-            len(re.findall(r'text-shadow:', content))
-        )
-        if effect_count > 10:
-            self.warnings.append(f"[Visual] {filename}: Many visual effects ({effect_count}). Ensure effects serve purpose, not decoration.")
-
-        # Check for static/flat design (no depth)
-        if has_long_text and effect_count == 0:
-            self.warnings.append(f"[Visual] {filename}: Flat design with no depth. Consider shadows or subtle gradients for hierarchy.")
-
-        # --- 4. COLOR SYSTEM (color-system.md) ---
-
-        # 4.1 PURPLE BAN - Critical check from color-system.md
-        purple_hexes = ['#8B5CF6', '#A855F7', '#9333EA', '#7C3AED', '#6D28D9',
-                        '#8B5CF6', '#A78BFA', '#C4B5FD', '#DDD6FE', '#EDE9FE',
-                        '#8b5cf6', '#a855f7', '#9333ea', '#7c3aed', '#6d28d9',
-                        'purple', 'violet', 'fuchsia', 'magenta', 'lavender']
-        for purple in purple_hexes:
-            if purple.lower() in content.lower():
-                self.issues.append(f"[Color] {filename}: PURPLE DETECTED ('{purple}'). Banned by Maestro rules. Use Teal/Cyan/Emerald instead.")
-                break
-
-        # 4.2 60-30-10 Rule check
-        # Count color usage to estimate ratio
-        color_hex_count = len(re.findall(r'#[0-9a-fA-F]{3,6}', content))
-        hsl_count = len(re.findall(r'hsl\(', content))
-        total_colors = color_hex_count + hsl_count
-        if total_colors > 3:
-            # Check for dominant colors (should be ~60%)
-            bg_declarations = re.findall(r'(?:background|bg-|bg\[)([^;}\s]+)', content)
-            text_declarations = re.findall(r'(?:color|text-)([^;}\s]+)', content)
-            if len(bg_declarations) > 0 and len(text_declarations) > 0:
-                # Just warn if too many distinct colors
-                unique_hexes = set(re.findall(r'#[0-9a-fA-F]{6}', content))
-                if len(unique_hexes) > 5:
-                    self.warnings.append(f"[Color] {filename}: {len(unique_hexes)} distinct colors. Consider 60-30-10 rule: dominant (60%), secondary (30%), accent (10%).")
-
-        # 4.3 Color Scheme Pattern Detection
-        # Detect monochromatic (same hue, different lightness)
-        hsl_matches = re.findall(r'hsl\((\d+),\s*\d+%,\s*\d+%\)', content)
-        if len(hsl_matches) >= 3:
-            hues = [int(h) for h in hsl_matches]
-            hue_range = max(hues) - min(hues)
-            if hue_range < 10:
-                self.warnings.append(f"[Color] {filename}: Monochromatic palette detected (hue variance: {hue_range}deg). Ensure adequate contrast.")
-
-        # 4.4 Dark Mode Compliance
-        # Check for pure black (#000000) or pure white (#FFFFFF) text (forbidden)
-        if re.search(r'color:\s*#000000|#000\b', content):
-            self.warnings.append(f"[Color] {filename}: Pure black (#000000) detected. Use #1a1a1a or darker grays for better dark mode.")
-        if re.search(r'background:\s*#ffffff|#fff\b', content) and re.search(r'dark:\s*|dark:', content):
-            self.warnings.append(f"[Color] {filename}: Pure white background in dark mode context. Use slight off-white (#f9fafb) for reduced eye strain.")
-
-        # 4.5 WCAG Contrast Pattern Check
-        # Look for potential low-contrast combinations
-        light_bg_light_text = bool(re.search(r'bg-(?:gray|slate|zinc)-50|bg-white.*text-(?:gray|slate)-[12]', content))
-        dark_bg_dark_text = bool(re.search(r'bg-(?:gray|slate|zinct)-9|bg-black.*text-(?:gray|slate)-[89]', content))
-        if light_bg_light_text or dark_bg_dark_text:
-            self.warnings.append(f"[Color] {filename}: Possible low-contrast combination detected. Verify WCAG AA (4.5:1 for text).")
-
-        # 4.6 Color Psychology Context Check
-        # Warn if blue used for food/restaurant context
-        has_blue = bool(re.search(r'bg-blue|text-blue|from-blue|#[0-9a-fA-F]*00[0-9A-Fa-f]{2}|#[0-9a-fA-F]*1[0-9A-Fa-f]{2}', content))
-        has_food_context = bool(re.search(r'restaurant|food|cooking|recipe|menu|dish|meal', content, re.IGNORECASE))
-        if has_blue and has_food_context:
-            self.warnings.append(f"[Color] {filename}: Blue color in food context. Blue suppresses appetite; consider warm colors (red, orange, yellow).")
-
-        # 4.7 HSL-Based Palette Detection
-        # Check if using HSL for palette (recommended in color-system.md)
-        has_color_vars = bool(re.search(r'--color-|color-|primary-|secondary-', content))
-        if has_color_vars and not re.search(r'hsl\(', content):
-            self.warnings.append(f"[Color] {filename}: Color variables without HSL. Consider HSL for easier palette adjustment (Hue, Saturation, Lightness).")
-
-        # --- 5. ANIMATION GUIDE (animation-guide.md) ---
-
-        # 5.1 Duration Appropriateness
-        # Check for excessively long or short animations
-        durations = re.findall(r'(?:duration|animation-duration|transition-duration):\s*([\d.]+)(s|ms)', content)
-        for duration, unit in durations:
-            duration_ms = float(duration) * (1000 if unit == 's' else 1)
-            if duration_ms < 50:
-                self.warnings.append(f"[Animation] {filename}: Very fast animation ({duration}{unit}). Minimum 50ms for visibility.")
-            elif duration_ms > 1000 and 'transition' in content.lower():
-                self.warnings.append(f"[Animation] {filename}: Long transition ({duration}{unit}). Transitions should be 100-300ms for responsiveness.")
-
-        # 5.2 Easing Function Correctness
-        # Check for incorrect easing patterns
-        if re.search(r'ease-in\s+.*entry|fade-in.*ease-in', content):
-            self.warnings.append(f"[Animation] {filename}: Entry animation with ease-in. Entry should use ease-out for snappy feel.")
-        if re.search(r'ease-out\s+.*exit|fade-out.*ease-out', content):
-            self.warnings.append(f"[Animation] {filename}: Exit animation with ease-out. Exit should use ease-in for natural feel.")
-
-        # 5.3 Micro-interaction Feedback Patterns
-        # Check for interactive elements without hover/focus states
-        interactive_elements = len(re.findall(r'<button|<a\s+href|onClick|@click', content))
-        has_hover_focus = bool(re.search(r'hover:|focus:|:hover|:focus', content))
-        if interactive_elements > 2 and not has_hover_focus:
-            self.warnings.append(f"[Animation] {filename}: Interactive elements without hover/focus states. Add micro-interactions for feedback.")
-
-        # 5.4 Loading State Indicators
-        # Check for loading patterns
-        has_async = bool(re.search(r'async|await|fetch|axios|loading|isLoading', content))
-        has_loading_indicator = bool(re.search(r'skeleton|spinner|progress|loading|<circle.*animate', content))
-        if has_async and not has_loading_indicator:
-            self.warnings.append(f"[Animation] {filename}: Async operations without loading indicator. Add skeleton or spinner for perceived performance.")
-
-        # 5.5 Page Transition Patterns
-        # Check for page/view transitions
-        has_routing = bool(re.search(r'router|navigate|Link.*to|useHistory', content))
-        has_page_transition = bool(re.search(r'AnimatePresence|motion\.|transition.*page|fade.*route', content))
-        if has_routing and not has_page_transition:
-            self.warnings.append(f"[Animation] {filename}: Routing detected without page transitions. Consider fade/slide for context continuity.")
-
-        # 5.6 Scroll Animation Performance
-        # Check for scroll-driven animations
-        has_scroll_anim = bool(re.search(r'onScroll|scroll.*trigger|IntersectionObserver', content))
-        if has_scroll_anim:
-            # Check if using expensive properties in scroll handlers
-            if re.search(r'onScroll.*[^\w](width|height|top|left)', content):
-                self.issues.append(f"[Animation] {filename}: Scroll handler animating layout properties. Use transform/opacity for 60fps.")
-
-        # --- 6. MOTION GRAPHICS (motion-graphics.md) ---
-
-        # 6.1 Lottie Animation Checks
-        has_lottie = bool(re.search(r'lottie|Lottie|@lottie-react', content))
-        if has_lottie:
-            # Check for reduced motion fallback
-            has_lottie_fallback = bool(re.search(r'prefers-reduced-motion.*lottie|lottie.*isPaused|lottie.*stop', content))
-            if not has_lottie_fallback:
-                self.warnings.append(f"[Motion] {filename}: Lottie animation without reduced-motion fallback. Add pause/stop for accessibility.")
-
-        # 6.2 GSAP Memory Leak Risks
-        has_gsap = bool(re.search(r'gsap|ScrollTrigger|from\(.*gsap', content))
-        if has_gsap:
-            # Check for cleanup patterns
-            has_gsap_cleanup = bool(re.search(r'kill\(|revert\(|useEffect.*return.*gsap', content))
-            if not has_gsap_cleanup:
-                self.issues.append(f"[Motion] {filename}: GSAP animation without cleanup (kill/revert). Memory leak risk on unmount.")
-
-        # 6.3 SVG Animation Performance
-        svg_animations = re.findall(r'<animate|<animateTransform|stroke-dasharray|stroke-dashoffset', content)
-        if len(svg_animations) > 3:
-            self.warnings.append(f"[Motion] {filename}: Multiple SVG animations detected. Ensure stroke-dashoffset is used sparingly for mobile performance.")
-
-        # 6.4 3D Transform Performance
-        has_3d_transform = bool(re.search(r'transform3d|perspective\(|rotate3d|translate3d', content))
-        if has_3d_transform:
-            # Check for perspective on parent
-            has_perspective_parent = bool(re.search(r'perspective:\s*\d+px|perspective\s*\(', content))
-            if not has_perspective_parent:
-                self.warnings.append(f"[Motion] {filename}: 3D transform without perspective parent. Add perspective: 1000px for realistic depth.")
-
-            # Warn about mobile performance
-            self.warnings.append(f"[Motion] {filename}: 3D transforms detected. Test on mobile; can impact performance on low-end devices.")
-
-        # 6.5 Particle Effect Warnings
-        # Check for canvas/WebGL particle systems
-        has_particles = bool(re.search(r'particle|canvas.*loop|requestAnimationFrame.*draw|Three\.js', content))
-        if has_particles:
-            self.warnings.append(f"[Motion] {filename}: Particle effects detected. Ensure fallback or reduced-quality option for mobile devices.")
-
-        # 6.6 Scroll-Driven Animation Performance
-        has_scroll_driven = bool(re.search(r'IntersectionObserver.*animate|scroll.*progress|view-timeline', content))
-        if has_scroll_driven:
-            # Check for throttling/debouncing
-            has_throttle = bool(re.search(r'throttle|debounce|requestAnimationFrame', content))
-            if not has_throttle:
-                self.issues.append(f"[Motion] {filename}: Scroll-driven animation without throttling. Add requestAnimationFrame for 60fps.")
-
-        # 6.7 Motion Decision Tree - Context Check
-        # Check if animation serves purpose (not just decoration)
-        total_animations = (
-            len(re.findall(r'@keyframes|transition:|animate-', content)) +
-            (1 if has_lottie else 0) +
-            (1 if has_gsap else 0)
-        )
-        if total_animations > 5:
-            # Check if animations are functional
-            functional_animations = len(re.findall(r'hover:|focus:|disabled|loading|error|success', content))
-            if functional_animations < total_animations / 2:
-                self.warnings.append(f"[Motion] {filename}: Many animations ({total_animations}). Ensure majority serve functional purpose (feedback, guidance), not decoration.")
-
-        # --- 7. ACCESSIBILITY ---
-        if re.search(r'<img(?![^>]*alt=)[^>]*>', content):
-            self.issues.append(f"[Accessibility] {filename}: Missing img alt text")
+        for rule in RULES:
+            for values in rule.matches(facts):
+                if rule.severity == PASS:
+                    self.passed_count += 1
+                elif rule.severity == ISSUE:
+                    self.issues.append(rule.message.format(file=filename, **values))
+                else:
+                    self.warnings.append(rule.message.format(file=filename, **values))
 
     def audit_directory(self, directory: str) -> None:
-        extensions = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+        for report in scan(directory, CHECKERS)["ux"].results:
+            self.merge(report)
+
+    def merge(self, report: dict) -> None:
+        """Fold another auditor's report (e.g. from a worker process) into this one."""
+        self.files_checked += report["files_checked"]
+        self.issues.extend(report["issues"])
+        self.warnings.extend(report["warnings"])
+        self.passed_count += report["passed_checks"]
 
     def get_report(self):
         return {
@@ -688,6 +774,38 @@ class UXAuditor:
             "compliant": len(self.issues) == 0
         }
 
+def check_file(rel_path: str, content: str) -> dict:
+    """Scan engine entry point: audit one file's content with a fresh auditor."""
+    auditor = UXAuditor()
+    auditor.audit_content(rel_path, content)
+    return auditor.get_report()
+
+
+CHECKERS = [Checker("ux", check_file, UXAuditor.EXTENSIONS, skip_dirs=UXAuditor.SKIP_DIRS, version=FACTS_VERSION)]
+
+
+def collect(project_path: str, results: dict) -> dict:
+    """Build the report from a scan that included CHECKERS."""
+    auditor = UXAuditor()
+    for report in results["ux"].results:
+        auditor.merge(report)
+    report = auditor.get_report()
+    report["passed"] = report["compliant"]
+    return report
+
+
+def run(project_path, url=None, options=None) -> Result:
+    """check_runner entry point: scan and summarize in-process."""
+    project_path = str(Path(project_path).resolve())
+    results = scan(project_path, CHECKERS, **scan_options(options))
+    report = collect(project_path, results)
+    findings = []
+    for rel, file_report in results["ux"].items():
+        findings += [finding("high", issue, rel) for issue in file_report["issues"]]
+        findings += [finding("medium", warning, rel) for warning in file_report["warnings"]]
+    return Result(report["passed"], report, findings=findings).add_scan(results)
+
+
 def main():
     if len(sys.argv) < 2: sys.exit(1)
     
@@ -28,6 +28,10 @@ try:
 except AttributeError:
     pass
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from scan_engine import Checker, find_files, scan, scan_options
+from check_runner import Result, finding
+
 
 # Directories to skip (not public content)
 SKIP_DIRS = {
@@ -78,22 +82,12 @@ def is_page_file(file_path: Path) -> bool:
     return False
 
 
+EXTENSIONS = ['.html', '.htm', '.jsx', '.tsx']  # In glob priority order
+
+
 def find_web_pages(project_path: Path) -> list:
     """Find public-facing web pages only."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
-    
-    files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
-    
-    return files[:30]  # Limit to 30 pages
+    return find_files(project_path, CHECKERS[0])
 
 
 def check_page(file_path: Path) -> dict:
@@ -102,7 +96,11 @@ def check_page(file_path: Path) -> dict:
         content = file_path.read_text(encoding='utf-8', errors='ignore')
     except Exception as e:
         return {'file': str(file_path.name), 'passed': [], 'issues': [f"Error: {e}"], 'score': 0}
-    
+    return check_content(str(file_path), content)
+
+
+def check_content(rel_path: str, content: str) -> dict:
+    """Check already-read page content for GEO elements."""
     issues = []
     passed = []
     
@@ -212,13 +210,53 @@ def check_page(file_path: Path) -> dict:
     score = (len(passed) / total * 100) if total > 0 else 0
     
     return {
-        'file': str(file_path.name),
+        'file': Path(rel_path).name,
         'passed': passed,
         'issues': issues,
         'score': round(score)
     }
 
 
+CHECKERS = [Checker("geo", check_content, EXTENSIONS, skip_dirs=SKIP_DIRS, accept=is_page_file, limit=30)]
+
+
+def page_results(results: dict) -> list:
+    """Per-page results from a scan, unreadable pages scoring zero."""
+    result = results["geo"]
+    return list(result.results) + [
+        {'file': Path(rel).name, 'passed': [], 'issues': [f"Error: {error}"], 'score': 0}
+        for rel, error in result.errors
+    ]
+
+
+def collect(project_path: str, results: dict) -> dict:
+    """Build the JSON summary from a scan that included CHECKERS."""
+    pages = page_results(results)
+    if not pages:
+        return {"script": "geo_checker", "pages_found": 0, "passed": True}
+    
+    avg_score = sum(r['score'] for r in pages) / len(pages)
+    return {
+        "script": "geo_checker",
+        "project": project_path,
+        "pages_checked": len(pages),
+        "average_score": round(avg_score),
+        "passed": avg_score >= 60
+    }
+
+
+def run(project_path, url=None, options=None) -> Result:
+    """check_runner entry point: scan and summarize in-process."""
+    project_path = str(Path(project_path).resolve())
+    results = scan(project_path, CHECKERS, **scan_options(options))
+    report = collect(project_path, results)
+    result = results["geo"]
+    # The verdict is the average score, so single-page issues are not fatal
+    findings = [finding("medium", issue, rel) for rel, page in result.items() for issue in page["issues"]]
+    findings += [finding("info", f"Error: {error}", rel) for rel, error in result.errors]
+    return Result(report["passed"], report, findings=findings).add_scan(results)
+
+
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
     target_path = Path(target).resolve()
@@ -229,24 +267,19 @@ def main():
     print(f"Project: {target_path}")
     print("-" * 60)
     
-    # Find web pages only
-    pages = find_web_pages(target_path)
+    # Scan web pages only
+    results = scan(target_path, CHECKERS)
+    output = collect(str(target_path), results)
     
-    if not pages:
+    if not output.get("pages_checked"):
         print("\n[!] No public web pages found.")
         print("    Looking for: HTML, JSX, TSX files in pages/app directories")
         print("    Skipping: docs, tests, config files, node_modules")
-        output = {"script": "geo_checker", "pages_found": 0, "passed": True}
         print("\n" + json.dumps(output, indent=2))
         sys.exit(0)
     
-    print(f"Found {len(pages)} public pages to analyze\n")
-    
-    # Check each page
-    results = []
-    for page in pages:
-        result = check_page(page)
-        results.append(result)
+    print(f"Found {output['pages_checked']} public pages to analyze\n")
+    results = page_results(results)
     
     # Print results
     for result in results:
@@ -273,16 +306,9 @@ def main():
         print("[X] Poor - Content needs GEO optimization")
     
     # JSON output
-    output = {
-        "script": "geo_checker",
-        "project": str(target_path),
-        "pages_checked": len(results),
-        "average_score": round(avg_score),
-        "passed": avg_score >= 60
-    }
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if avg_score >= 60 else 1)
+    sys.exit(0 if output["passed"] else 1)
 
 
 if __name__ == "__main__":
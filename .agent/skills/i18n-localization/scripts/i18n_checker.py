@@ -15,6 +15,10 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from scan_engine import Checker, scan, scan_options
+from check_runner import Result, finding, marked_severity
+
 # Patterns that indicate hardcoded strings (should be translated)
 HARDCODED_PATTERNS = {
     'jsx': [
@@ -128,61 +132,52 @@ def flatten_keys(d, prefix=''):
             keys.add(new_key)
     return keys
 
-def check_hardcoded_strings(project_path: Path) -> dict:
-    """Check for hardcoded strings in code files."""
-    issues = []
-    passed = []
+# Code files checked for hardcoded strings, by pattern family
+CODE_EXTENSIONS = {
+    '.tsx': 'jsx', '.jsx': 'jsx', '.ts': 'jsx', '.js': 'jsx',
+    '.vue': 'vue',
+    '.py': 'python'
+}
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', 'venv'}
+SKIP_SUBSTRINGS = ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec']
+
+def is_source_file(rel_path: Path) -> bool:
+    """Skip build output, dependencies and test files."""
+    return not any(x in str(rel_path) for x in SKIP_SUBSTRINGS)
+
+def check_file(rel_path: str, content: str) -> dict:
+    """Check one code file: does it use i18n, and which hardcoded strings remain."""
+    file_type = CODE_EXTENSIONS.get(Path(rel_path).suffix.lower(), 'jsx')
     
-    # Find code files
-    extensions = {
-        '.tsx': 'jsx', '.jsx': 'jsx', '.ts': 'jsx', '.js': 'jsx',
-        '.vue': 'vue',
-        '.py': 'python'
-    }
+    # Check for i18n usage
+    has_i18n = any(re.search(p, content) for p in I18N_PATTERNS)
     
-    code_files = []
-    for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
+    # Check for hardcoded strings
+    examples = []
+    if not has_i18n:
+        for pattern in HARDCODED_PATTERNS.get(file_type, []):
+            matches = re.findall(pattern, content)
+            if matches:
+                examples.append(f"{Path(rel_path).name}: {str(matches[0])[:40]}...")
     
-    code_files = [f for f in code_files if not any(x in str(f) for x in 
-                  ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
+    return {'i18n': has_i18n, 'hardcoded': examples}
+
+CHECKERS = [Checker("i18n", check_file, CODE_EXTENSIONS, skip_dirs=SKIP_DIRS, accept=is_source_file, limit=50)]
+
+def summarize_hardcoded(results: dict) -> dict:
+    """Turn per-file results from a scan into the code-analysis report."""
+    issues = []
+    passed = []
     
-    if not code_files:
+    result = results["i18n"]
+    if not result.matched:
         return {'passed': ["[!] No code files found"], 'issues': []}
     
-    files_with_i18n = 0
-    files_with_hardcoded = 0
-    hardcoded_examples = []
+    files_with_i18n = sum(1 for r in result.results if r['i18n'])
+    files_with_hardcoded = sum(1 for r in result.results if r['hardcoded'])
+    hardcoded_examples = [ex for r in result.results for ex in r['hardcoded']][:5]
     
-    for file_path in code_files[:50]:  # Limit
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            ext = file_path.suffix
-            file_type = extensions.get(ext, 'jsx')
-            
-            # Check for i18n usage
-            has_i18n = any(re.search(p, content) for p in I18N_PATTERNS)
-            if has_i18n:
-                files_with_i18n += 1
-            
-            # Check for hardcoded strings
-            patterns = HARDCODED_PATTERNS.get(file_type, [])
-            hardcoded_found = False
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, content)
-                if matches and not has_i18n:
-                    hardcoded_found = True
-                    if len(hardcoded_examples) < 5:
-                        hardcoded_examples.append(f"{file_path.name}: {str(matches[0])[:40]}...")
-            
-            if hardcoded_found:
-                files_with_hardcoded += 1
-                
-        except:
-            continue
-    
-    passed.append(f"[OK] Analyzed {len(code_files)} code files")
+    passed.append(f"[OK] Analyzed {result.matched} code files")
     
     if files_with_i18n > 0:
         passed.append(f"[OK] {files_with_i18n} files use i18n")
@@ -196,6 +191,36 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     return {'passed': passed, 'issues': issues}
 
+def check_hardcoded_strings(project_path: Path) -> dict:
+    """Check for hardcoded strings in code files."""
+    return summarize_hardcoded(scan(project_path, CHECKERS))
+
+def collect(project_path: str, results: dict) -> dict:
+    """Build the JSON summary from a scan that included CHECKERS."""
+    locale_result = check_locale_completeness(find_locale_files(Path(project_path)))
+    code_result = summarize_hardcoded(results)
+    critical_issues = sum(1 for i in locale_result['issues'] + code_result['issues'] if i.startswith("[X]"))
+    return {
+        "script": "i18n_checker",
+        "project": project_path,
+        "locales": locale_result,
+        "code": code_result,
+        "critical_issues": critical_issues,
+        "passed": critical_issues == 0
+    }
+
+
+def run(project_path, url=None, options=None) -> Result:
+    """check_runner entry point: scan and summarize in-process."""
+    project_path = str(Path(project_path).resolve())
+    results = scan(project_path, CHECKERS, **scan_options(options))
+    report = collect(project_path, results)
+    findings = [finding(marked_severity(issue), issue) for issue in report["locales"]["issues"]]
+    findings += [finding("high", f"Possible hardcoded string: {example.split(': ', 1)[-1]}", rel)
+                 for rel, file_result in results["i18n"].items() for example in file_result["hardcoded"]]
+    return Result(report["passed"], report, findings=findings).add_scan(results)
+
+
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
     project_path = Path(target)
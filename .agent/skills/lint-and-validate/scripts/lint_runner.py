@@ -23,6 +23,9 @@ try:
 except:
     pass
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from check_runner import Cancelled, Result, finding, run_tool
+
 
 def detect_project_type(project_path: Path) -> dict:
     """Detect project type and available linters."""
@@ -67,8 +70,8 @@ def detect_project_type(project_path: Path) -> dict:
     return result
 
 
-def run_linter(linter: dict, cwd: Path) -> dict:
-    """Run a single linter and return results."""
+def run_linter(linter: dict, cwd: Path, options: dict = None) -> dict:
+    """Run a single linter and return results (options: check_runner cancel/deadline)."""
     result = {
         "name": linter["name"],
         "passed": False,
@@ -77,15 +80,7 @@ def run_linter(linter: dict, cwd: Path) -> dict:
     }
     
     try:
-        proc = subprocess.run(
-            linter["cmd"],
-            cwd=str(cwd),
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            timeout=120
-        )
+        proc = run_tool(linter["cmd"], str(cwd), 120, options)
         
         result["output"] = proc.stdout[:2000] if proc.stdout else ""
         result["error"] = proc.stderr[:500] if proc.stderr else ""
@@ -93,14 +88,48 @@ def run_linter(linter: dict, cwd: Path) -> dict:
         
     except FileNotFoundError:
         result["error"] = f"Command not found: {linter['cmd'][0]}"
-    except subprocess.TimeoutExpired:
-        result["error"] = "Timeout after 120s"
+    except subprocess.TimeoutExpired as e:
+        result["error"] = f"Timeout after {e.timeout:.0f}s"
+    except Cancelled:
+        raise
     except Exception as e:
         result["error"] = str(e)
     
     return result
 
 
+def lint_project(project_path: Path, project_info: dict, options: dict = None) -> dict:
+    """Run every detected linter and build the JSON summary."""
+    if not project_info["linters"]:
+        return {
+            "script": "lint_runner",
+            "project": str(project_path),
+            "type": project_info["type"],
+            "checks": [],
+            "passed": True,
+            "message": "No linters configured"
+        }
+    
+    results = [run_linter(linter, project_path, options) for linter in project_info["linters"]]
+    return {
+        "script": "lint_runner",
+        "project": str(project_path),
+        "type": project_info["type"],
+        "checks": results,
+        "passed": all(r["passed"] for r in results)
+    }
+
+
+def run(project_path, url=None, options=None) -> Result:
+    """check_runner entry point."""
+    project_path = Path(project_path).resolve()
+    report = lint_project(project_path, detect_project_type(project_path), options)
+    findings = [finding("high", f"{check['name']} failed: {(check['error'] or check['output'])[:500]}",
+                        rule=check["name"])
+                for check in report["checks"] if not check["passed"]]
+    return Result(report["passed"], report, findings=findings)
+
+
 def main():
     project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
     
@@ -118,33 +147,21 @@ def main():
     
     if not project_info["linters"]:
         print("No linters found for this project type.")
-        output = {
-            "script": "lint_runner",
-            "project": str(project_path),
-            "type": project_info["type"],
-            "checks": [],
-            "passed": True,
-            "message": "No linters configured"
-        }
-        print(json.dumps(output, indent=2))
+        print(json.dumps(lint_project(project_path, project_info), indent=2))
         sys.exit(0)
     
     # Run each linter
-    results = []
-    all_passed = True
+    print(f"\nRunning: {', '.join(l['name'] for l in project_info['linters'])}...")
+    output = lint_project(project_path, project_info)
+    results = output["checks"]
     
-    for linter in project_info["linters"]:
-        print(f"\nRunning: {linter['name']}...")
-        result = run_linter(linter, project_path)
-        results.append(result)
-        
+    for result in results:
         if result["passed"]:
-            print(f"  [PASS] {linter['name']}")
+            print(f"  [PASS] {result['name']}")
         else:
-            print(f"  [FAIL] {linter['name']}")
+            print(f"  [FAIL] {result['name']}")
             if result["error"]:
                 print(f"  Error: {result['error'][:200]}")
-            all_passed = False
     
     # Summary
     print("\n" + "="*60)
@@ -155,17 +172,9 @@ def main():
         icon = "[PASS]" if r["passed"] else "[FAIL]"
         print(f"{icon} {r['name']}")
     
-    output = {
-        "script": "lint_runner",
-        "project": str(project_path),
-        "type": project_info["type"],
-        "checks": results,
-        "passed": all_passed
-    }
-    
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if all_passed else 1)
+    sys.exit(0 if output["passed"] else 1)
 
 
 if __name__ == "__main__":
@@ -15,6 +15,9 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from check_runner import Result, finding, marked_severity
+
 def check_typescript_coverage(project_path: Path) -> dict:
     """Check TypeScript type coverage."""
     issues = []
@@ -125,6 +128,27 @@ def check_python_coverage(project_path: Path) -> dict:
     
     return {'type': 'python', 'files': len(py_files), 'passed': passed, 'issues': issues, 'stats': stats}
 
+def coverage_report(project_path: Path) -> dict:
+    """Run the TypeScript and Python checks that apply and build the summary."""
+    results = [r for r in (check_typescript_coverage(project_path), check_python_coverage(project_path))
+               if r['files'] > 0]
+    critical_issues = sum(1 for r in results for item in r['issues'] if item.startswith("[X]"))
+    return {
+        "script": "type_coverage",
+        "project": str(project_path),
+        "results": results,
+        "critical_issues": critical_issues,
+        "passed": critical_issues == 0
+    }
+
+
+def run(project_path, url=None, options=None) -> Result:
+    """check_runner entry point."""
+    report = coverage_report(Path(project_path))
+    findings = [finding(marked_severity(issue), issue, rule=r['type'])
+                for r in report['results'] for issue in r['issues']]
+    return Result(report["passed"], report, findings=findings)
+
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
     project_path = Path(target)
@@ -133,24 +157,14 @@ def main():
     print("  TYPE COVERAGE CHECKER")
     print("=" * 60 + "\n")
     
-    results = []
-    
-    # Check TypeScript
-    ts_result = check_typescript_coverage(project_path)
-    if ts_result['files'] > 0:
-        results.append(ts_result)
-    
-    # Check Python
-    py_result = check_python_coverage(project_path)
-    if py_result['files'] > 0:
-        results.append(py_result)
+    report = coverage_report(project_path)
+    results = report['results']
     
     if not results:
         print("[!] No TypeScript or Python files found.")
         sys.exit(0)
     
     # Print results
-    critical_issues = 0
     for result in results:
         print(f"\n[{result['type'].upper()}]")
         print("-" * 40)
@@ -158,15 +172,13 @@ def main():
             print(f"  {item}")
         for item in result['issues']:
             print(f"  {item}")
-            if item.startswith("[X]"):
-                critical_issues += 1
     
     print("\n" + "=" * 60)
-    if critical_issues == 0:
+    if report['passed']:
         print("[OK] TYPE COVERAGE: ACCEPTABLE")
         sys.exit(0)
     else:
-        print(f"[X] TYPE COVERAGE: {critical_issues} critical issues")
+        print(f"[X] TYPE COVERAGE: {report['critical_issues']} critical issues")
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -29,6 +29,10 @@ try:
 except:
     pass
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from scan_engine import Checker, find_files, scan, scan_options
+from check_runner import Result, finding
+
 
 # Directories to skip
 SKIP_DIRS = {
@@ -75,32 +79,26 @@ def is_page_file(file_path: Path) -> bool:
     return False
 
 
+EXTENSIONS = ['.html', '.htm', '.jsx', '.tsx']  # In glob priority order
+
+
 def find_pages(project_path: Path) -> list:
     """Find page files to check."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
-    
-    files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
-    
-    return files[:50]  # Limit to 50 files
+    return find_files(project_path, CHECKERS[0])
 
 
 def check_page(file_path: Path) -> dict:
     """Check a single page for SEO issues."""
-    issues = []
-    
     try:
         content = file_path.read_text(encoding='utf-8', errors='ignore')
     except Exception as e:
         return {"file": str(file_path.name), "issues": [f"Error: {e}"]}
+    return check_content(str(file_path), content)
+
+
+def check_content(rel_path: str, content: str) -> dict:
+    """Check already-read page content for SEO issues."""
+    issues = []
     
     # Detect if this is a layout/template file (has Head component)
     is_layout = 'Head>' in content or '<head' in content.lower()
@@ -140,11 +138,53 @@ def check_page(file_path: Path) -> dict:
     # has_canonical = 'rel="canonical"' in content.lower()
     
     return {
-        "file": str(file_path.name),
+        "file": Path(rel_path).name,
         "issues": issues
     }
 
 
+CHECKERS = [Checker("seo", check_content, EXTENSIONS, skip_dirs=SKIP_DIRS, accept=is_page_file, limit=50)]
+
+
+def page_issues(results: dict) -> list:
+    """Per-page results from a scan, keeping only pages with issues."""
+    result = results["seo"]
+    all_issues = [page for page in result.results if page["issues"]]
+    all_issues += [{"file": Path(rel).name, "issues": [f"Error: {error}"]} for rel, error in result.errors]
+    return all_issues
+
+
+def collect(project_path: str, results: dict) -> dict:
+    """Build the JSON summary from a scan that included CHECKERS."""
+    result = results["seo"]
+    files_checked = len(result.files) + len(result.errors)
+    if not files_checked:
+        return {"script": "seo_checker", "files_checked": 0, "passed": True}
+    
+    all_issues = page_issues(results)
+    total_issues = sum(len(item["issues"]) for item in all_issues)
+    
+    return {
+        "script": "seo_checker",
+        "project": project_path,
+        "files_checked": files_checked,
+        "files_with_issues": len(all_issues),
+        "issues_found": total_issues,
+        "passed": total_issues == 0
+    }
+
+
+def run(project_path, url=None, options=None) -> Result:
+    """check_runner entry point: scan and summarize in-process."""
+    project_path = str(Path(project_path).resolve())
+    results = scan(project_path, CHECKERS, **scan_options(options))
+    report = collect(project_path, results)
+    result = results["seo"]
+    findings = [finding("high", issue, rel) for rel, page in result.items() for issue in page["issues"]]
+    findings += [finding("info", f"Error: {error}", rel) for rel, error in result.errors]
+    return Result(report["passed"], report, findings=findings).add_scan(results)
+
+
 def main():
     project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
     
@@ -155,24 +195,18 @@ def main():
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("-"*60)
     
-    # Find pages
-    pages = find_pages(project_path)
+    # Scan pages
+    results = scan(project_path, CHECKERS)
+    output = collect(str(project_path), results)
     
-    if not pages:
+    if not output["files_checked"]:
         print("\n[!] No page files found.")
         print("    Looking for: HTML, JSX, TSX in pages/app/routes directories")
-        output = {"script": "seo_checker", "files_checked": 0, "passed": True}
         print("\n" + json.dumps(output, indent=2))
         sys.exit(0)
     
-    print(f"Found {len(pages)} page files to analyze\n")
-    
-    # Check each page
-    all_issues = []
-    for f in pages:
-        result = check_page(f)
-        if result["issues"]:
-            all_issues.append(result)
+    print(f"Found {output['files_checked']} page files to analyze\n")
+    all_issues = page_issues(results)
     
     # Summary
     print("=" * 60)
@@ -198,21 +232,9 @@ def main():
     else:
         print("\n[OK] No SEO issues found!")
     
-    total_issues = sum(len(item["issues"]) for item in all_issues)
-    passed = total_issues == 0
-    
-    output = {
-        "script": "seo_checker",
-        "project": str(project_path),
-        "files_checked": len(pages),
-        "files_with_issues": len(all_issues),
-        "issues_found": total_issues,
-        "passed": passed
-    }
-    
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if passed else 1)
+    sys.exit(0 if output["passed"] else 1)
 
 
 if __name__ == "__main__":
@@ -23,6 +23,9 @@ try:
 except:
     pass
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from check_runner import Cancelled, Result, finding, run_tool
+
 
 def detect_test_framework(project_path: Path) -> dict:
     """Detect test framework and commands."""
@@ -76,8 +79,8 @@ def detect_test_framework(project_path: Path) -> dict:
     return result
 
 
-def run_tests(cmd: list, cwd: Path) -> dict:
-    """Run tests and return results."""
+def run_tests(cmd: list, cwd: Path, options: dict = None) -> dict:
+    """Run tests and return results (options: check_runner cancel/deadline)."""
     result = {
         "passed": False,
         "output": "",
@@ -88,15 +91,7 @@ def run_tests(cmd: list, cwd: Path) -> dict:
     }
     
     try:
-        proc = subprocess.run(
-            cmd,
-            cwd=str(cwd),
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            timeout=300  # 5 min timeout for tests
-        )
+        proc = run_tool(cmd, str(cwd), 300, options)  # 5 min timeout for tests
         
         result["output"] = proc.stdout[:3000] if proc.stdout else ""
         result["error"] = proc.stderr[:500] if proc.stderr else ""
@@ -129,14 +124,55 @@ def run_tests(cmd: list, cwd: Path) -> dict:
         
     except FileNotFoundError:
         result["error"] = f"Command not found: {cmd[0]}"
-    except subprocess.TimeoutExpired:
-        result["error"] = "Timeout after 300s"
+    except subprocess.TimeoutExpired as e:
+        result["error"] = f"Timeout after {e.timeout:.0f}s"
+    except Cancelled:
+        raise
     except Exception as e:
         result["error"] = str(e)
     
     return result
 
 
+def test_command(test_info: dict, with_coverage: bool) -> list:
+    """The command to run: the coverage variant when asked for and available."""
+    return test_info["coverage_cmd"] if with_coverage and test_info["coverage_cmd"] else test_info["cmd"]
+
+
+def test_report(project_path: Path, test_info: dict, result: dict) -> dict:
+    """The JSON summary for one test run."""
+    return {
+        "script": "test_runner",
+        "project": str(project_path),
+        "type": test_info["type"],
+        "framework": test_info["framework"],
+        "tests_run": result["tests_run"],
+        "tests_passed": result["tests_passed"],
+        "tests_failed": result["tests_failed"],
+        "passed": result["passed"]
+    }
+
+
+def run(project_path, url=None, options=None) -> Result:
+    """check_runner entry point; options["coverage"] enables coverage."""
+    project_path = Path(project_path).resolve()
+    test_info = detect_test_framework(project_path)
+    if not test_info["cmd"]:
+        return Result(True, {"script": "test_runner", "project": str(project_path), "type": test_info["type"],
+                             "framework": None, "passed": True, "message": "No tests configured"})
+    
+    result = run_tests(test_command(test_info, (options or {}).get("coverage", False)), project_path, options)
+    findings = []
+    if result["tests_failed"]:
+        findings.append(finding("high", f"{result['tests_failed']} of {result['tests_run']} tests failed",
+                                rule=test_info["framework"]))
+    elif not result["passed"]:
+        findings.append(finding("high", f"Test run failed: {result['error'][:200] or 'non-zero exit'}",
+                                rule=test_info["framework"]))
+    return Result(result["passed"], test_report(project_path, test_info, result), error=result["error"],
+                  findings=findings)
+
+
 def main():
     project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
     with_coverage = "--coverage" in sys.argv
@@ -168,7 +204,7 @@ def main():
         sys.exit(0)
     
     # Choose command
-    cmd = test_info["coverage_cmd"] if with_coverage and test_info["coverage_cmd"] else test_info["cmd"]
+    cmd = test_command(test_info, with_coverage)
     
     print(f"Running: {' '.join(cmd)}")
     print("-"*60)
@@ -199,16 +235,7 @@ def main():
     if result["tests_run"] > 0:
         print(f"Tests: {result['tests_run']} total, {result['tests_passed']} passed, {result['tests_failed']} failed")
     
-    output = {
-        "script": "test_runner",
-        "project": str(project_path),
-        "type": test_info["type"],
-        "framework": test_info["framework"],
-        "tests_run": result["tests_run"],
-        "tests_passed": result["tests_passed"],
-        "tests_failed": result["tests_failed"],
-        "passed": result["passed"]
-    }
+    output = test_report(project_path, test_info, result)
     
     print("\n" + json.dumps(output, indent=2))
     
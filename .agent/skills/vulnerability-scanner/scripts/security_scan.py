@@ -19,7 +19,7 @@ import sys
 import re
 import argparse
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from datetime import datetime
 
 # Fix Windows console encoding for Unicode output
@@ -29,6 +29,10 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from scan_engine import Checker, ScanResult, scan, scan_options
+from check_runner import Result, finding, run_tool
+
 
 # ============================================================================
 #  CONFIGURATION
@@ -88,13 +92,125 @@ DANGEROUS_PATTERNS = [
 SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv', '.next'}
 CODE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.py', '.go', '.java', '.rb', '.php'}
 CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env', '.env.local', '.env.development'}
+CONFIG_FILES = {'next.config.js', 'webpack.config.js', '.eslintrc.js'}
+
+# This scanner's own pattern tables would match themselves
+SELF_PATH = Path("skills", "vulnerability-scanner", "scripts", "security_scan.py")
+
+CONFIG_ISSUES = [
+    (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
+    (r'debug\s*=\s*True', "Debug mode enabled", "high"),
+    (r'NODE_ENV.*development', "Development mode in config", "medium"),
+    (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
+    (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
+    (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
+]
+
+
+# Literal text every match of a pattern contains (compared case-insensitively).
+# One anchor pass over a file says which patterns can match, and where.
+PATTERN_ANCHORS = {
+    # Secrets
+    "API Key": ("apikey", "api_key", "api-key"),
+    "Token": ("token",),
+    "Bearer Token": ("bearer",),
+    "AWS Access Key": ("akia",),
+    "AWS Secret": ("aws",),
+    "Azure Credential": ("azure",),
+    "GCP Credential": ("google",),
+    "Password": ("password",),
+    "Database Connection String": ("://",),
+    "Private Key": ("-----begin",),
+    "SSH Key": ("ssh-rsa",),
+    "JWT Token": ("eyj",),
+    # Dangerous code
+    "eval() usage": ("eval",),
+    "exec() usage": ("exec",),
+    "Function constructor": ("function",),
+    "child_process.exec": ("child_process.exec",),
+    "subprocess with shell=True": ("subprocess.call",),
+    "dangerouslySetInnerHTML": ("dangerouslysetinnerhtml",),
+    "innerHTML assignment": (".innerhtml",),
+    "document.write": ("document.write",),
+    "SQL String Concat": ("select", "insert", "update", "delete"),
+    "SQL f-string": ('f"',),
+    "SSL Verify Disabled": ("verify",),
+    "Insecure flag": ("--insecure",),
+    "SSL Disabled": ("disable",),
+    "pickle usage": ("pickle.load",),
+    "Unsafe YAML load": ("yaml.load",),
+}
+
+
+# ============================================================================
+#  MATCHERS
+# ============================================================================
+
+class PatternSet:
+    """A pattern table compiled once, with a single-pass anchor prefilter.
+
+    All anchors are joined into one literal alternation, which one scan of
+    the lowercased file reports with offsets. Only the patterns an anchor
+    points at are then run, and line numbers come from those offsets.
+    """
+
+    def __init__(self, table: list):
+        self.entries = table
+        self.regexes = [re.compile(row[0], re.IGNORECASE) for row in table]
+        owners = {}
+        for index, row in enumerate(table):
+            for anchor in PATTERN_ANCHORS[row[1]]:
+                owners.setdefault(anchor, set()).add(index)
+        # The alternation reports one anchor per offset, so a hit also
+        # stands for every shorter anchor that is a prefix of it
+        self.owners = {
+            anchor: sorted(set().union(*(owners[other] for other in owners if anchor.startswith(other))))
+            for anchor in owners
+        }
+        alternation = "|".join(re.escape(a) for a in sorted(owners, key=len, reverse=True))
+        self.anchors = re.compile(alternation)
+        self.anchors_nocase = re.compile(alternation, re.IGNORECASE)
+        self.everything = list(range(len(table)))
+
+    def candidates(self, content: str):
+        """Yield (offset, pattern indexes) for every offset where an anchor starts."""
+        lowered = content.lower()
+        # Lowercasing must keep offsets and every case-insensitive match
+        if len(lowered) == len(content) and (content.isascii() or ('ſ' not in lowered and 'ı' not in lowered)):
+            text, anchors = lowered, self.anchors
+        else:
+            text, anchors = content, self.anchors_nocase
+        search = anchors.search
+        m = search(text)
+        while m:
+            yield m.start(), self.owners.get(m.group().lower(), self.everything)
+            m = search(text, m.start() + 1)
+
+    def present(self, content: str) -> List[int]:
+        """Indexes of the patterns whose anchors occur in content."""
+        found = set()
+        for _, indexes in self.candidates(content):
+            found.update(indexes)
+        return sorted(found)
+
+
+SECRET_MATCHER = PatternSet(SECRET_PATTERNS)
+DANGEROUS_MATCHER = PatternSet(DANGEROUS_PATTERNS)
+CONFIG_REGEXES = [(re.compile(pattern, re.IGNORECASE), issue, severity) for pattern, issue, severity in CONFIG_ISSUES]
+
+
+def line_at(content: str, offset: int) -> tuple:
+    """(1-based line number, line text) for a character offset."""
+    start = content.rfind('\n', 0, offset) + 1
+    end = content.find('\n', offset)
+    return content.count('\n', 0, start) + 1, content[start:end if end != -1 else len(content)]
 
 
 # ============================================================================
 #  SCANNING FUNCTIONS
 # ============================================================================
 
-def scan_dependencies(project_path: str) -> Dict[str, Any]:
+def scan_dependencies(project_path: str, options: Optional[dict] = None) -> Dict[str, Any]:
     """
     Validate supply chain security (OWASP A03).
     Checks: npm audit, lock file presence, dependency age.
@@ -131,13 +247,7 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
     # Run npm audit if applicable
     if (Path(project_path) / "package.json").exists():
         try:
-            result = subprocess.run(
-                ["npm", "audit", "--json"],
-                cwd=project_path,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            result = run_tool(["npm", "audit", "--json"], project_path, 60, options)
             
             try:
                 audit_data = json.loads(result.stdout)
@@ -178,47 +288,37 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_secrets(project_path: str) -> Dict[str, Any]:
-    """
-    Validate no hardcoded secrets (OWASP A04).
-    Checks: API keys, tokens, passwords, cloud credentials.
-    """
+def check_secrets(rel_path: str, content: str) -> List[Dict[str, Any]]:
+    """Find hardcoded secrets in one file's content."""
+    findings = []
+    for index in SECRET_MATCHER.present(content):
+        _, secret_type, severity = SECRET_MATCHER.entries[index]
+        matches = list(SECRET_MATCHER.regexes[index].finditer(content))
+        if matches:
+            findings.append({
+                "file": rel_path,
+                "type": secret_type,
+                "severity": severity,
+                "count": len(matches),
+                "line": line_at(content, matches[0].start())[0]
+            })
+    return findings
+
+
+def secrets_report(scanned: ScanResult) -> Dict[str, Any]:
+    """Summarize secret findings from a scan."""
     results = {
         "tool": "secret_scanner",
         "findings": [],
         "status": "[OK] No secrets detected",
-        "scanned_files": 0,
+        "scanned_files": scanned.matched,
         "by_severity": {"critical": 0, "high": 0, "medium": 0}
     }
     
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS and ext not in CONFIG_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, secret_type, severity in SECRET_PATTERNS:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "type": secret_type,
-                                "severity": severity,
-                                "count": len(matches)
-                            })
-                            results["by_severity"][severity] += len(matches)
-                            
-            except Exception:
-                pass
+    for hits in scanned.results:
+        for hit in hits:
+            results["findings"].append(hit)
+            results["by_severity"][hit["severity"]] += hit["count"]
     
     if results["by_severity"]["critical"] > 0:
         results["status"] = "[!!] CRITICAL: Secrets exposed!"
@@ -233,49 +333,59 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_code_patterns(project_path: str) -> Dict[str, Any]:
+def scan_secrets(project_path: str) -> Dict[str, Any]:
     """
-    Validate dangerous code patterns (OWASP A05).
-    Checks: Injection risks, XSS, unsafe deserialization.
+    Validate no hardcoded secrets (OWASP A04).
+    Checks: API keys, tokens, passwords, cloud credentials.
     """
+    return secrets_report(scan(project_path, [SECRETS_CHECKER])[SECRETS_CHECKER.name])
+
+
+def check_code_patterns(rel_path: str, content: str) -> List[Dict[str, Any]]:
+    """Find dangerous code patterns in one file's content, one finding per line and pattern."""
+    # Group anchor hits by line; offsets arrive in order, so lines are counted incrementally
+    lines = []
+    line_num, line_start, line_end = 1, 0, content.find('\n')
+    for offset, indexes in DANGEROUS_MATCHER.candidates(content):
+        if line_end != -1 and offset > line_end:
+            line_start = content.rfind('\n', line_end, offset) + 1
+            line_num += content.count('\n', line_end, line_start)
+            line_end = content.find('\n', offset)
+        if not lines or lines[-1][0] != line_num:
+            lines.append((line_num, content[line_start:line_end if line_end != -1 else len(content)], set()))
+        lines[-1][2].update(indexes)
+    
+    findings = []
+    for line_num, line, indexes in lines:
+        for index in sorted(indexes):
+            if DANGEROUS_MATCHER.regexes[index].search(line):
+                _, name, severity, category = DANGEROUS_MATCHER.entries[index]
+                findings.append({
+                    "file": rel_path,
+                    "line": line_num,
+                    "pattern": name,
+                    "severity": severity,
+                    "category": category,
+                    "snippet": line.strip()[:80]
+                })
+    return findings
+
+
+def code_patterns_report(scanned: ScanResult) -> Dict[str, Any]:
+    """Summarize dangerous-pattern findings from a scan."""
     results = {
         "tool": "pattern_scanner",
         "findings": [],
         "status": "[OK] No dangerous patterns",
-        "scanned_files": 0,
+        "scanned_files": scanned.matched,
         "by_category": {}
     }
     
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        for pattern, name, severity, category in DANGEROUS_PATTERNS:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                results["findings"].append({
-                                    "file": str(filepath.relative_to(project_path)),
-                                    "line": line_num,
-                                    "pattern": name,
-                                    "severity": severity,
-                                    "category": category,
-                                    "snippet": line.strip()[:80]
-                                })
-                                results["by_category"][category] = results["by_category"].get(category, 0) + 1
-                                
-            except Exception:
-                pass
+    for hits in scanned.results:
+        for hit in hits:
+            results["findings"].append(hit)
+            category = hit["category"]
+            results["by_category"][category] = results["by_category"].get(category, 0) + 1
     
     critical_count = sum(1 for f in results["findings"] if f["severity"] == "critical")
     high_count = sum(1 for f in results["findings"] if f["severity"] == "high")
@@ -293,53 +403,36 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_configuration(project_path: str) -> Dict[str, Any]:
+def scan_code_patterns(project_path: str) -> Dict[str, Any]:
     """
-    Validate security configuration (OWASP A02).
-    Checks: Security headers, CORS, debug modes.
+    Validate dangerous code patterns (OWASP A05).
+    Checks: Injection risks, XSS, unsafe deserialization.
     """
+    return code_patterns_report(scan(project_path, [PATTERNS_CHECKER])[PATTERNS_CHECKER.name])
+
+
+def check_configuration(rel_path: str, content: str) -> List[Dict[str, Any]]:
+    """Find insecure settings in one config file's content."""
+    findings = []
+    for regex, issue, severity in CONFIG_REGEXES:
+        if regex.search(content):
+            findings.append({
+                "file": rel_path,
+                "issue": issue,
+                "severity": severity
+            })
+    return findings
+
+
+def configuration_report(project_path: str, scanned: ScanResult) -> Dict[str, Any]:
+    """Summarize configuration findings from a scan plus project-level checks."""
     results = {
         "tool": "config_scanner",
-        "findings": [],
+        "findings": [hit for hits in scanned.results for hit in hits],
         "status": "[OK] Configuration secure",
         "checks": {}
     }
     
-    # Check common config files for issues
-    config_issues = [
-        (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
-        (r'debug\s*=\s*True', "Debug mode enabled", "high"),
-        (r'NODE_ENV.*development', "Development mode in config", "medium"),
-        (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
-        (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
-        (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
-    ]
-    
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CONFIG_EXTENSIONS and file not in ['next.config.js', 'webpack.config.js', '.eslintrc.js']:
-                continue
-                
-            filepath = Path(root) / file
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, issue, severity in config_issues:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "issue": issue,
-                                "severity": severity
-                            })
-                            
-            except Exception:
-                pass
-    
     # Check for security header configurations
     header_files = ["next.config.js", "next.config.mjs", "middleware.ts", "nginx.conf"]
     for hf in header_files:
@@ -365,12 +458,55 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
     return results
 
 
+def scan_configuration(project_path: str) -> Dict[str, Any]:
+    """
+    Validate security configuration (OWASP A02).
+    Checks: Security headers, CORS, debug modes.
+    """
+    return configuration_report(project_path, scan(project_path, [CONFIG_CHECKER])[CONFIG_CHECKER.name])
+
+
+# ============================================================================
+#  SCAN ENGINE PLUGIN
+# ============================================================================
+
+def is_scannable(rel_path: Path) -> bool:
+    """Everything except this scanner itself."""
+    return rel_path.parts[-len(SELF_PATH.parts):] != SELF_PATH.parts
+
+
+SECRETS_CHECKER = Checker("security:secrets", check_secrets, CODE_EXTENSIONS | CONFIG_EXTENSIONS,
+                          skip_dirs=SKIP_DIRS, accept=is_scannable)
+PATTERNS_CHECKER = Checker("security:patterns", check_code_patterns, CODE_EXTENSIONS, skip_dirs=SKIP_DIRS,
+                           accept=is_scannable)
+CONFIG_CHECKER = Checker("security:config", check_configuration, CONFIG_EXTENSIONS, names=CONFIG_FILES,
+                         skip_dirs=SKIP_DIRS, accept=is_scannable)
+
+# scan type -> (report section, checker or None for project-level scans)
+SCANS = {
+    "deps": ("dependencies", None),
+    "secrets": ("secrets", SECRETS_CHECKER),
+    "patterns": ("code_patterns", PATTERNS_CHECKER),
+    "config": ("configuration", CONFIG_CHECKER),
+}
+
+CHECKERS = [SECRETS_CHECKER, PATTERNS_CHECKER, CONFIG_CHECKER]
+
+
 # ============================================================================
 #  MAIN
 # ============================================================================
 
 def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     """Execute security validation scans."""
+    selected = [key for key in SCANS if scan_type == "all" or scan_type == key]
+    checkers = [SCANS[key][1] for key in selected if SCANS[key][1] is not None]
+    return build_report(project_path, scan_type, scan(project_path, checkers))
+
+
+def build_report(project_path: str, scan_type: str, scanned: Dict[str, ScanResult],
+                 options: Optional[dict] = None) -> Dict[str, Any]:
+    """Assemble the full report from one shared file scan (options: check_runner cancel/deadline)."""
     
     report = {
         "project": project_path,
@@ -386,22 +522,22 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     }
     
     scanners = {
-        "deps": ("dependencies", scan_dependencies),
-        "secrets": ("secrets", scan_secrets),
-        "patterns": ("code_patterns", scan_code_patterns),
-        "config": ("configuration", scan_configuration),
+        "deps": lambda: scan_dependencies(project_path, options),
+        "secrets": lambda: secrets_report(scanned[SECRETS_CHECKER.name]),
+        "patterns": lambda: code_patterns_report(scanned[PATTERNS_CHECKER.name]),
+        "config": lambda: configuration_report(project_path, scanned[CONFIG_CHECKER.name]),
     }
     
-    for key, (name, scanner) in scanners.items():
+    for key, scanner in scanners.items():
         if scan_type == "all" or scan_type == key:
-            result = scanner(project_path)
-            report["scans"][name] = result
+            result = scanner()
+            report["scans"][SCANS[key][0]] = result
             
             findings_count = len(result.get("findings", []))
             report["summary"]["total_findings"] += findings_count
             
-            for finding in result.get("findings", []):
-                sev = finding.get("severity", "low")
+            for item in result.get("findings", []):
+                sev = item.get("severity", "low")
                 if sev == "critical":
                     report["summary"]["critical"] += 1
                 elif sev == "high":
@@ -418,6 +554,30 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     return report
 
 
+def collect(project_path: str, results: Dict[str, ScanResult], options: Optional[dict] = None) -> Dict[str, Any]:
+    """Build the full report from a scan that included CHECKERS."""
+    report = build_report(project_path, "all", results, options)
+    report["passed"] = report["summary"]["critical"] == 0
+    return report
+
+
+def run(project_path, url=None, options=None) -> Result:
+    """check_runner entry point: scan and summarize in-process."""
+    project_path = str(Path(project_path).resolve())
+    results = scan(project_path, CHECKERS, **scan_options(options))
+    report = collect(project_path, results, options)
+    findings = []
+    for scan_result in report["scans"].values():
+        for item in scan_result.get("findings", []):
+            rule = item.get("type") or item.get("pattern")
+            message = item.get("message") or item.get("issue") or rule
+            if item.get("category"):
+                message = f"{message} ({item['category']})"
+            findings.append(finding(item["severity"], message, item.get("file"), item.get("line"), rule))
+    # Like the CLI (which always exits 0), findings are reported, not fatal
+    return Result(True, report, findings=findings).add_scan(results)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate security principles from vulnerability-scanner skill"
@@ -448,8 +608,8 @@ def main():
         
         for scan_name, scan_result in result['scans'].items():
             print(f"\n{scan_name.upper()}: {scan_result['status']}")
-            for finding in scan_result.get('findings', [])[:5]:
-                print(f"  - {finding}")
+            for item in scan_result.get('findings', [])[:5]:
+                print(f"  - {item}")
     else:
         print(json.dumps(result, indent=2))
 